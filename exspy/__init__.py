@@ -1,9 +1,5 @@
-from . import components
-from . import data
-from . import models
-from . import signals
-from .misc import material
-from ._defaults_parser import preferences
+import importlib
+
 from ._version import __version__
 
 
@@ -18,5 +14,29 @@ __all__ = [
 ]
 
 
+# mapping following the pattern: from value import key
+_import_mapping = {
+    "preferences": "._defaults_parser",
+}
+
+# submodules which are not at the top level of the package
+_module_mapping = {
+    "material": ".misc.material",
+}
+
+
 def __dir__():
     return sorted(__all__)
+
+
+def __getattr__(name):
+    # the submodules are imported on first access
+    if name in __all__:
+        if name in _import_mapping.keys():
+            import_path = "exspy" + _import_mapping.get(name)
+            return getattr(importlib.import_module(import_path), name)
+        else:
+            return importlib.import_module(
+                _module_mapping.get(name, "." + name), "exspy"
+            )
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -58,6 +58,24 @@ class EELSConfig(t.HasTraits):
         label="Hartree-Slater GOS directory",
         desc="The GOS files are used to create the EELS edge components",
     )
+    gos_cache_enabled = t.CBool(
+        False,
+        label="Cache cross-sections on disk",
+        desc="If enabled, the cross-sections integrated when setting the "
+        "microscope parameters of the EELS edge components are stored on "
+        "disk and reused for the same edge, GOS and microscope parameters.",
+    )
+    gos_cache_path = t.Directory(
+        Path(config_path, "gos_cache"),
+        label="Cross-section cache directory",
+        desc="The directory where the integrated cross-sections are cached.",
+    )
+    gos_cache_max_size = t.CFloat(
+        100.0,
+        label="Cross-section cache size (MB)",
+        desc="The maximum size of the cross-section cache. The least "
+        "recently used cross-sections are removed when it is exceeded.",
+    )
 
 
 class EDSConfig(t.HasTraits):
@@ -22,9 +22,11 @@ import logging
 import math
 
 import numpy as np
-from scipy.interpolate import splev
+from scipy.interpolate import BSpline, make_interp_spline, splev
 
 from hyperspy.component import Component
+from hyperspy.docstrings.parameters import FUNCTION_ND_DOCSTRING
+from exspy.misc.eels.cross_section_cache import get_cross_section_cache
 from exspy.misc.eels.gosh_gos import GoshGOS, _GOSH_DOI
 from exspy.misc.eels.hartree_slater_gos import HartreeSlaterGOS
 from exspy.misc.eels.hydrogenic_gos import HydrogenicGOS
@@ -156,6 +158,10 @@ class EELSCLEdge(Component):
             ["intensity", "fine_structure_coeff", "effective_angle", "onset_energy"],
             linear_parameter_list=["intensity"],
         )
+        # Cache of the energy regions, cross-section and spline basis
+        # evaluated for each energy axis, see `_get_axis_cache`
+        self._axis_cache = {}
+        self._xsection_version = 0
         if isinstance(element_subshell, dict):
             self.element = element_subshell["element"]
             self.subshell = element_subshell["subshell"]
@@ -183,7 +189,11 @@ class EELSCLEdge(Component):
         self.onset_energy.free = False
         self._position = self.onset_energy
         self.free_onset_energy = False
+        self._onset_shift_table = None
+        self._qint_grad = None
         self.intensity.grad = self.grad_intensity
+        self.onset_energy.grad = self.grad_onset_energy
+        self.fine_structure_coeff.grad = self.grad_fine_structure_coeff
         self.intensity.value = 1
         self.intensity.bmin = 0.0
         self.intensity.bmax = None
@@ -426,12 +436,55 @@ class EELSCLEdge(Component):
             self.energy_scale = energy_scale
             self.E0 = E0
         if self.effective_angle.value != old:
-            self._integrate_GOS()
+            self._integrate_GOS(use_cache=True)
 
-    def _integrate_GOS(self):
+    def _integrate_GOS(self, use_cache=False):
         # Integration over q using splines
+        self._xsection_version += 1
         angle = self.effective_angle.value * 1e-3  # in rad
+        energy_shift = self.onset_energy.value - self.GOS.onset_energy
+        if self._onset_shift_table is not None:
+            table = self._onset_shift_table
+            shifts = table["shifts"]
+            if (
+                table["angle"] != angle
+                or table["E0"] != self.E0
+                or not shifts[0] <= energy_shift <= shifts[-1]
+            ):
+                # The microscope parameters have changed or the onset energy
+                # is out of the grid: recompute the table around it
+                self._set_onset_shift_table(table["width"], table["step"])
+            else:
+                self._interpolate_onset_shift_table(energy_shift)
+            return
+        self._qint_grad = None
+        cache = get_cross_section_cache() if use_cache else None
+        if cache is not None:
+            key = cache.get_key(self.GOS, self.E0, angle, energy_shift)
+            cached = cache.get(key)
+            if cached is not None:
+                self.GOS.energy_shift = energy_shift
+                self.GOS.qint = cached["qint"]
+                self.tab_xsection = BSpline(
+                    cached["knots"], cached["coefficients"], int(cached["degree"])
+                )
+                self._power_law_r = float(cached["power_law_r"])
+                self._power_law_A = float(cached["power_law_A"])
+                return
         self.tab_xsection = self.GOS.integrateq(self.onset_energy.value, angle, self.E0)
+        self._calculate_power_law_extrapolation()
+        if cache is not None:
+            cache.set(
+                key,
+                qint=self.GOS.qint,
+                knots=self.tab_xsection.t,
+                coefficients=self.tab_xsection.c,
+                degree=self.tab_xsection.k,
+                power_law_r=self._power_law_r,
+                power_law_A=self._power_law_A,
+            )
+
+    def _calculate_power_law_extrapolation(self):
         # Calculate extrapolation powerlaw extrapolation parameters
         E1 = self.GOS.energy_axis[-2] + self.GOS.energy_shift
         E2 = self.GOS.energy_axis[-1] + self.GOS.energy_shift
@@ -440,6 +493,94 @@ class EELSCLEdge(Component):
         self._power_law_r = math.log(y2 / y1) / math.log(E1 / E2)
         self._power_law_A = y1 / E1**-self._power_law_r
 
+    def _set_onset_shift_table(self, width=10.0, step=0.5):
+        """Precompute the cross-section over a grid of onset energies.
+
+        While the onset energy stays within the grid, the cross-section is
+        linearly interpolated between the grid points instead of integrating
+        the GOS.
+
+        Parameters
+        ----------
+        width : float
+            The grid covers the onset energies within +/- ``width`` (eV) of
+            the current onset energy.
+        step : float
+            The spacing of the grid in eV.
+
+        Returns
+        -------
+        dict
+            The onset shift table.
+
+        """
+        if step <= 0 or width < step:
+            raise ValueError("`step` must be positive and smaller than `width`.")
+        angle = self.effective_angle.value * 1e-3  # in rad
+        energy_shift = self.onset_energy.value - self.GOS.onset_energy
+        n = int(round(width / step))
+        shifts = energy_shift + step * np.arange(-n, n + 1)
+        qints = np.empty((shifts.size, self.GOS.energy_axis.size))
+        for i, shift in enumerate(shifts):
+            onset_energy = self.GOS.onset_energy + shift
+            xsection = self.GOS.integrateq(onset_energy, angle, self.E0)
+            qints[i] = self.GOS.qint
+        self._onset_shift_table = {
+            "shifts": shifts,
+            "qints": qints,
+            "degree": xsection.k,
+            "angle": angle,
+            "E0": self.E0,
+            "width": width,
+            "step": step,
+        }
+        self._interpolate_onset_shift_table(energy_shift)
+        return self._onset_shift_table
+
+    def _remove_onset_shift_table(self):
+        if self._onset_shift_table is None:
+            return
+        self._onset_shift_table = None
+        self._integrate_GOS()
+
+    def _interpolate_onset_shift_table(self, energy_shift):
+        self._xsection_version += 1
+        table = self._onset_shift_table
+        shifts = table["shifts"]
+        qints = table["qints"]
+        i = shifts.searchsorted(energy_shift, side="right") - 1
+        i = min(max(i, 0), shifts.size - 2)
+        self._qint_grad = (qints[i + 1] - qints[i]) / (shifts[i + 1] - shifts[i])
+        qint = qints[i] + (energy_shift - shifts[i]) * self._qint_grad
+        E = self.GOS.energy_axis + energy_shift
+        self.GOS.energy_shift = energy_shift
+        self.GOS.qint = qint
+        self.tab_xsection = make_interp_spline(E, qint, k=table["degree"])
+        # The spline is linear in its data, so this is the derivative of the
+        # cross-section with respect to the shift at fixed energy positions
+        self._tab_xsection_grad = make_interp_spline(
+            E, self._qint_grad, k=table["degree"]
+        )
+        self._calculate_power_law_extrapolation()
+
+    def _calculate_qint_grad(self):
+        """Calculate the derivative of the integrated cross-section with
+        respect to the onset energy when there is no onset shift table."""
+        angle = self.effective_angle.value * 1e-3  # in rad
+        energy_shift = self.GOS.energy_shift
+        qint = self.GOS.qint
+        # The integration is much cheaper than evaluating the model, a
+        # forward difference is accurate enough for the small change of the
+        # cross-section magnitude with the onset energy
+        delta = 1e-3
+        self.GOS.integrateq(self.onset_energy.value + delta, angle, self.E0)
+        self._qint_grad = (self.GOS.qint - qint) / delta
+        self.GOS.qint = qint
+        self.GOS.energy_shift = energy_shift
+        self._tab_xsection_grad = make_interp_spline(
+            self.GOS.energy_axis + energy_shift, self._qint_grad, k=self.tab_xsection.k
+        )
+
     def _calculate_knots(self):
         start = self.onset_energy.value
         stop = start + self.fine_structure_width
@@ -451,6 +592,90 @@ class EELSCLEdge(Component):
             [stop] * 4,
         ]
 
+    def _get_fine_structure_basis(self, E):
+        """Return the B-spline basis of the fine structure spline evaluated
+        at E, with shape (E.size, number of coefficients)."""
+        n = self.fine_structure_coeff._number_of_elements
+        basis = np.empty((E.size, n))
+        coefficients = np.zeros(n + 4)
+        for i in range(n):
+            coefficients[i] = 1
+            basis[:, i] = splev(E, (self.__knots, coefficients, 3))
+            coefficients[i] = 0
+        return basis
+
+    def _get_axis_cache(self, E):
+        """Return the energy regions, the cross-section and the fine structure
+        spline basis evaluated on the energy axis E.
+
+        As the axis is sorted, the regions are contiguous and stored as
+        slices. The values are cached for the contents of each axis, as the
+        model builds a new channel-switched axis array at every evaluation,
+        and recomputed when the cross-section or the fine structure settings
+        change.
+
+        Returns
+        -------
+        dict or None
+            None if E is not a sorted 1D array.
+
+        """
+        if not isinstance(E, np.ndarray) or E.ndim != 1 or E.size == 0:
+            return None
+        if E[0] > E[-1]:
+            return None
+        onset_energy = self.onset_energy.value
+        axis_key = (E.size, E[0], E[-1])
+        key = (
+            self._xsection_version,
+            onset_energy,
+            self.fine_structure_active,
+            self.fine_structure_spline_active,
+            self.fine_structure_spline_onset,
+            self.fine_structure_width,
+            self.fine_structure_coeff._number_of_elements,
+        )
+        cache = self._axis_cache.get(axis_key)
+        if (
+            cache is not None
+            and cache["key"] == key
+            and np.array_equal(cache["axis"], E)
+        ):
+            return cache
+
+        Emax = self.GOS.energy_axis[-1] + self.GOS.energy_shift
+        fine_structure = slice(0, 0)
+        basis = None
+        if self.fine_structure_active:
+            ifsx2 = onset_energy + self.fine_structure_width
+            if self.fine_structure_spline_active:
+                ifsx1 = onset_energy + self.fine_structure_spline_onset
+                fine_structure = slice(*E.searchsorted([ifsx1, ifsx2]))
+                if fine_structure.stop > fine_structure.start:
+                    basis = self._get_fine_structure_basis(E[fine_structure])
+            tab_start = ifsx2
+        else:
+            tab_start = onset_energy
+        iext = E.searchsorted(Emax)
+        itab = slice(min(E.searchsorted(tab_start), iext), iext)
+        xsection = np.zeros(E.size)
+        if itab.stop > itab.start:
+            xsection[itab] = self.tab_xsection(E[itab])
+        if iext < E.size:
+            xsection[iext:] = self._power_law_A * E[iext:] ** -self._power_law_r
+
+        cache = {
+            "axis": E.copy(),
+            "key": key,
+            "fine_structure": fine_structure,
+            "xsection": xsection,
+            "basis": basis,
+        }
+        if len(self._axis_cache) >= 4:
+            self._axis_cache.clear()
+        self._axis_cache[axis_key] = cache
+        return cache
+
     def function(self, E):
         """Returns the number of counts in barns"""
         shift = self.onset_energy.value - self.GOS.onset_energy
@@ -462,6 +687,14 @@ class EELSCLEdge(Component):
             # that this is suboptimal because _integrate_GOS is computed twice
             # unnecessarily.
             self._integrate_GOS()
+        cache = self._get_axis_cache(E)
+        if cache is not None:
+            cts = cache["xsection"] * self.intensity.value
+            if cache["basis"] is not None:
+                cts[cache["fine_structure"]] = cache["basis"] @ np.multiply(
+                    self.fine_structure_coeff.value, self.intensity.value
+                )
+            return cts
         Emax = self.GOS.energy_axis[-1] + self.GOS.energy_shift
         cts = np.zeros_like(E, dtype="float")
         if self.fine_structure_active:
@@ -486,9 +719,135 @@ class EELSCLEdge(Component):
             cts[bext] = self._power_law_A * E[bext] ** -self._power_law_r
         return cts * self.intensity.value
 
+    def function_nd(self, axis):
+        """%s"""
+        if not self._is_navigation_multidimensional:
+            return self.function(axis)
+        axis = np.asarray(axis, dtype=float)
+        shape = self.intensity.map.shape + axis.shape
+        if axis.size == 0:
+            return np.zeros(shape)
+        # The energy regions are found on the sorted axis
+        order = np.argsort(axis)
+        axis = axis[order]
+
+        def get_values(parameter):
+            # The current value is used where the map is not set
+            values = parameter.map["values"].reshape(parameter.map.size, -1)
+            is_set = parameter.map["is_set"].reshape(-1, 1)
+            return np.where(is_set, values, np.atleast_1d(parameter.value))
+
+        intensity = get_values(self.intensity).ravel()
+        onset_energy = get_values(self.onset_energy).ravel()
+        angle = get_values(self.effective_angle).ravel()
+        coefficients = get_values(self.fine_structure_coeff)
+        # The cross-section only needs to be computed once for each distinct
+        # onset energy and effective angle, usually a single one
+        parameters, inverse = np.unique(
+            np.stack([onset_energy, angle], axis=1), axis=0, return_inverse=True
+        )
+        inverse = inverse.ravel()
+        to_return = np.empty((intensity.size, len(axis)))
+        old_values = (self.onset_energy.value, self.effective_angle.value)
+        with self.onset_energy.events.value_changed.suppress_callback(
+            self._integrate_GOS
+        ), self.effective_angle.events.value_changed.suppress_callback(
+            self._integrate_GOS
+        ):
+            for i, (onset_energy_, angle_) in enumerate(parameters):
+                self.onset_energy.value = onset_energy_
+                self.effective_angle.value = angle_
+                self._integrate_GOS()
+                cache = self._get_axis_cache(axis)
+                index = np.flatnonzero(inverse == i)
+                to_return[index] = intensity[index, np.newaxis] * cache["xsection"]
+                if cache["basis"] is not None:
+                    to_return[index, cache["fine_structure"]] = (
+                        coefficients[index] * intensity[index, np.newaxis]
+                    ) @ cache["basis"].T
+            self.onset_energy.value, self.effective_angle.value = old_values
+        self._integrate_GOS()
+        to_return[:, order] = to_return.copy()
+        return to_return.reshape(shape)
+
+    function_nd.__doc__ %= FUNCTION_ND_DOCSTRING
+
     def grad_intensity(self, E):
         return self.function(E) / self.intensity.value
 
+    def grad_onset_energy(self, E):
+        """Gradient of the function with respect to ``onset_energy``.
+
+        The edge and the fine structure spline are shifted with the onset
+        energy, and the magnitude of the cross-section changes with it. The
+        latter is interpolated from the onset shift table when there is one,
+        see :py:meth:`~.models.EELSModel.enable_free_onset_energy`.
+
+        """
+        shift = self.onset_energy.value - self.GOS.onset_energy
+        if shift != self.GOS.energy_shift:
+            self._integrate_GOS()
+        if self._qint_grad is None:
+            self._calculate_qint_grad()
+        Emax = self.GOS.energy_axis[-1] + self.GOS.energy_shift
+        grad = np.zeros_like(E, dtype="float")
+        if self.fine_structure_active:
+            ifsx1 = self.onset_energy.value + self.fine_structure_spline_onset
+            ifsx2 = self.onset_energy.value + self.fine_structure_width
+            if self.fine_structure_spline_active:
+                bifs = (E >= ifsx1) & (E < ifsx2)
+                if np.any(bifs):
+                    # The knots move with the onset energy
+                    grad[bifs] = -splev(
+                        E[bifs],
+                        (self.__knots, self.fine_structure_coeff.value + (0,) * 4, 3),
+                        der=1,
+                    )
+            itab = (E < Emax) & (E >= ifsx2)
+        else:
+            itab = (E < Emax) & (E >= self.onset_energy.value)
+        if itab.any():
+            grad[itab] = self._tab_xsection_grad(E[itab]) - self.tab_xsection(
+                E[itab], nu=1
+            )
+        bext = E >= Emax
+        if bext.any():
+            E1 = self.GOS.energy_axis[-2] + self.GOS.energy_shift
+            E2 = self.GOS.energy_axis[-1] + self.GOS.energy_shift
+            y1, y2 = self.GOS.qint[-2:]
+            dy1, dy2 = self._qint_grad[-2:]
+            r = self._power_law_r
+            logE = math.log(E1 / E2)
+            dr = (
+                (dy2 / y2 - dy1 / y1) * logE - math.log(y2 / y1) * (1 / E1 - 1 / E2)
+            ) / logE**2
+            Eext = E[bext]
+            grad[bext] = (
+                self._power_law_A
+                * Eext**-r
+                * (dy1 / y1 + dr * (math.log(E1) - np.log(Eext)) + r / E1)
+            )
+        return grad * self.intensity.value
+
+    def grad_fine_structure_coeff(self, E):
+        """Gradient of the function with respect to the coefficients of the
+        fine structure spline, with shape (number of coefficients, E.size)."""
+        shift = self.onset_energy.value - self.GOS.onset_energy
+        if shift != self.GOS.energy_shift:
+            self._integrate_GOS()
+        grad = np.zeros((self.fine_structure_coeff._number_of_elements, len(E)))
+        cache = self._get_axis_cache(E)
+        if cache is not None:
+            if cache["basis"] is not None:
+                grad[:, cache["fine_structure"]] = cache["basis"].T
+        elif self.fine_structure_active and self.fine_structure_spline_active:
+            ifsx1 = self.onset_energy.value + self.fine_structure_spline_onset
+            ifsx2 = self.onset_energy.value + self.fine_structure_width
+            bifs = (E >= ifsx1) & (E < ifsx2)
+            if np.any(bifs):
+                grad[:, bifs] = self._get_fine_structure_basis(E[bifs]).T
+        return grad * self.intensity.value
+
     def fine_structure_coeff_to_txt(self, filename):
         np.savetxt(filename + ".dat", self.fine_structure_coeff.value, fmt="%12.6G")
 
@@ -62,10 +62,37 @@ from matplotlib.testing.conftest import mpl_test_settings
 try:
     import pytest_mpl
 except ImportError:
-    # Register dummy marker to allow running the test suite without pytest-mpl
-    def pytest_configure(config):
+    pytest_mpl = None
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run the tests marked as benchmark, which depend on the machine.",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "benchmark: timing test skipped unless --run-benchmarks is given.",
+    )
+    if pytest_mpl is None:
+        # Register dummy marker to allow running the test suite without
+        # pytest-mpl
         config.addinivalue_line(
             "markers",
             "mpl_image_compare: dummy marker registration to allow running "
             "without the pytest-mpl plugin.",
         )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmark, use --run-benchmarks to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
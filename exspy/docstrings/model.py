@@ -52,3 +52,43 @@ EELSMODEL_PARAMETERS = """ll : None or EELSSpectrum
             :meth:`~.model.BaseModel.as_dictionary`""".format(
     GOS_PARAMETER
 )
+
+MULTIFIT_ITERPATH_PARAMETERS = """iterpath : None or str
+            The order in which the pixels are fitted, one of "flyback",
+            "serpentine", "hilbert" or "coarse-to-fine". "flyback" and
+            "serpentine" are raster orders, the direction of the fastest
+            axis being reversed at every row for "serpentine". "hilbert"
+            follows a Hilbert curve, for navigation dimensions up to two.
+            "coarse-to-fine" fits the pixels of a coarse grid first and
+            then refines the grid by a factor of two until all the pixels
+            are fitted. If None, the default iteration path of the axes
+            manager is used.
+        seed_from_neighbours : bool, default False
+            If True, the free parameters of each pixel start from the mean
+            of their values in the neighbouring pixels that have already
+            been fitted, instead of the stored values or the values of the
+            previously fitted pixel. For "coarse-to-fine", the neighbours
+            are the pixels within the spacing of the current grid."""
+
+MULTIFIT_PYRAMID_PARAMETER = """pyramid : None or sequence of int, default None
+            If not None, the binning factors of the navigation axes, e.g.
+            ``(8, 4, 2)``. The model is first fitted to the signal averaged
+            by blocks of the largest factor, and the fitted values of the
+            free parameters are used as starting values of the fit at the
+            next factor, and so on until the full resolution. The stored
+            values of the free parameters are replaced. The other arguments
+            are used at every resolution, except ``mask`` which is only
+            used at the full resolution."""
+
+MULTIFIT_CHECKPOINT_PARAMETERS = """checkpoint : None, str or pathlib.Path, default None
+            If not None, the path of a numpy ``.npz`` file where the
+            parameter maps, the fit statistics and the fitted pixels are
+            saved periodically and at the end of the fit, including when it
+            is interrupted.
+        checkpoint_interval : float, default 60
+            The minimum time between two checkpoints, in seconds.
+        resume : bool, default False
+            If True, the parameter maps and the fit statistics are restored
+            from ``checkpoint`` and only the pixels that are not fitted yet
+            are fitted. The model must have the same components and
+            navigation shape as the checkpointed one."""
@@ -20,9 +20,7 @@
 import numpy as np
 import math
 from scipy import constants
-from hyperspy.misc.utils import stack
 from exspy.misc.elements import elements as elements_db
-from functools import reduce
 
 
 eV2keV = 1000.0
@@ -85,6 +83,47 @@ def _parse_only_lines(only_lines):
     return only_lines
 
 
+def _sum_windows(data, starts, stops, dtype=None):
+    """
+    Sum the last axis of `data` over several windows in a single pass.
+
+    The channels spanned by the windows are summed once into the segments
+    delimited by all the window boundaries, and each window is then the
+    difference of two cumulative sums of these segments, so that
+    overlapping windows do not read the data twice.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        The spectra, with the energy axis last.
+    starts, stops : array of int
+        The first and one past the last channel of each window.
+    dtype : numpy.dtype, optional
+        The dtype of the accumulator. Default is the dtype of `data`.
+
+    Returns
+    -------
+    numpy.ndarray of shape ``data.shape[:-1] + (len(starts),)``
+    """
+    starts = np.asarray(starts, dtype=int)
+    stops = np.maximum(np.asarray(stops, dtype=int), starts)
+    boundaries = np.unique(np.concatenate([starts, stops]))
+    dtype = data.dtype if dtype is None else dtype
+    cumulative = np.zeros(data.shape[:-1] + (len(boundaries),), dtype=dtype)
+    if len(boundaries) > 1:
+        segments = np.add.reduceat(
+            data[..., boundaries[0] : boundaries[-1]],
+            boundaries[:-1] - boundaries[0],
+            axis=-1,
+            dtype=dtype,
+        )
+        np.cumsum(segments, axis=-1, out=cumulative[..., 1:])
+    return (
+        cumulative[..., np.searchsorted(boundaries, stops)]
+        - cumulative[..., np.searchsorted(boundaries, starts)]
+    )
+
+
 def get_xray_lines_near_energy(energy, width=0.2, only_lines=None):
     """Find xray lines near a specific energy, more specifically all xray lines
     that satisfy only_lines and are within the given energy window width around
@@ -434,30 +473,20 @@ def quantification_cliff_lorimer(
     # Value used as an threshold to prevent using zeros as denominator
     min_intensity = 0.1
     dim = intensities.shape
-    dim2 = reduce(lambda x, y: x * y, dim[1:])
-    intens = intensities.reshape(dim[0], dim2).astype(float)
+    intens = intensities.reshape(dim[0], -1).astype(float)
 
     if absorption_correction is None:
         # default to ones
         absorption_correction = np.ones_like(intens, dtype=float)
     else:
-        absorption_correction = absorption_correction.reshape(dim[0], dim2)
-
-    for i in range(dim2):
-        index = np.where(intens[:, i] > min_intensity)[0]
-        if len(index) > 1:
-            ref_index, ref_index2 = index[:2]
-            intens[:, i] = _quantification_cliff_lorimer(
-                intens[:, i],
-                kfactors,
-                absorption_correction[:, i],
-                ref_index,
-                ref_index2,
-            )
-        else:
-            intens[:, i] = np.zeros_like(intens[:, i])
-            if len(index) == 1:
-                intens[index[0], i] = 1.0
+        absorption_correction = absorption_correction.reshape(dim[0], -1)
+
+    # The pixels with at least two elements above the threshold are
+    # quantified, those with a single one are pure in this element.
+    above = intens > min_intensity
+    n_above = above.sum(axis=0)
+    intens = _quantification_cliff_lorimer(intens, kfactors, absorption_correction)
+    intens = np.where(n_above > 1, intens, above)
 
     intens = intens.reshape(dim)
     if mask is not None:
@@ -465,8 +494,7 @@ def quantification_cliff_lorimer(
 
         if isinstance(mask, BaseSignal):
             mask = mask.data
-        for i in range(dim[0]):
-            intens[i][(mask == True)] = 0
+        intens[:, np.asarray(mask) == True] = 0
 
     return intens
 
@@ -474,9 +502,7 @@ def quantification_cliff_lorimer(
 quantification_cliff_lorimer.__doc__ %= _ABSORPTION_CORRECTION_DOCSTRING
 
 
-def _quantification_cliff_lorimer(
-    intensities, kfactors, absorption_correction, ref_index=0, ref_index2=1
-):
+def _quantification_cliff_lorimer(intensities, kfactors, absorption_correction):
     """
     Quantification using Cliff-Lorimer
 
@@ -491,43 +517,30 @@ def _quantification_cliff_lorimer(
     kfactors: list of float
         The list of kfactor in same order as  intensities eg. kfactors =
         [1, 1.47, 1.72] for ['Al_Ka','Cr_Ka', 'Ni_Ka']
-    ref_index, ref_index2: int
-        index of the elements that will be in the denominator. Should be non
-        zeros if possible.
 
     Return
     ------
     numpy.array containing the weight fraction with the same
     shape as intensities.
+
+    Notes
+    -----
+    The ratio of the weight fractions of any two elements a and b is
+    Ca / Cb = kab * Ia / Ib, with kab = ka / kb. Normalising the sum of the
+    weight fractions to one gives Ca = ka * Ia / sum(ki * Ii), whatever the
+    elements chosen as reference.
     """
     if len(intensities) != len(kfactors):
         raise ValueError(
             "The number of kfactors must match the size of the "
             "first axis of intensities."
         )
-
-    ab = np.zeros_like(intensities, dtype="float")
-    composition = np.ones_like(intensities, dtype="float")
-    # ab = Ia/Ib / kab
-    other_index = list(range(len(kfactors)))
-    other_index.pop(ref_index)
-    for i in other_index:
-        ab[i] = (
-            (intensities[ref_index] * absorption_correction[ref_index])
-            / (intensities[i] * absorption_correction[i])
-            * (kfactors[ref_index] / kfactors[i])
-        )
-    # Ca = ab /(1 + ab + ab/ac + ab/ad + ...)
-    for i in other_index:
-        if i == ref_index2:
-            composition[ref_index] += ab[ref_index2]
-        else:
-            composition[ref_index] += ab[ref_index2] / ab[i]
-    composition[ref_index] = ab[ref_index2] / composition[ref_index]
-    # Cb = Ca / ab
-    for i in other_index:
-        composition[i] = composition[ref_index] / ab[i]
-    return composition
+    kfactors = np.asarray(kfactors, dtype=float).reshape(
+        (-1,) + (1,) * (np.ndim(intensities) - 1)
+    )
+    weighted = intensities * absorption_correction * kfactors
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return weighted / weighted.sum(axis=0)
 
 
 def quantification_zeta_factor(intensities, zfactors, dose, absorption_correction=None):
@@ -587,17 +600,63 @@ def get_abs_corr_zeta(weight_percent, mass_thickness, take_off_angle):
     """
     from exspy.misc import material
 
+    return _get_abs_corr_zeta(
+        np.array([wt.data for wt in weight_percent]),
+        mass_thickness.data,
+        take_off_angle,
+        material._lines_auto(weight_percent, "auto"),
+    )
+
+
+def _get_mass_thickness(weight_percent, thickness, densities):
+    """Calculate the mass thickness of a material from its composition and
+    thickness, for the absorption correction of the Cliff-Lorimer method.
+
+    Parameters
+    ----------
+    weight_percent : numpy.ndarray
+        The composition in weight percent, the first axis corresponding to
+        the elements.
+    thickness : float or numpy.ndarray
+        The thickness in nm, broadcastable to the navigation shape.
+    densities : numpy.ndarray
+        The density of each element in g/cm^3.
+
+    Returns
+    -------
+    numpy.ndarray
+        The mass thickness in kg/m^2.
+    """
+    densities = np.reshape(densities, (-1,) + (1,) * (np.ndim(weight_percent) - 1))
+    # convert composition from % to fraction: factor of 1E-2
+    # convert thickness from nm to m: factor of 1E-9
+    # convert density from g/cm3 to kg/m3: factor of 1E3
+    return np.sum(weight_percent * thickness * densities * 1e-8, axis=0)
+
+
+def _get_abs_corr_zeta(weight_percent, mass_thickness, take_off_angle, xray_lines):
+    """
+    Calculate absorption correction terms.
+
+    Parameters
+    ----------
+    weight_percent: numpy.ndarray
+        Composition in weight percent, the first axis being the elements axis.
+    mass_thickness: numpy.ndarray
+        Density-thickness map in kg/m^2
+    take_off_angle: float
+        X-ray take-off angle in degrees.
+    xray_lines: list of str
+        The X-ray line of each element.
+    """
+    from exspy.misc import material
+
+    elements = [_get_element_and_line(xray_line)[0] for xray_line in xray_lines]
     toa_rad = np.radians(take_off_angle)
     csc_toa = 1.0 / np.sin(toa_rad)
     # convert from cm^2/g to m^2/kg
-    mac = (
-        stack(
-            material.mass_absorption_mixture(weight_percent=weight_percent),
-            show_progressbar=False,
-        )
-        * 0.1
-    )
-    expo = mac.data * mass_thickness.data * csc_toa
+    mac = material._mass_absorption_mixture(weight_percent, elements, xray_lines) * 0.1
+    expo = mac * mass_thickness * csc_toa
     acf = expo / (1.0 - np.exp(-(expo)))
     return acf
 
@@ -662,11 +721,42 @@ def get_abs_corr_cross_section(
     take_off_angle: float
         X-ray take-off angle in degrees.
     """
+    from hyperspy.misc.utils import stack
+    from exspy.misc import material
+
+    return _get_abs_corr_cross_section(
+        np.array([compo.data for compo in composition]),
+        stack(number_of_atoms, show_progressbar=False).data,
+        take_off_angle,
+        probe_area,
+        material._lines_auto(composition, "auto"),
+    )
+
+
+def _get_abs_corr_cross_section(
+    composition, number_of_atoms, take_off_angle, probe_area, xray_lines
+):
+    """
+    Calculate absorption correction terms.
+
+    Parameters
+    ----------
+    composition: numpy.ndarray
+        Composition in atomic percent, the first axis being the elements axis.
+    number_of_atoms: numpy.ndarray
+        Number of atoms per pixel, the first axis being the elements axis.
+    take_off_angle: float
+        X-ray take-off angle in degrees.
+    probe_area: float
+        The probe area in nm^2.
+    xray_lines: list of str
+        The X-ray line of each element.
+    """
     from exspy.misc import material
 
     toa_rad = np.radians(take_off_angle)
     Av = constants.Avogadro
-    elements = [intensity.metadata.Sample.elements[0] for intensity in number_of_atoms]
+    elements = [_get_element_and_line(xray_line)[0] for xray_line in xray_lines]
     atomic_weights = np.array(
         [
             elements_db[element]["General_properties"]["atomic_weight"]
@@ -674,26 +764,217 @@ def get_abs_corr_cross_section(
         ]
     )
 
-    number_of_atoms = stack(number_of_atoms, show_progressbar=False).data
-
     # calculate the total_mass in kg/m^2, or mass thickness.
     total_mass = np.zeros_like(number_of_atoms[0], dtype="float")
     for i, (weight) in enumerate(atomic_weights):
         total_mass += number_of_atoms[i] * weight / Av / 1e3 / probe_area / 1e-18
     # determine mass absorption coefficients and convert from cm^2/g to m^2/kg.
-    to_stack = material.mass_absorption_mixture(
-        weight_percent=material.atomic_to_weight(composition)
+    mac = (
+        material._mass_absorption_mixture(
+            material._atomic_to_weight(composition, elements), elements, xray_lines
+        )
+        * 0.1
     )
-    mac = stack(to_stack, show_progressbar=False) * 0.1
     acf = np.zeros_like(number_of_atoms)
     csc_toa = 1 / math.sin(toa_rad)
     # determine an absorption coeficient per element per pixel.
     for i, (weight) in enumerate(atomic_weights):
-        expo = mac.data[i] * total_mass * csc_toa
+        expo = mac[i] * total_mass * csc_toa
         acf[i] = expo / (1 - np.exp(-expo))
     return acf
 
 
+def _quantification_absorption(
+    intensities,
+    method,
+    factors,
+    xray_lines,
+    composition_units="atomic",
+    absorption_correction=False,
+    take_off_angle=None,
+    thickness=None,
+    dose=None,
+    probe_area=None,
+    mask=None,
+    convergence_criterion=0.5,
+    max_iterations=30,
+    pbar=None,
+):
+    """
+    Quantify the intensities with the iterative absorption correction.
+
+    The pixels are flattened and, at each iteration of the absorption
+    correction, only those which have not converged are quantified again.
+
+    Parameters
+    ----------
+    intensities: numpy.ndarray
+        The intensities for each X-ray lines, the first axis being the
+        elements axis.
+    method: {'CL', 'zeta', 'cross_section'}
+        The quantification method.
+    factors: list of float
+        The kfactors, zeta-factors or cross sections of each X-ray line.
+    xray_lines: list of str
+        The X-ray line of each intensity.
+    composition_units: {'atomic', 'weight'}
+        The units of the returned composition.
+    absorption_correction: bool
+        Whether the absorption correction is applied.
+    take_off_angle: float
+        X-ray take-off angle in degrees.
+    thickness, dose, mask: float, numpy.ndarray or None
+        The thickness in nm (for 'CL'), the electron dose (for 'zeta' and
+        'cross_section') and the mask of the pixels set to zero (for 'CL'),
+        either scalar or with the shape of ``intensities[0]``.
+    probe_area: float
+        The probe area in nm^2 (for 'cross_section').
+    convergence_criterion: float
+        The maximum change of composition, in percent, between two
+        successive iterations of a converged pixel.
+    max_iterations: int
+        The maximum number of iterations.
+    pbar: progressbar or None
+        If not None, updated at each iteration.
+
+    Returns
+    -------
+    composition: numpy.ndarray
+        The composition in percent with the shape of `intensities`.
+    mass_thickness: numpy.ndarray
+        The mass thickness in kg/m^2 with the shape of ``intensities[0]``,
+        zero for the 'cross_section' method or 'CL' without absorption
+        correction.
+    number_of_atoms: numpy.ndarray
+        The number of atoms with the shape of `intensities`, zero for the
+        'CL' and 'zeta' methods.
+    iterations: int
+        The number of iterations.
+    """
+    shape = intensities.shape
+    intens_flat = intensities.reshape(shape[0], -1)
+    elements = [_get_element_and_line(xray_line)[0] for xray_line in xray_lines]
+    densities = np.array(
+        [
+            elements_db[element]["Physical_properties"]["density (g/cm^3)"]
+            for element in elements
+        ]
+    )
+
+    def _pixels(value, index):
+        # Select pixels of a scalar or of an array with the navigation shape
+        if np.ndim(value) == 0:
+            return value
+        return np.broadcast_to(value, shape[1:]).reshape(-1)[index]
+
+    composition = np.zeros(intens_flat.shape)
+    comp_old = np.zeros(intens_flat.shape)
+    mass_thickness = np.zeros(intens_flat.shape[1])
+    number_of_atoms = np.zeros(intens_flat.shape)
+    abs_corr_factor = np.ones(intens_flat.shape)
+    active = np.arange(intens_flat.shape[1])
+
+    it = 0
+    while True:
+        intens = intens_flat[:, active]
+        acf = abs_corr_factor[:, active]
+        if method == "CL":
+            results = quantification_cliff_lorimer(
+                intens,
+                factors,
+                absorption_correction=acf,
+                mask=None if mask is None else _pixels(mask, active),
+            )
+            composition[:, active] = results * 100.0
+            if absorption_correction:
+                mass_thickness[active] = _get_mass_thickness(
+                    composition[:, active], _pixels(thickness, active), densities
+                )
+
+        elif method == "zeta":
+            results = quantification_zeta_factor(
+                intens, factors, _pixels(dose, active), absorption_correction=acf
+            )
+            composition[:, active] = results[0] * 100
+            mass_thickness[active] = results[1]
+
+        else:
+            results = quantification_cross_section(
+                intens, factors, _pixels(dose, active), absorption_correction=acf
+            )
+            composition[:, active] = results[0] * 100.0
+            number_of_atoms[:, active] = results[1]
+
+        if absorption_correction:
+            if method == "cross_section":
+                abs_corr_factor[:, active] = _get_abs_corr_cross_section(
+                    composition[:, active],
+                    number_of_atoms[:, active],
+                    take_off_angle,
+                    probe_area,
+                    xray_lines,
+                )
+            else:
+                abs_corr_factor[:, active] = _get_abs_corr_zeta(
+                    composition[:, active],
+                    mass_thickness[active],
+                    take_off_angle,
+                    xray_lines,
+                )
+
+        res_max = np.max(composition[:, active] - comp_old[:, active], axis=0)
+        comp_old[:, active] = composition[:, active]
+
+        if pbar is not None:
+            pbar.update(1)
+        it += 1
+        if not absorption_correction:
+            break
+        active = active[~(np.abs(res_max) < convergence_criterion)]
+        if active.size == 0:
+            break
+        elif it >= max_iterations:
+            raise Exception(
+                "Absorption correction failed as solution "
+                f"did not converge after {max_iterations} "
+                "iterations"
+            )
+
+    # convert ouput units to selection as required.
+    from exspy.misc import material
+
+    if composition_units == "atomic":
+        if method != "cross_section":
+            composition = material._weight_to_atomic(composition, elements)
+    else:
+        if method == "cross_section":
+            composition = material._atomic_to_weight(composition, elements)
+
+    return (
+        composition.reshape(shape),
+        mass_thickness.reshape(shape[1:]),
+        number_of_atoms.reshape(shape),
+        it,
+    )
+
+
+def _quantification_absorption_block(intensities, *pixel_values, names, **kwargs):
+    """
+    Apply :py:func:`_quantification_absorption` to a block of a dask array.
+
+    The values of `names` are given in `pixel_values`, the blocks of the
+    arrays with the navigation shape. The composition, number of atoms and
+    mass thickness are returned concatenated along the first axis.
+    """
+    kwargs.update(zip(names, pixel_values))
+    composition, mass_thickness, number_of_atoms, _ = _quantification_absorption(
+        intensities, **kwargs
+    )
+    return np.concatenate(
+        [composition, number_of_atoms, mass_thickness[np.newaxis]], axis=0
+    )
+
+
 def edx_cross_section_to_zeta(cross_sections, elements):
     """Convert a list of cross_sections in barns (b) to zeta-factors (kg/m^2).
 
@@ -17,10 +17,11 @@
 # along with exSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
 
+import hashlib
 import math
 
 import numpy as np
-from scipy import constants, integrate, interpolate
+from scipy import constants, interpolate
 
 from exspy.misc.elements import elements
 from hyperspy.misc.export_dictionary import (
@@ -56,6 +57,17 @@ class BaseGOS:
         self.Z = elements[element]["General_properties"]["Z"]
         self.element_dict = elements[element]
 
+    def _get_hash(self):
+        """Return a hash of the GOS data, used to identify cached
+        cross-sections."""
+        h = hashlib.sha1(repr((self._name, self.element, self.subshell)).encode())
+        h.update(repr(getattr(self, "subshell_factor", 1.0)).encode())
+        for name in ("rel_energy_axis", "qaxis", "gos_array"):
+            array = getattr(self, name, None)
+            if array is not None:
+                h.update(np.ascontiguousarray(array).tobytes())
+        return h.hexdigest()
+
     def get_parametrized_qaxis(self, k1, k2, n):
         return k1 * (np.exp(np.arange(n) * k2) - 1) * 1e10
 
@@ -93,6 +105,55 @@ class BaseGOS:
             )
         return qaxis, qgosi.clip(0)
 
+    def _get_qa0sq_limits(self, E, angle, E0):
+        """Return the limits of the q integral in units of (q * a0)**2.
+
+        Parameters
+        ----------
+        E : float or array
+            Energy loss in eV.
+        angle : float
+            Effective collection semi-angle in rad.
+        E0 : float
+            Beam energy in keV.
+
+        """
+        gamma = 1 + E0 / 511.06
+        T = 511060 * (1 - 1 / gamma**2) / 2
+        qa0sqmin = (E**2) / (4 * R * T) + (E**3) / (8 * gamma**3 * R * T**2)
+        p02 = T / (R * (1 - 2 * T / 511060))
+        pp2 = p02 - E / R * (gamma - E / 1022120)
+        qa0sqmax = qa0sqmin + 4 * np.sqrt(p02 * pp2) * (math.sin(angle / 2)) ** 2
+        return qa0sqmin, qa0sqmax
+
+
+def _integrate_quadratic(h0, h1, g0, g1, g2):
+    """Integrate the quadratic through three points over the interval
+    between the first two.
+
+    Parameters
+    ----------
+    h0 : array
+        The signed distance from the first point to the second one.
+    h1 : array
+        The signed distance from the second point to the third one, in the
+        same direction as ``h0``.
+    g0, g1, g2 : array
+        The values at the three points.
+
+    Returns
+    -------
+    array
+        The integral, zero for an empty interval.
+
+    """
+    H = h0 + h1
+    integral = (
+        h0 / 6 * ((3 - h0 / H) * g0 + (3 + h0 / h1) * g1 - h0**2 / (H * h1) * g2)
+    )
+    # Empty interval, e.g. when a limit is a tabulated value
+    return np.where(h0 == 0, 0.0, integral)
+
 
 class TabulatedGOS(BaseGOS):
     def __init__(self, element_subshell):
@@ -124,28 +185,107 @@ class TabulatedGOS(BaseGOS):
         export_to_dictionary(self, self._whitelist, dic, fullcopy)
         return dic
 
+    def _integrate_logq(self, qmin, qmax):
+        """Integrate the GOS over log((q * a0)**2) between qmin and qmax.
+
+        All the tabulated energies are integrated at once. Each interval,
+        including the partial intervals next to the limits where the GOS is
+        linearly interpolated as in ``get_qaxis_and_gos``, is integrated
+        with the quadratic through its end points and the next (or, at the
+        upper end, the previous) point, as in Simpson's rule.
+
+        Parameters
+        ----------
+        qmin, qmax : array
+            The lower and upper limit of the integral for each row of
+            ``gos_array`` in 1/m.
+
+        Returns
+        -------
+        array
+            The integral for each row of ``gos_array``.
+
+        """
+        qaxis = self.qaxis
+        n = qaxis.size
+        rows = np.arange(self.gos_array.shape[0])
+        gos = self.gos_array.clip(0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = np.log((a0 * qaxis) ** 2)
+            h = np.diff(x)
+            intervals = np.empty((rows.size, n - 1))
+            intervals[:, :-1] = _integrate_quadratic(
+                h[:-1], h[1:], gos[:, :-2], gos[:, 1:-1], gos[:, 2:]
+            )
+            # The last interval of the table with the previous point
+            intervals[:, -1] = _integrate_quadratic(
+                h[-1], h[-2], gos[:, -1], gos[:, -2], gos[:, -3]
+            )
+        # A zero in the tabulated q axis produces non-finite values in an
+        # interval that is never inside the integration limits
+        intervals[~np.isfinite(intervals)] = 0
+        cumulative = np.zeros((rows.size, n))
+        np.cumsum(intervals, axis=1, out=cumulative[:, 1:])
+
+        def gos_at(q, index):
+            # Linear interpolation (or extrapolation) in q as in
+            # `get_qaxis_and_gos`
+            index = index.clip(1, n - 1)
+            q1, q2 = qaxis[index - 1], qaxis[index]
+            g1 = self.gos_array[rows, index - 1]
+            g2 = self.gos_array[rows, index]
+            return (g1 + (g2 - g1) / (q2 - q1) * (q - q1)).clip(0)
+
+        # Tabulated q values inside the limits: imin <= i < imax
+        imin = qaxis.searchsorted(qmin)
+        imax = qaxis.searchsorted(qmax)
+        xmin = np.log((a0 * qmin) ** 2)
+        xmax = np.log((a0 * qmax) ** 2)
+        gmin = gos_at(qmin, imin)
+        gmax = gos_at(qmax, imax)
+
+        first = imin.clip(0, n - 1)
+        last = (imax - 1).clip(0, n - 1)
+        # The third point of the quadratics of the partial intervals is the
+        # next tabulated point inside the limits or, when there is none, the
+        # other limit
+        single = last == first
+        after = (first + 1).clip(0, n - 1)
+        before = (last - 1).clip(0, n - 1)
+        x_after = np.where(single, xmax, x[after])
+        g_after = np.where(single, gmax, gos[rows, after])
+        x_before = np.where(single, xmin, x[before])
+        g_before = np.where(single, gmin, gos[rows, before])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lower = _integrate_quadratic(
+                x[first] - xmin,
+                x_after - x[first],
+                gmin,
+                gos[rows, first],
+                g_after,
+            )
+            upper = _integrate_quadratic(
+                xmax - x[last],
+                x[last] - x_before,
+                gmax,
+                gos[rows, last],
+                g_before,
+            )
+            inner = cumulative[rows, last] - cumulative[rows, first] + lower + upper
+        # When no tabulated value lies between the limits
+        outer = 0.5 * (gmin + gmax) * (xmax - xmin)
+        return np.where(imax > imin, inner, outer)
+
     def integrateq(self, onset_energy, angle, E0):
         energy_shift = onset_energy - self.onset_energy
         self.energy_shift = energy_shift
-        qint = np.zeros((self.energy_axis.shape[0]))
-        # Calculate the cross section at each energy position of the
-        # tabulated GOS
         gamma = 1 + E0 / 511.06
         T = 511060 * (1 - 1 / gamma**2) / 2
-        for i in range(0, self.gos_array.shape[0]):
-            E = self.energy_axis[i] + energy_shift
-            # Calculate the limits of the q integral
-            qa0sqmin = (E**2) / (4 * R * T) + (E**3) / (8 * gamma**3 * R * T**2)
-            p02 = T / (R * (1 - 2 * T / 511060))
-            pp2 = p02 - E / R * (gamma - E / 1022120)
-            qa0sqmax = qa0sqmin + 4 * np.sqrt(p02 * pp2) * (math.sin(angle / 2)) ** 2
-            qmin = math.sqrt(qa0sqmin) / a0
-            qmax = math.sqrt(qa0sqmax) / a0
-            # Perform the integration in a log grid
-            qaxis, gos = self.get_qaxis_and_gos(i, qmin, qmax)
-            logsqa0qaxis = np.log((a0 * qaxis) ** 2)
-            qint[i] = integrate.simps(gos, logsqa0qaxis)
         E = self.energy_axis + energy_shift
+        # Calculate the limits of the q integral and perform the integration
+        # in a log grid for all the tabulated energies at once
+        qa0sqmin, qa0sqmax = self._get_qa0sq_limits(E, angle, E0)
+        qint = self._integrate_logq(np.sqrt(qa0sqmin) / a0, np.sqrt(qa0sqmax) / a0)
         # Energy differential cross section in (barn/eV/atom)
         qint *= (4.0 * np.pi * a0**2.0 * R**2 / E / T * self.subshell_factor) * 1e28
         self.qint = qint
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The exSpy developers
+#
+# This file is part of exSpy.
+#
+# exSpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# exSpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with exSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+import hashlib
+import logging
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+from exspy._defaults_parser import preferences
+
+
+_logger = logging.getLogger(__name__)
+
+
+class CrossSectionCache:
+    """Size-bounded on-disk cache of integrated ionisation cross-sections.
+
+    Each entry is stored as a ``.npz`` file named after its key. When the
+    total size of the cache exceeds ``max_size``, the least recently used
+    entries are removed.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        The directory where the entries are stored.
+    max_size : float
+        The maximum size of the cache in bytes.
+
+    """
+
+    def __init__(self, path, max_size):
+        self.path = Path(path)
+        self.max_size = max_size
+
+    @staticmethod
+    def get_key(GOS, E0, angle, energy_shift):
+        """Return the key identifying a cross-section.
+
+        Parameters
+        ----------
+        GOS : BaseGOS
+            The GOS instance that is integrated.
+        E0 : float
+            Beam energy in keV.
+        angle : float
+            Effective collection semi-angle in rad.
+        energy_shift : float
+            Shift of the onset energy from the GOS onset energy in eV.
+
+        Returns
+        -------
+        str
+
+        """
+        key = hashlib.sha1(GOS._get_hash().encode())
+        key.update(
+            repr(
+                (
+                    GOS.element,
+                    GOS.subshell,
+                    float(E0),
+                    float(angle),
+                    float(energy_shift),
+                )
+            ).encode()
+        )
+        return key.hexdigest()
+
+    def _get_filename(self, key):
+        return self.path / f"{key}.npz"
+
+    def get(self, key):
+        """Return the arrays stored for ``key`` in a dictionary or None if
+        the key is not in the cache."""
+        filename = self._get_filename(key)
+        try:
+            with np.load(filename) as f:
+                data = {name: f[name] for name in f.files}
+        except (OSError, ValueError, zipfile.BadZipFile):
+            return None
+        try:
+            # Mark the entry as recently used
+            os.utime(filename)
+        except OSError:
+            pass
+        return data
+
+    def set(self, key, **arrays):
+        """Store the given arrays under ``key``."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so that other processes never read
+        # a partially written entry
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp, self._get_filename(key))
+        except OSError as e:
+            _logger.warning(f"The cross-section could not be cached: {e}")
+            Path(tmp).unlink(missing_ok=True)
+            return
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for filename in self.path.glob("*.npz"):
+            try:
+                stat = filename.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, filename))
+        entries.sort()
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, filename in entries:
+            if total_size <= self.max_size:
+                break
+            filename.unlink(missing_ok=True)
+            total_size -= size
+
+    def clear(self):
+        """Remove all the entries of the cache."""
+        for filename in self.path.glob("*.npz"):
+            filename.unlink(missing_ok=True)
+
+
+def get_cross_section_cache():
+    """Return the cross-section cache defined in the preferences.
+
+    Returns
+    -------
+    CrossSectionCache or None
+        None if the cache is disabled in ``preferences.EELS``.
+
+    """
+    if not preferences.EELS.gos_cache_enabled:
+        return None
+    return CrossSectionCache(
+        preferences.EELS.gos_cache_path,
+        preferences.EELS.gos_cache_max_size * 2**20,
+    )
@@ -16,7 +16,10 @@
 # You should have received a copy of the GNU General Public License
 # along with exSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
+import functools
 import logging
+import os
+import threading
 
 import h5py
 import numpy as np
@@ -36,6 +39,91 @@ _GOSH_DOI = "10.5281/zenodo.7645765"
 _GOSH_URL = f"doi:{_GOSH_DOI}/Segger_Guzzinati_Kohl_1.5.0.gosh"
 _GOSH_KNOWN_HASH = "md5:7fee8891c147a4f769668403b54c529b"
 
+# Read-only handles of the GOSH files, shared by all the GoshGOS instances
+_gosh_files = {}
+_gosh_files_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_default_gosh_file_path():
+    # Retrieve and verify the hash of the default GOSH file only once per
+    # process
+    return pooch.retrieve(
+        url=_GOSH_URL,
+        known_hash=_GOSH_KNOWN_HASH,
+        progressbar=preferences.General.show_progressbar,
+    )
+
+
+def _get_gosh_file(gos_file_path):
+    """Return a shared read-only handle of the GOSH file."""
+    gos_file_path = os.fspath(gos_file_path)
+    with _gosh_files_lock:
+        h = _gosh_files.get(gos_file_path)
+        if h is None or not h.id.valid:
+            h = h5py.File(gos_file_path, "r")
+            _gosh_files[gos_file_path] = h
+    return h
+
+
+def _close_gosh_files():
+    """Close the shared GOSH file handles and clear the cached tables."""
+    with _gosh_files_lock:
+        for h in _gosh_files.values():
+            if h.id.valid:
+                h.close()
+        _gosh_files.clear()
+    _read_gosh_table.cache_clear()
+
+
+def _forget_gosh_files():
+    # HDF5 handles must not be shared with child processes
+    _gosh_files.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_gosh_files)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_gosh_table(gos_file_path, element, subshell):
+    """Read the GOS table of an element subshell from a GOSH file.
+
+    The tables are cached, the returned arrays are read-only.
+
+    Returns
+    -------
+    gos, q, free_energies : numpy.ndarray
+    occupancy_ratio : float
+    doi : str
+
+    """
+    error_message = (
+        "The GOSH Parametrized GOS database does not "
+        f"contain a valid entry the {subshell} subshell "
+        f"of {element}. Please select a different database."
+    )
+
+    h = _get_gosh_file(gos_file_path)
+    with _gosh_files_lock:
+        conventions = h["metadata/edges_info"]
+        if subshell not in conventions:
+            raise ValueError(error_message)
+        table = conventions[subshell].attrs["table"]
+        occupancy_ratio = conventions[subshell].attrs["occupancy_ratio"]
+        stem = f"/{element}/{table}"
+        if stem not in h:
+            raise ValueError(error_message)
+        gos_group = h[stem]
+        gos = gos_group["data"][:]
+        q = gos_group["q"][:]
+        free_energies = gos_group["free_energies"][:]
+        doi = h["/metadata/data_ref"].attrs["data_doi"]
+
+    for array in (gos, q, free_energies):
+        array.flags.writeable = False
+    return gos, q, free_energies, occupancy_ratio, doi
+
 
 class GoshGOS(TabulatedGOS):
     """Read Generalized Oscillator Strength from a GOSH database.
@@ -89,11 +177,7 @@ class GoshGOS(TabulatedGOS):
         """
 
         if gos_file_path is None:
-            gos_file_path = pooch.retrieve(
-                url=_GOSH_URL,
-                known_hash=_GOSH_KNOWN_HASH,
-                progressbar=preferences.General.show_progressbar,
-            )
+            gos_file_path = _get_default_gosh_file_path()
         self.gos_file_path = gos_file_path
         super().__init__(element_subshell=element_subshell)
 
@@ -104,30 +188,9 @@ class GoshGOS(TabulatedGOS):
             f"\tSubshell: {self.subshell}"
             f"\tOnset Energy = {self.onset_energy}"
         )
-        element = self.element
-        subshell = self.subshell
-
-        error_message = (
-            "The GOSH Parametrized GOS database does not "
-            f"contain a valid entry the {subshell} subshell "
-            f"of {element}. Please select a different database."
+        gos, q, free_energies, self.subshell_factor, doi = _read_gosh_table(
+            os.fspath(self.gos_file_path), self.element, self.subshell
         )
-
-        with h5py.File(self.gos_file_path, "r") as h:
-            conventions = h["metadata/edges_info"]
-            if subshell not in conventions:
-                raise ValueError(error_message)
-            table = conventions[subshell].attrs["table"]
-            self.subshell_factor = conventions[subshell].attrs["occupancy_ratio"]
-            stem = f"/{element}/{table}"
-            if stem not in h:
-                raise ValueError(error_message)
-            gos_group = h[stem]
-            gos = gos_group["data"][:]
-            q = gos_group["q"][:]
-            free_energies = gos_group["free_energies"][:]
-            doi = h["/metadata/data_ref"].attrs["data_doi"]
-
         gos = np.squeeze(gos.T)
         self.doi = doi
         self.gos_array = gos
@@ -16,11 +16,10 @@
 # You should have received a copy of the GNU General Public License
 # along with exSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
-import math
 import logging
 
 import numpy as np
-from scipy import integrate, interpolate, constants
+from scipy import interpolate, constants
 
 from exspy.misc.eels.base_gos import BaseGOS
 
@@ -62,6 +61,9 @@ XU = [
 
 R = constants.value("Rydberg constant times hc in eV")
 
+# Gauss-Legendre nodes and weights used to integrate the GOS in log(q)
+_QUADRATURE_NODES, _QUADRATURE_WEIGHTS = np.polynomial.legendre.leggauss(128)
+
 
 class HydrogenicGOS(BaseGOS):
 
@@ -159,35 +161,30 @@ class HydrogenicGOS(BaseGOS):
         self.energy_shift = energy_shift
         gamma = 1 + E0 / 511.06
         T = 511060 * (1 - 1 / gamma**2) / 2
-        qint = np.zeros((self.energy_axis.shape[0]))
-        for i, E in enumerate(self.energy_axis + energy_shift):
-            qa0sqmin = (E**2) / (4 * R * T) + (E**3) / (8 * gamma**3 * R * T**2)
-            p02 = T / (R * (1 - 2 * T / 511060))
-            pp2 = p02 - E / R * (gamma - E / 1022120)
-            qa0sqmax = qa0sqmin + 4 * np.sqrt(p02 * pp2) * (math.sin(angle / 2)) ** 2
-
-            # dsbyde IS THE ENERGY-DIFFERENTIAL X-SECN (barn/eV/atom)
-            qint[i] = (
-                3.5166e8
-                * (R / T)
-                * (R / E)
-                * (
-                    integrate.quad(
-                        lambda x: self.gosfunc(E, np.exp(x)),
-                        math.log(qa0sqmin),
-                        math.log(qa0sqmax),
-                    )[0]
-                )
-            )
+        E = self.energy_axis + energy_shift
+        qa0sqmin, qa0sqmax = self._get_qa0sq_limits(E, angle, E0)
+        # Fixed order Gauss-Legendre quadrature in log(q) evaluated for all
+        # the energies at once
+        x1 = np.log(qa0sqmin)[:, np.newaxis]
+        x2 = np.log(qa0sqmax)[:, np.newaxis]
+        x = (x2 + x1) / 2 + (x2 - x1) / 2 * _QUADRATURE_NODES
+        integral = (
+            (x2 - x1)[:, 0]
+            / 2
+            * (self.gosfunc(E[:, np.newaxis], np.exp(x)) @ _QUADRATURE_WEIGHTS)
+        )
+        # dsbyde IS THE ENERGY-DIFFERENTIAL X-SECN (barn/eV/atom)
+        qint = 3.5166e8 * (R / T) * (R / E) * integral
         self.qint = qint
         return interpolate.make_interp_spline(
-            self.energy_axis + energy_shift,
+            E,
             qint,
             k=1,
         )
 
     def gosfuncK(self, E, qa02):
         # gosfunc calculates (=DF/DE) which IS PER EV AND PER ATOM
+        # E and qa02 can be arrays, they are broadcasted against each other
         z = self.Z
         r = 13.606
         zs = 1.0
@@ -198,27 +195,23 @@ class HydrogenicGOS(BaseGOS):
 
         q = qa02 / zs**2
         kh2 = E / (r * zs**2) - 1
-        akh = np.sqrt(abs(kh2))
-        if akh < 0.01:
-            akh = 0.01
-        if kh2 >= 0.0:
-            d = 1 - np.e ** (-2 * np.pi / akh)
+        akh = np.maximum(np.sqrt(abs(kh2)), 0.01)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            # Both branches are computed and the right one is selected
+            d = 1 - np.exp(-2 * np.pi / akh)
             bp = np.arctan(2 * akh / (q - kh2 + 1))
-            if bp < 0:
-                bp = bp + np.pi
-            c = np.e ** ((-2 / akh) * bp)
-        else:
-            d = 1
+            bp = np.where(bp < 0, bp + np.pi, bp)
+            c = np.exp((-2 / akh) * bp)
             y = -1 / akh * np.log((q + 1 - kh2 + 2 * akh) / (q + 1 - kh2 - 2 * akh))
-            c = np.e**y
+        above = kh2 >= 0.0
+        d = np.where(above, d, 1)
+        c = np.where(above, c, np.exp(y))
         a = ((q - kh2 + 1) ** 2 + 4 * kh2) ** 3
         return 128 * rnk * E / (r * zs**4) * c / d * (q + kh2 / 3 + 1 / 3) / (a * r)
 
     def gosfuncL(self, E, qa02):
         # gosfunc calculates (=DF/DE) which IS PER EV AND PER ATOM
-        # Note: quad function only works with qa02 due to IF statements in
-        # function
-
+        # E and qa02 can be arrays, they are broadcasted against each other
         z = self.Z
         r = 13.606
         zs = z - 0.35 * (8 - 1) - 1.7
@@ -237,42 +230,38 @@ class HydrogenicGOS(BaseGOS):
         q = qa02 / zs**2
         kh2 = E / (r * zs**2) - 0.25
         akh = np.sqrt(abs(kh2))
-        if kh2 >= 0.0:
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            # Both branches are computed and the right one is selected
             d = 1 - np.exp(-2 * np.pi / akh)
             bp = np.arctan(akh / (q - kh2 + 0.25))
-            if bp < 0:
-                bp = bp + np.pi
+            bp = np.where(bp < 0, bp + np.pi, bp)
             c = np.exp((-2 / akh) * bp)
-        else:
-            d = 1
             y = -1 / akh * np.log((q + 0.25 - kh2 + akh) / (q + 0.25 - kh2 - akh))
-            c = np.exp(y)
-
-        if E - el1 <= 0:
-            g = (
-                2.25 * q**4
-                - (0.75 + 3 * kh2) * q**3
-                + (0.59375 - 0.75 * kh2 - 0.5 * kh2**2) * q * q
-                + (0.11146 + 0.85417 * kh2 + 1.8833 * kh2 * kh2 + kh2**3) * q
-                + 0.0035807
-                + kh2 / 21.333
-                + kh2 * kh2 / 4.5714
-                + kh2**3 / 2.4
-                + kh2**4 / 4
-            )
-
-            a = ((q - kh2 + 0.25) ** 2 + kh2) ** 5
-        else:
-            g = (
-                q**3
-                - (5 / 3 * kh2 + 11 / 12) * q**2
-                + (kh2 * kh2 / 3 + 1.5 * kh2 + 65 / 48) * q
-                + kh2**3 / 3
-                + 0.75 * kh2 * kh2
-                + 23 / 48 * kh2
-                + 5 / 64
-            )
-            a = ((q - kh2 + 0.25) ** 2 + kh2) ** 4
+        above = kh2 >= 0.0
+        d = np.where(above, d, 1)
+        c = np.where(above, c, np.exp(y))
+
+        below_l1 = E - el1 <= 0
+        g = np.where(
+            below_l1,
+            2.25 * q**4
+            - (0.75 + 3 * kh2) * q**3
+            + (0.59375 - 0.75 * kh2 - 0.5 * kh2**2) * q * q
+            + (0.11146 + 0.85417 * kh2 + 1.8833 * kh2 * kh2 + kh2**3) * q
+            + 0.0035807
+            + kh2 / 21.333
+            + kh2 * kh2 / 4.5714
+            + kh2**3 / 2.4
+            + kh2**4 / 4,
+            q**3
+            - (5 / 3 * kh2 + 11 / 12) * q**2
+            + (kh2 * kh2 / 3 + 1.5 * kh2 + 65 / 48) * q
+            + kh2**3 / 3
+            + 0.75 * kh2 * kh2
+            + 23 / 48 * kh2
+            + 5 / 64,
+        )
+        a = ((q - kh2 + 0.25) ** 2 + kh2) ** np.where(below_l1, 5, 4)
         rf = ((E + 0.1 - el3) / 1.8 / z / z) ** u
         # The following commented lines are to give a more accurate GOS
         # for edges presenting white lines. However, this is not relevant
@@ -17,14 +17,15 @@
 # along with exSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
 from collections.abc import Iterable
+import functools
+from pathlib import Path
 import numpy as np
 import numbers
 import copy
+import sys
 
 from exspy.misc.elements import elements as elements_db
-from exspy.misc.eds.ffast_mac import ffast_mac_db as ffast_mac
 from exspy.misc.eds import utils as utils_eds
-from hyperspy.misc.utils import stack
 
 
 __all__ = [
@@ -103,11 +104,11 @@ def weight_to_atomic(weight_percent, elements="auto"):
     array([ 93.19698614,   6.80301386])
 
     """
-    from hyperspy.signals import BaseSignal
-
     elements = _elements_auto(weight_percent, elements)
 
-    if isinstance(weight_percent[0], BaseSignal):
+    if _is_signal(weight_percent[0]):
+        from hyperspy.misc.utils import stack
+
         atomic_percent = stack(weight_percent)
         atomic_percent.data = _weight_to_atomic(atomic_percent.data, elements)
         atomic_percent.data = np.nan_to_num(atomic_percent.data)
@@ -184,10 +185,10 @@ def atomic_to_weight(atomic_percent, elements="auto"):
     array([ 88.00501989,  11.99498011])
 
     """
-    from hyperspy.signals import BaseSignal
-
     elements = _elements_auto(atomic_percent, elements)
-    if isinstance(atomic_percent[0], BaseSignal):
+    if _is_signal(atomic_percent[0]):
+        from hyperspy.misc.utils import stack
+
         weight_percent = stack(atomic_percent, show_progressbar=False)
         weight_percent.data = _atomic_to_weight(weight_percent.data, elements)
         weight_percent = weight_percent.split()
@@ -290,10 +291,10 @@ def density_of_mixture(weight_percent, elements="auto", mean="harmonic"):
     8.6903187973131466
 
     """
-    from hyperspy.signals import BaseSignal
-
     elements = _elements_auto(weight_percent, elements)
-    if isinstance(weight_percent[0], BaseSignal):
+    if _is_signal(weight_percent[0]):
+        from hyperspy.misc.utils import stack
+
         density = weight_percent[0]._deepcopy_with_new_data(
             _density_of_mixture(stack(weight_percent).data, elements, mean=mean)
         )
@@ -338,8 +339,36 @@ def mass_absorption_coefficient(element, energies):
     S.A., and Zucker, D.S. (2005), X-Ray Form Factor, Attenuation and
     Scattering Tables (version 2.1).
     """
-    energies_db = np.array(ffast_mac[element].energies_keV)
-    macs = np.array(ffast_mac[element].mass_absorption_coefficient_cm2g)
+    energies = _get_energies(energies)
+    return np.nan_to_num(_mass_absorption_coefficients([element], energies)[0])
+
+
+@functools.lru_cache(maxsize=None)
+def _ffast_mac_table():
+    """Load the packed table of the mass absorption coefficients.
+
+    The table of Chantler2005 is stored in ``eds/ffast_mac.npz``, with the
+    energies and mass absorption coefficients of all elements concatenated,
+    and is loaded on first use.
+
+    Returns
+    -------
+    index: dict
+        The index of each element in `offsets`.
+    offsets: numpy.ndarray
+        The table of the i-th element is ``offsets[i]:offsets[i + 1]``.
+    energies, macs: numpy.ndarray
+        The concatenated energies in keV and mass absorption coefficients
+        in cm^2/g.
+    """
+    filename = Path(__file__).parent / "eds" / "ffast_mac.npz"
+    with np.load(filename) as f:
+        index = {element: i for i, element in enumerate(f["elements"].tolist())}
+        return index, f["offsets"], f["energies"], f["macs"]
+
+
+def _get_energies(energies):
+    """Replace the names of X-ray lines by their energy."""
     energies = copy.copy(energies)
     if isinstance(energies, str):
         energies = utils_eds._get_energy_xray_line(energies)
@@ -347,16 +376,58 @@ def mass_absorption_coefficient(element, energies):
         for i, energy in enumerate(energies):
             if isinstance(energy, str):
                 energies[i] = utils_eds._get_energy_xray_line(energy)
-    index = np.searchsorted(energies_db, energies)
-    mac_res = np.exp(
-        np.log(macs[index - 1])
-        + np.log(macs[index] / macs[index - 1])
-        * (
-            np.log(energies / energies_db[index - 1])
-            / np.log(energies_db[index] / energies_db[index - 1])
-        )
-    )
-    return np.nan_to_num(mac_res)
+    return energies
+
+
+def _mass_absorption_coefficients(elements, energies):
+    """Interpolate the mass absorption coefficients on a log-log scale.
+
+    Parameters
+    ----------
+    elements: list of str
+        The element symbols of the absorbers.
+    energies: float or array of float
+        The energies of the X-ray in keV.
+
+    Returns
+    -------
+    numpy.ndarray of shape ``(len(elements),) + np.shape(energies)``
+        The mass absorption coefficients, which are zero below the lowest
+        tabulated energy.
+
+    Raises
+    ------
+    AttributeError
+        If an element is not in the table.
+    ValueError
+        If an energy is above the highest tabulated energy.
+    """
+    index, offsets, energies_db, macs = _ffast_mac_table()
+    energies = np.asarray(energies, dtype=float)
+    mac_res = np.empty((len(elements),) + energies.shape)
+    for i, element in enumerate(elements):
+        if element not in index:
+            raise AttributeError(
+                f"{element} is not in the mass absorption coefficient database."
+            )
+        start, stop = offsets[index[element]], offsets[index[element] + 1]
+        if np.any(energies > energies_db[stop - 1]):
+            raise ValueError(
+                f"The mass absorption coefficients of {element} are only "
+                f"tabulated up to {energies_db[stop - 1]} keV."
+            )
+        position = start + np.searchsorted(energies_db[start:stop], energies)
+        position = np.clip(position, start + 1, stop - 1)
+        energies0, energies1 = energies_db[position - 1], energies_db[position]
+        macs0, macs1 = macs[position - 1], macs[position]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mac = np.exp(
+                np.log(macs0)
+                + np.log(macs1 / macs0)
+                * (np.log(energies / energies0) / np.log(energies1 / energies0))
+            )
+        mac_res[i] = np.where(energies < energies_db[start], 0.0, mac)
+    return mac_res
 
 
 def _mass_absorption_mixture(weight_percent, elements, energies):
@@ -401,18 +472,15 @@ def _mass_absorption_mixture(weight_percent, elements, energies):
     """
     if len(elements) != len(weight_percent):
         raise ValueError("Elements and weight_fraction should have the same length")
+    mac_res = np.nan_to_num(
+        _mass_absorption_coefficients(elements, _get_energies(energies))
+    )
     if isinstance(weight_percent[0], Iterable):
-        weight_fraction = np.array(weight_percent)
+        weight_fraction = np.array(weight_percent, dtype=float)
         weight_fraction /= np.sum(weight_fraction, 0)
-        mac_res = np.zeros([len(energies)] + list(weight_fraction.shape[1:]))
-        for element, weight in zip(elements, weight_fraction):
-            mac_re = mass_absorption_coefficient(element, energies)
-            mac_res += np.array([weight * ma for ma in mac_re])
-        return mac_res
+        # (elements, energies) x (elements, pixels) -> (energies, pixels)
+        return np.tensordot(mac_res, weight_fraction, axes=(0, 0))
     else:
-        mac_res = np.array(
-            [mass_absorption_coefficient(el, energies) for el in elements]
-        )
         mac_res = np.dot(weight_percent, mac_res) / np.sum(weight_percent, 0)
         return mac_res
 
@@ -461,11 +529,11 @@ def mass_absorption_mixture(weight_percent, elements="auto", energies="auto"):
     Scattering Tables (version 2.1).
 
     """
-    from hyperspy.signals import BaseSignal
-
     elements = _elements_auto(weight_percent, elements)
     energies = _lines_auto(weight_percent, energies)
-    if isinstance(weight_percent[0], BaseSignal):
+    if _is_signal(weight_percent[0]):
+        from hyperspy.misc.utils import stack
+
         weight_per = np.array([wt.data for wt in weight_percent])
         mac_res = stack(
             [weight_percent[0].deepcopy()] * len(energies), show_progressbar=False
@@ -526,3 +594,10 @@ def _elements_auto(composition, elements):
                     else:
                         elements.append(compo.metadata.Sample.elements[0])
     return elements
+
+
+def _is_signal(obj):
+    # a signal can only be given if hyperspy has already been imported, which
+    # avoids importing hyperspy when the composition is given as arrays
+    signal = sys.modules.get("hyperspy.signal")
+    return signal is not None and isinstance(obj, signal.BaseSignal)
@@ -0,0 +1,779 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The exSpy developers
+#
+# This file is part of exSpy.
+#
+# exSpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# exSpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with exSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+"""Multifit helpers shared by the EELS and EDS models."""
+
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+from scipy.optimize import lsq_linear
+
+from hyperspy.defaults_parser import preferences
+from hyperspy.external.progressbar import progressbar
+
+
+# The iteration paths implemented by the models, the others are passed to
+# hyperspy
+ITERPATHS = ("hilbert", "coarse-to-fine")
+
+
+def _hilbert_curve(n):
+    """Return the coordinates of the points of the Hilbert curve filling a
+    square of side n, a power of two."""
+    t = np.arange(n * n)
+    x = np.zeros_like(t)
+    y = np.zeros_like(t)
+    s = 1
+    while s < n:
+        rx = 1 & (t // 2)
+        ry = 1 & (t ^ rx)
+        # Rotate the quadrant
+        swap = ry == 0
+        flip = swap & (rx == 1)
+        x = np.where(flip, s - 1 - x, x)
+        y = np.where(flip, s - 1 - y, y)
+        x, y = np.where(swap, y, x), np.where(swap, x, y)
+        x += s * rx
+        y += s * ry
+        t //= 4
+        s *= 2
+    return x, y
+
+
+def get_iterpath(nav_shape, iterpath="flyback"):
+    """Return the order in which the pixels are fitted.
+
+    Parameters
+    ----------
+    nav_shape : tuple of int
+        The navigation shape in array order.
+    iterpath : {"flyback", "serpentine", "hilbert", "coarse-to-fine"}
+        The iteration path:
+
+        * "flyback": the pixels are visited in raster order.
+        * "serpentine": the direction of the fastest axis is reversed at
+          every row.
+        * "hilbert": the pixels are visited along a Hilbert curve, so that
+          consecutive pixels are always close. Only for navigation
+          dimensions up to two.
+        * "coarse-to-fine": the pixels on a coarse grid are visited first,
+          then the grid is refined by a factor of two until all the
+          pixels are visited.
+
+    Returns
+    -------
+    list of tuple
+        For each pixel, its indices in array order and the distance to
+        the fitted pixels from which its starting values can be estimated.
+
+    """
+    nav_shape = tuple(nav_shape)
+    if iterpath == "flyback":
+        return [(index, 1) for index in np.ndindex(nav_shape)]
+    elif iterpath == "serpentine":
+        path = []
+        for outer in np.ndindex(nav_shape[:-1]):
+            inner = range(nav_shape[-1])
+            if sum(outer) % 2:
+                inner = reversed(inner)
+            path.extend((outer + (i,), 1) for i in inner)
+        return path
+    elif iterpath == "hilbert":
+        if len(nav_shape) > 2:
+            raise ValueError(
+                "The Hilbert iteration path is only available for navigation "
+                "dimensions up to two."
+            )
+        if len(nav_shape) < 2:
+            return get_iterpath(nav_shape, "flyback")
+        n = 1 << int(np.ceil(np.log2(max(nav_shape))))
+        x, y = _hilbert_curve(n)
+        inside = (y < nav_shape[0]) & (x < nav_shape[1])
+        return [((int(i), int(j)), 1) for i, j in zip(y[inside], x[inside])]
+    elif iterpath == "coarse-to-fine":
+        path = []
+        visited = np.zeros(nav_shape, dtype=bool)
+        step = 1 << max(int(np.ceil(np.log2(max(nav_shape)))) - 1, 0)
+        while step >= 1:
+            grid = np.zeros(nav_shape, dtype=bool)
+            grid[(slice(None, None, step),) * len(nav_shape)] = True
+            path.extend(
+                (tuple(int(i) for i in index), step)
+                for index in zip(*np.nonzero(grid & ~visited))
+            )
+            visited |= grid
+            step //= 2
+        return path
+    else:
+        raise ValueError(
+            "`iterpath` must be one of 'flyback', 'serpentine', 'hilbert' or "
+            f"'coarse-to-fine', not '{iterpath}'."
+        )
+
+
+def _seed_from_neighbours(parameters, fitted, index, distance):
+    """Set the values of the parameters to the mean of their values in the
+    fitted pixels within the given distance of the pixel."""
+    window = tuple(slice(max(i - distance, 0), i + distance + 1) for i in index)
+    neighbours = fitted[window]
+    if not neighbours.any():
+        return
+    for parameter in parameters:
+        values = parameter.map["values"][window][neighbours].mean(axis=0)
+        if parameter._number_of_elements == 1:
+            parameter.value = float(values)
+        else:
+            parameter.value = tuple(values)
+
+
+def _get_checkpoint_key(component, parameter):
+    return f"{component.name}/{parameter.name}"
+
+
+def save_checkpoint(model, checkpoint, done):
+    """Write the parameter maps and the fit statistics of the model to a
+    numpy ``.npz`` file.
+
+    The file is first written next to its destination and then renamed,
+    so that an interrupted write does not corrupt an existing checkpoint.
+
+    Parameters
+    ----------
+    model : hyperspy.models.model1d.Model1D
+        The model being fitted.
+    checkpoint : str or pathlib.Path
+        The path of the checkpoint file.
+    done : numpy.ndarray of bool
+        The pixels that are fitted, in array order.
+
+    """
+    checkpoint = Path(checkpoint)
+    arrays = {
+        _get_checkpoint_key(component, parameter): parameter.map
+        for component in model
+        for parameter in component.parameters
+    }
+    arrays["chisq"] = model.chisq.data
+    arrays["dof"] = model.dof.data
+    arrays["done"] = done
+    tmp = checkpoint.with_name(checkpoint.name + ".tmp")
+    with open(tmp, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp, checkpoint)
+
+
+def load_checkpoint(model, checkpoint):
+    """Restore the parameter maps and the fit statistics of the model from
+    a file written by :py:func:`save_checkpoint`.
+
+    Parameters
+    ----------
+    model : hyperspy.models.model1d.Model1D
+        The model, which must have the same components and navigation
+        shape as the checkpointed one.
+    checkpoint : str or pathlib.Path
+        The path of the checkpoint file.
+
+    Returns
+    -------
+    numpy.ndarray of bool
+        The pixels that are fitted, in array order.
+
+    """
+    with np.load(checkpoint) as f:
+        done = f["done"]
+        if done.shape != model.chisq.data.shape:
+            raise ValueError(
+                f"The navigation shape of the checkpoint {done.shape} does not "
+                f"match the shape of the model {model.chisq.data.shape}."
+            )
+        maps = {}
+        for component in model:
+            for parameter in component.parameters:
+                key = _get_checkpoint_key(component, parameter)
+                if key not in f or f[key].dtype != parameter.map.dtype:
+                    raise ValueError(
+                        f"The parameter `{key}` of the model does not match the "
+                        "checkpoint."
+                    )
+                maps[parameter] = f[key]
+        for parameter, map_ in maps.items():
+            parameter.map[...] = map_
+        model.chisq.data[...] = f["chisq"]
+        model.dof.data[...] = f["dof"]
+    return done
+
+
+def multifit_along_path(
+    model,
+    iterpath="flyback",
+    seed_from_neighbours=False,
+    mask=None,
+    fetch_only_fixed=False,
+    show_progressbar=None,
+    checkpoint=None,
+    checkpoint_interval=60.0,
+    resume=False,
+    **kwargs,
+):
+    """Fit the pixels of the model in the order given by ``iterpath``.
+
+    Parameters
+    ----------
+    model : hyperspy.models.model1d.Model1D
+        The model to fit.
+    iterpath : str
+        See :py:func:`get_iterpath`.
+    seed_from_neighbours : bool
+        If True, the free parameters start from the mean of their values
+        in the neighbouring pixels that are already fitted, when there are
+        any.
+    mask : numpy.ndarray of bool or None
+        Pixels where the mask is True are not fitted.
+    fetch_only_fixed : bool
+        If True, only the stored values of the fixed parameters are fetched
+        before fitting each pixel.
+    show_progressbar : None or bool
+        If True, display a progress bar. If None, the default from the
+        preferences settings is used.
+    checkpoint : None, str or pathlib.Path
+        If not None, the path of a file where the parameter maps and the fit
+        statistics are saved every ``checkpoint_interval`` seconds and at the
+        end of the fit, see :py:func:`save_checkpoint`.
+    checkpoint_interval : float
+        The minimum time between two checkpoints, in seconds.
+    resume : bool
+        If True, the maps are restored from ``checkpoint`` and the pixels
+        that are already fitted are skipped.
+    **kwargs : dict
+        Passed to the ``fit`` method of the model.
+
+    """
+    if show_progressbar is None:
+        show_progressbar = preferences.General.show_progressbar
+    if resume and checkpoint is None:
+        raise ValueError("`checkpoint` is required to resume the fit.")
+    if model.axes_manager.navigation_dimension == 0:
+        model.fit(**kwargs)
+        return
+    nav_shape = tuple(model.axes_manager._navigation_shape_in_array)
+    fitted = np.zeros(nav_shape, dtype=bool)
+    if resume:
+        fitted |= load_checkpoint(model, checkpoint)
+    to_fit = ~fitted
+    if mask is not None:
+        to_fit &= ~np.asarray(mask, dtype=bool).reshape(nav_shape)
+    path = [
+        (index, distance)
+        for index, distance in get_iterpath(nav_shape, iterpath)
+        if to_fit[index]
+    ]
+    parameters = [
+        parameter
+        for component in model
+        for parameter in component.parameters
+        if parameter.free
+    ]
+    last_checkpoint = time.monotonic()
+    with model.suspend_update(update_on_resume=True), progressbar(
+        total=len(path), disable=not show_progressbar, leave=True
+    ) as pbar:
+        try:
+            for index, distance in path:
+                with model.axes_manager.events.indices_changed.suppress():
+                    model.axes_manager.indices = index[::-1]
+                model.fetch_stored_values(only_fixed=fetch_only_fixed)
+                if seed_from_neighbours:
+                    _seed_from_neighbours(parameters, fitted, index, distance)
+                model.fit(**kwargs)
+                fitted[index] = True
+                pbar.update(1)
+                if (
+                    checkpoint is not None
+                    and time.monotonic() - last_checkpoint >= checkpoint_interval
+                ):
+                    save_checkpoint(model, checkpoint, fitted)
+                    last_checkpoint = time.monotonic()
+        finally:
+            # Also save when the fit is interrupted
+            if checkpoint is not None:
+                save_checkpoint(model, checkpoint, fitted)
+
+
+def bin_signal(signal, scale):
+    """Average the navigation pixels of a signal by blocks.
+
+    Parameters
+    ----------
+    signal : hyperspy.signal.BaseSignal
+        A signal with one signal dimension.
+    scale : list of int
+        The binning factors of the navigation axes in natural order. The
+        pixels that do not fill a block are cropped.
+
+    Returns
+    -------
+    hyperspy.signal.BaseSignal
+
+    """
+    binned = signal.rebin(scale=list(scale) + [1])
+    # Average rather than sum, so that the parameters of the binned model
+    # can be used as starting values for the unbinned one
+    n = np.prod(scale)
+    binned.data = binned.data / n
+    variance = binned.metadata.get_item("Signal.Noise_properties.variance")
+    if variance is not None:
+        binned.metadata.set_item("Signal.Noise_properties.variance", variance / n**2)
+    return binned
+
+
+def create_model_like(model, signal, exclude=(), **kwargs):
+    """Create a model with the same components as ``model`` for another
+    signal, whose navigation shape may differ. The values of the parameters
+    are not stored in the new model.
+
+    Parameters
+    ----------
+    model : hyperspy.models.model1d.Model1D
+        The model to copy.
+    signal : hyperspy.signal.BaseSignal
+        The signal of the new model.
+    exclude : tuple of str
+        The attributes of the model dictionary that are not copied.
+    **kwargs : dict
+        Passed to the ``create_model`` method of the signal.
+
+    """
+    if any(component.active_is_multidimensional for component in model):
+        raise ValueError(
+            "Components with `active_is_multidimensional` set to True are not "
+            "supported."
+        )
+    dictionary = model.as_dictionary()
+    for key in exclude:
+        dictionary[key] = None
+    nav_shape = tuple(signal.axes_manager._navigation_shape_in_array) or (1,)
+    for component in dictionary["components"]:
+        for parameter in component["parameters"]:
+            map_ = np.zeros(nav_shape, dtype=parameter["map"].dtype)
+            map_["std"].fill(np.nan)
+            parameter["map"] = map_
+    if "chisq.data" in dictionary:
+        dictionary["chisq.data"] = np.full(nav_shape, np.nan)
+    if "dof.data" in dictionary:
+        dictionary["dof.data"] = np.zeros(nav_shape)
+    return signal.create_model(dictionary=dictionary, **kwargs)
+
+
+def _set_values_from_coarser_model(model, scale, coarse_model, coarse_scale):
+    """Store the values of the free parameters of the coarse model in the
+    corresponding pixels of the model."""
+    nav_shape = model.axes_manager._navigation_shape_in_array
+    coarse_shape = coarse_model.axes_manager._navigation_shape_in_array
+    # The scales are in natural order and the shapes in array order
+    index = np.ix_(
+        *[
+            np.minimum(np.arange(n) * g // f, m - 1)
+            for n, g, f, m in zip(
+                nav_shape, scale[::-1], coarse_scale[::-1], coarse_shape
+            )
+        ]
+    )
+    for component, coarse_component in zip(model, coarse_model):
+        for parameter, coarse_parameter in zip(
+            component.parameters, coarse_component.parameters
+        ):
+            if not parameter.free:
+                continue
+            map_ = coarse_parameter.map[index]
+            is_set = map_["is_set"]
+            parameter.map["values"][is_set] = map_["values"][is_set]
+            parameter.map["std"][is_set] = np.nan
+            parameter.map["is_set"][is_set] = True
+
+
+def multifit_pyramid(model, pyramid, mask=None, **kwargs):
+    """Fit the model at increasing resolutions.
+
+    The signal is binned by each factor of ``pyramid`` in turn, from the
+    largest, and the fitted parameters of each binned model are the
+    starting values of the next one, the last one being the model itself.
+
+    Parameters
+    ----------
+    model : EELSModel or EDSModel
+        The model to fit. It must implement ``_get_binned_model``.
+    pyramid : sequence of int
+        The binning factors of the navigation axes.
+    mask : numpy.ndarray of bool or None
+        Only used to fit the unbinned model.
+    **kwargs : dict
+        Passed to the ``multifit`` method of the models.
+
+    """
+    if model.axes_manager.navigation_dimension == 0:
+        raise ValueError("The signal does not have a navigation dimension.")
+    if any(int(factor) != factor or factor < 1 for factor in pyramid):
+        raise ValueError("The binning factors must be positive integers.")
+    # The binned models are not checkpointed
+    binned_kwargs = {
+        key: value
+        for key, value in kwargs.items()
+        if key not in ("checkpoint", "checkpoint_interval", "resume")
+    }
+    coarse = None
+    for factor in sorted(set(int(factor) for factor in pyramid), reverse=True):
+        if factor == 1:
+            continue
+        scale = [min(factor, axis.size) for axis in model.axes_manager.navigation_axes]
+        binned_model = model._get_binned_model(scale)
+        if coarse is not None:
+            _set_values_from_coarser_model(binned_model, scale, *coarse)
+        else:
+            # The pixels of the coarsest model start from the current values,
+            # which must be stored in all pixels to fit in parallel
+            binned_model.assign_current_values_to_all()
+        binned_model.multifit(**binned_kwargs)
+        coarse = (binned_model, scale)
+    if coarse is not None:
+        scale = [1] * model.axes_manager.navigation_dimension
+        _set_values_from_coarser_model(model, scale, *coarse)
+    model.multifit(mask=mask, **kwargs)
+
+
+def dispatch_multifit(
+    model,
+    base_multifit,
+    mask=None,
+    fetch_only_fixed=False,
+    iterpath=None,
+    seed_from_neighbours=False,
+    pyramid=None,
+    checkpoint=None,
+    checkpoint_interval=60.0,
+    resume=False,
+    show_progressbar=None,
+    **kwargs,
+):
+    """Fit the model with :py:func:`multifit_pyramid`,
+    :py:func:`multifit_along_path` or the multifit of hyperspy, depending
+    on the arguments.
+
+    Parameters
+    ----------
+    model : EELSModel or EDSModel
+        The model to fit.
+    base_multifit : callable
+        The :py:meth:`~hyperspy.model.BaseModel.multifit` method of the
+        model, used with the iteration paths of hyperspy when the pixels
+        are not seeded from their neighbours and the fit is not
+        checkpointed.
+    pyramid : sequence of int or None
+        If not None, the binning factors passed to
+        :py:func:`multifit_pyramid`.
+    mask, fetch_only_fixed, iterpath, seed_from_neighbours, checkpoint,
+    checkpoint_interval, resume, show_progressbar
+        See :py:func:`multifit_along_path`.
+    **kwargs : dict
+        Passed to the multifit of hyperspy or to the ``fit`` method of the
+        model.
+
+    """
+    if pyramid is not None:
+        return multifit_pyramid(
+            model,
+            pyramid,
+            mask=mask,
+            fetch_only_fixed=fetch_only_fixed,
+            iterpath=iterpath,
+            seed_from_neighbours=seed_from_neighbours,
+            checkpoint=checkpoint,
+            checkpoint_interval=checkpoint_interval,
+            resume=resume,
+            show_progressbar=show_progressbar,
+            **kwargs,
+        )
+    if (
+        iterpath in ITERPATHS
+        or seed_from_neighbours
+        or checkpoint is not None
+        or resume
+    ):
+        return multifit_along_path(
+            model,
+            iterpath=iterpath or "serpentine",
+            seed_from_neighbours=seed_from_neighbours,
+            mask=mask,
+            fetch_only_fixed=fetch_only_fixed,
+            show_progressbar=show_progressbar,
+            checkpoint=checkpoint,
+            checkpoint_interval=checkpoint_interval,
+            resume=resume,
+            **kwargs,
+        )
+    return base_multifit(
+        mask=mask,
+        fetch_only_fixed=fetch_only_fixed,
+        iterpath=iterpath,
+        show_progressbar=show_progressbar,
+        **kwargs,
+    )
+
+
+def batched_lstsq(design, data, nonnegative=None, max_iterations=None):
+    """Solve the linear least squares problems ``design @ x = y`` for all the
+    rows ``y`` of ``data`` at once.
+
+    The unconstrained problems share the pseudo-inverse of the design matrix.
+    With non-negativity constraints, the active set method of Lawson and
+    Hanson is run on all the rows together: at each iteration, the rows are
+    grouped by the set of coefficients clamped to zero, which share the
+    pseudo-inverse of the reduced design matrix. The rows that do not
+    converge within ``max_iterations`` are solved one by one with
+    :py:func:`scipy.optimize.lsq_linear`.
+
+    Parameters
+    ----------
+    design : numpy.ndarray
+        The design matrix, of shape (channels, parameters).
+    data : numpy.ndarray
+        The data, of shape (rows, channels).
+    nonnegative : None or numpy.ndarray of bool
+        The coefficients constrained to be non-negative, of shape
+        (parameters,).
+    max_iterations : None or int
+        The maximum number of iterations of the active set method. If None,
+        three times the number of parameters.
+
+    Returns
+    -------
+    numpy.ndarray
+        The coefficients, of shape (rows, parameters).
+
+    """
+    coefficients = data @ np.linalg.pinv(design).T
+    if nonnegative is None or not np.any(nonnegative):
+        return coefficients
+    nonnegative = np.asarray(nonnegative, dtype=bool)
+    if max_iterations is None:
+        max_iterations = 3 * design.shape[1]
+    # When the unconstrained solution is feasible, it is the solution
+    todo = np.flatnonzero(np.any(coefficients[:, nonnegative] < 0, axis=1))
+    clamped = np.zeros((todo.size, design.shape[1]), dtype=bool)
+    for _ in range(max_iterations):
+        if not todo.size:
+            break
+        y = data[todo]
+        x = coefficients[todo]
+        clamped |= nonnegative & (x < 0)
+        patterns, inverse = np.unique(clamped, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        for i, pattern in enumerate(patterns):
+            rows = inverse == i
+            x[rows] = 0
+            if not pattern.all():
+                x[np.ix_(rows, ~pattern)] = (
+                    y[rows] @ np.linalg.pinv(design[:, ~pattern]).T
+                )
+        coefficients[todo] = x
+        # Release the clamped coefficients whose gradient shows that the
+        # residual would decrease if they were positive
+        gradient = (y - x @ design.T) @ design
+        tolerance = 1e-10 * np.abs(y @ design).max(axis=1, keepdims=True)
+        release = clamped & (gradient > tolerance)
+        clamped &= ~release
+        converged = ~np.any(nonnegative & (x < 0), axis=1) & ~release.any(axis=1)
+        todo = todo[~converged]
+        clamped = clamped[~converged]
+    if todo.size:
+        lower_bounds = np.where(nonnegative, 0, -np.inf)
+        for index in todo:
+            coefficients[index] = lsq_linear(
+                design, data[index], bounds=(lower_bounds, np.inf), method="bvls"
+            ).x
+    return coefficients
+
+
+def _poisson_nll(mean, data):
+    """The negative Poisson log-likelihood of each row, without the terms
+    which do not depend on the mean."""
+    return np.sum(mean - data * np.log(mean), axis=1)
+
+
+def batched_poisson_mle(
+    design, data, nonnegative, offset=0.0, max_iterations=100, tolerance=1e-7
+):
+    """Maximise the Poisson likelihood of the rows of ``data`` for the mean
+    ``design @ x + offset``, for all the rows at once.
+
+    The coefficients are updated with projected Newton steps, which stop
+    short of the boundary where the mean is zero and are halved when required
+    to increase the likelihood. The non-negative coefficients which would be
+    negative after a step are set to zero. As for interior point methods, a
+    small count is added to the data to keep the mean positive in the
+    channels without counts and is decreased as the iterations converge.
+    The iterations start from the least squares solution and stop for each
+    row when the changes of the coefficients or of the likelihood are
+    smaller than ``tolerance``, relative to the largest count of the row and
+    to the likelihood respectively.
+
+    Parameters
+    ----------
+    design : numpy.ndarray
+        The design matrix, of shape (channels, parameters).
+    data : numpy.ndarray
+        The counts, of shape (rows, channels).
+    nonnegative : numpy.ndarray of bool
+        The coefficients constrained to be non-negative, of shape
+        (parameters,).
+    offset : float or numpy.ndarray
+        The fixed part of the mean, broadcastable to the shape of ``data``.
+    max_iterations : int
+        The maximum number of iterations.
+    tolerance : float
+        The relative change below which the iterations stop.
+
+    Returns
+    -------
+    numpy.ndarray
+        The coefficients, of shape (rows, parameters).
+
+    """
+    nonnegative = np.asarray(nonnegative, dtype=bool)
+    offset = np.broadcast_to(offset, data.shape)
+    n_parameters = design.shape[1]
+    free = ~nonnegative
+    # Normalise the columns to improve the conditioning of the Hessian
+    # matrices, e.g. for the coefficients of a polynomial
+    scale = np.abs(design).max(axis=0)
+    scale[scale == 0] = 1
+    design = design / scale
+    # The products of the pairs of columns, to compute the upper triangles of
+    # the Hessian matrices of all the rows with a single matrix product
+    upper = np.triu_indices(n_parameters)
+    products = design[:, upper[0]] * design[:, upper[1]]
+    counts = np.maximum(data.max(axis=1, initial=0), 1.0)
+    # Small positive mean, where the mean would be zero or negative
+    tiny = 1e-10 * counts[:, None]
+
+    coefficients = batched_lstsq(design, data - offset, nonnegative)
+    if free.any():
+        # Where the least squares mean is not positive, start the free
+        # coefficients from the fit of a flat spectrum instead, which is
+        # positive for e.g. a polynomial background
+        negative = np.any(coefficients @ design.T + offset <= 0, axis=1)
+        if negative.any():
+            flat = np.maximum(data[negative].mean(axis=1, keepdims=True), 1.0)
+            flat = np.broadcast_to(flat, (negative.sum(), len(design)))
+            coefficients[np.ix_(negative, free)] = np.linalg.lstsq(
+                design[:, free], flat.T, rcond=None
+            )[0].T
+    barrier = 0.1 * counts
+    damping = np.zeros(len(data))
+    active = np.arange(len(data))
+    for _ in range(max_iterations):
+        if not active.size:
+            break
+        x = coefficients[active]
+        y = data[active] + barrier[active, None]
+        fixed = offset[active]
+        unclipped_mean = x @ design.T + fixed
+        # The rows starting with a mean which is not positive take full steps
+        feasible = np.all(unclipped_mean > 0, axis=1)
+        mean = np.maximum(unclipped_mean, tiny[active])
+        gradient = (y / mean - 1) @ design
+        hessian = np.empty((len(x), n_parameters, n_parameters))
+        hessian[:, upper[0], upper[1]] = (y / mean**2) @ products
+        hessian[:, upper[1], upper[0]] = hessian[:, upper[0], upper[1]]
+        # Levenberg-Marquardt damping of the rows whose last step failed
+        np.einsum("ijj->ij", hessian)[:] *= 1 + damping[active, None]
+
+        # Set to zero the non-negative coefficients which would be negative
+        # after the step and whose gradient points to negative values, and
+        # solve for the other coefficients
+        clamped = nonnegative & (x <= 0) & (gradient <= 0)
+        for _ in range(n_parameters):
+            clamped_step = np.where(clamped, -x, 0)
+            rhs = gradient - (hessian @ clamped_step[..., None])[..., 0]
+            rhs = np.where(clamped, 0, rhs)[..., None]
+            reduced = np.where(clamped[:, :, None] | clamped[:, None, :], 0, hessian)
+            # Avoid singular matrices for the clamped coefficients and the
+            # columns which are zero, e.g. for lines outside of the energy
+            # range
+            diagonal = np.einsum("ijj->ij", reduced)
+            diagonal[diagonal <= 0] = 1
+            try:
+                step = np.linalg.solve(reduced, rhs)[..., 0]
+            except np.linalg.LinAlgError:
+                step = (np.linalg.pinv(reduced) @ rhs)[..., 0]
+            step = np.where(clamped, clamped_step, step)
+            outside = nonnegative & (x + step < 0) & (gradient <= 0) & ~clamped
+            if not outside.any():
+                break
+            clamped |= outside
+
+        # Stop short of the boundary, and then halve the step of the rows
+        # whose likelihood would decrease
+        change = step @ design.T
+        with np.errstate(divide="ignore", invalid="ignore"):
+            boundary = np.where(change < 0, unclipped_mean / -change, np.inf)
+        length = np.where(feasible, np.minimum(1.0, 0.99 * boundary.min(axis=1)), 1.0)
+        nll = _poisson_nll(mean, y)
+        new_nll = nll.copy()
+        new = x.copy()
+        rows = np.arange(len(x))
+        for _ in range(30):
+            trial = x[rows] + length[rows, None] * step[rows]
+            trial[:, nonnegative] = np.maximum(trial[:, nonnegative], 0)
+            trial_mean = trial @ design.T + fixed[rows]
+            trial_nll = _poisson_nll(
+                np.maximum(trial_mean, tiny[active][rows]), y[rows]
+            )
+            worse = feasible[rows] & (
+                np.any(trial_mean <= 0, axis=1) | (trial_nll > nll[rows])
+            )
+            new[rows[~worse]] = trial[~worse]
+            new_nll[rows[~worse]] = trial_nll[~worse]
+            rows = rows[worse]
+            if not rows.size:
+                break
+            length[rows] /= 2
+        length[rows] = 0
+        coefficients[active] = new
+
+        # Damp the rows whose step failed, whose Hessian matrix is likely to
+        # be ill-conditioned, and decrease the barrier of the rows which are
+        # not held back by the boundary
+        damping[active[rows]] = np.maximum(10 * damping[active[rows]], 1e-3)
+        damping[active[length > 0]] /= 10
+        minimum = tolerance * counts[active]
+        small = np.all(np.abs(new - x) <= minimum[:, None], axis=1) | (
+            nll - new_nll <= tolerance * np.abs(nll)
+        )
+        converged = (
+            (barrier[active] <= minimum)
+            & small
+            & ((length > 0) | (damping[active] > 1e6))
+        )
+        barrier[active] = np.where(
+            length >= 0.5, np.maximum(barrier[active] / 10, minimum), barrier[active]
+        )
+        active = active[~converged]
+    return coefficients / scale
@@ -23,13 +23,28 @@ import numpy as np
 import math
 import logging
 
+from hyperspy.defaults_parser import preferences
+from hyperspy.external.progressbar import progressbar
 from hyperspy.misc.utils import stash_active_state
+from hyperspy.signal import BaseSignal
 from exspy.misc.eds.utils import _get_element_and_line
 
 from hyperspy.models.model1d import Model1D
 from exspy.signals.eds import EDSSpectrum
 from exspy.misc.elements import elements as elements_db
 from exspy.misc.eds import utils as utils_eds
+from exspy.docstrings.model import (
+    MULTIFIT_CHECKPOINT_PARAMETERS,
+    MULTIFIT_ITERPATH_PARAMETERS,
+    MULTIFIT_PYRAMID_PARAMETER,
+)
+from exspy.models._multifit import (
+    batched_lstsq,
+    batched_poisson_mle,
+    bin_signal,
+    create_model_like,
+    dispatch_multifit,
+)
 import hyperspy.components1d as create_component
 
 _logger = logging.getLogger(__name__)
@@ -37,6 +52,9 @@ _logger = logging.getLogger(__name__)
 eV2keV = 1000.0
 sigma2fwhm = 2 * math.sqrt(2 * math.log(2))
 
+# The number of navigation pixels solved together by `linear_multifit`
+_LINEAR_MULTIFIT_CHUNK_SIZE = 4096
+
 
 def _get_weight(element, line, weight_line=None):
     if weight_line is None:
@@ -157,6 +175,276 @@ class EDSModel(Model1D):
         dic["background_components"] = [c.name for c in self.background_components]
         return dic
 
+    def multifit(
+        self,
+        mask=None,
+        fetch_only_fixed=False,
+        iterpath=None,
+        seed_from_neighbours=False,
+        pyramid=None,
+        checkpoint=None,
+        checkpoint_interval=60.0,
+        resume=False,
+        show_progressbar=None,
+        **kwargs,
+    ):
+        """Fit the data to the model at all positions of the navigation
+        dimensions.
+
+        Parameters
+        ----------
+        mask : numpy.ndarray of bool or None, optional
+            Pixels where the mask is True are not fitted. The mask has
+            the navigation shape of the signal in array order.
+        fetch_only_fixed : bool, default False
+            If True, only the stored values of the fixed parameters are
+            fetched before fitting each pixel.
+        %s
+        %s
+        %s
+        show_progressbar : None or bool, optional
+            If True, display a progress bar. If None, the default from
+            the preferences settings is used.
+        **kwargs : dict
+            Any extra keyword argument is passed to
+            :py:meth:`~hyperspy.model.BaseModel.multifit` or, with the
+            "hilbert" and "coarse-to-fine" iteration paths, when seeding
+            from the neighbours or when checkpointing, to
+            :py:meth:`~hyperspy.model.BaseModel.fit`.
+
+        See Also
+        --------
+        * :py:meth:`~hyperspy.model.BaseModel.multifit`
+
+        """
+        return dispatch_multifit(
+            self,
+            super().multifit,
+            mask=mask,
+            fetch_only_fixed=fetch_only_fixed,
+            iterpath=iterpath,
+            seed_from_neighbours=seed_from_neighbours,
+            pyramid=pyramid,
+            checkpoint=checkpoint,
+            checkpoint_interval=checkpoint_interval,
+            resume=resume,
+            show_progressbar=show_progressbar,
+            **kwargs,
+        )
+
+    multifit.__doc__ %= (
+        MULTIFIT_ITERPATH_PARAMETERS,
+        MULTIFIT_PYRAMID_PARAMETER,
+        MULTIFIT_CHECKPOINT_PARAMETERS,
+    )
+
+    def _get_binned_model(self, scale):
+        """Return a model with the same components for the signal averaged
+        by blocks of the navigation pixels, see `multifit_pyramid`."""
+        return create_model_like(self, bin_signal(self.signal, scale))
+
+    def linear_multifit(self, mask=None, loss_function="ls", show_progressbar=None):
+        """Fit the model at all the navigation positions at once by linear
+        least squares or by Poisson maximum likelihood.
+
+        All the free parameters of the active components must be linear,
+        which is the case of the intensities of the X-ray lines and of the
+        coefficients of the polynomial background when the positions and
+        widths of the lines are fixed, as set by :py:meth:`add_family_lines`.
+        The design matrix is built once, by evaluating the model for each
+        free parameter, and the lines twinned to a main line, e.g. the other
+        lines of its family, are included in the column of the main line.
+        The parameters whose ``ext_force_positive`` attribute is True, e.g.
+        the intensities of the X-ray lines, are constrained to be
+        non-negative.
+
+        The fixed parameters must have the same value at all navigation
+        positions, except the linear ones, e.g. the coefficients of a
+        background fitted with ``fit_background(kind="multi")``, whose
+        contribution is subtracted from the data.
+
+        At low counts, the least squares estimates of the intensities are
+        biased and the Poisson maximum likelihood estimates should be
+        preferred. They are computed for all the navigation positions at
+        once by projected Newton iterations, which start from the least
+        squares solution and keep the model positive.
+
+        Parameters
+        ----------
+        mask : numpy.ndarray of bool or None, optional
+            Pixels where the mask is True are not fitted. The mask has
+            the navigation shape of the signal in array order.
+        loss_function : {"ls", "ML-poisson"}, default "ls"
+            The loss function to minimize: "ls" for least squares or
+            "ML-poisson" for the negative Poisson log-likelihood, see
+            :py:meth:`~hyperspy.model.BaseModel.fit`.
+        show_progressbar : None or bool, optional
+            If True, display a progress bar. If None, the default from
+            the preferences settings is used.
+
+        Raises
+        ------
+        ValueError
+            If a free parameter is not linear, if a fixed nonlinear parameter
+            varies with the navigation position or if the variance of the
+            noise is not the same at all navigation positions for least
+            squares.
+
+        Notes
+        -----
+        The standard deviations of the parameters are not estimated.
+
+        See Also
+        --------
+        * :py:meth:`~.EDSModel.multifit`
+
+        Examples
+        --------
+        >>> m = s.create_model()
+        >>> m.linear_multifit()
+        >>> intensities = m.get_lines_intensity()
+
+        At low counts
+
+        >>> m.linear_multifit(loss_function="ML-poisson")
+
+        """
+        if show_progressbar is None:
+            show_progressbar = preferences.General.show_progressbar
+        if loss_function not in ("ls", "ML-poisson"):
+            raise ValueError(
+                f"`loss_function` must be 'ls' or 'ML-poisson', not {loss_function!r}."
+            )
+        poisson = loss_function == "ML-poisson"
+        variance = self.signal.get_noise_variance()
+        if isinstance(variance, BaseSignal):
+            if not poisson:
+                raise ValueError(
+                    "Linear fitting requires the variance of the noise to be the "
+                    "same at all navigation positions."
+                )
+            variance = variance.data.reshape((self.chisq.data.size, -1))
+        if variance is None:
+            variance = 1.0
+        if any(component.active_is_multidimensional for component in self):
+            raise ValueError(
+                "Components with `active_is_multidimensional` set to True are not "
+                "supported."
+            )
+        components = self.active_components
+        parameters = [p for c in components for p in c.parameters if p.free]
+        if not parameters:
+            raise ValueError("The model does not have any free parameter.")
+        nonlinear = [
+            p for p in parameters if not p._linear or p._number_of_elements != 1
+        ]
+        if nonlinear:
+            raise ValueError(
+                "All the free parameters must be linear, fix the position and "
+                "width of the X-ray lines. These parameters are not linear: "
+                + ", ".join(str(p) for p in nonlinear)
+            )
+        # The fixed parameters whose value varies with the navigation
+        # position, their contribution is subtracted from the data
+        varying = {}
+        for component in components:
+            for parameter in component.parameters:
+                if parameter.free or parameter.twin is not None:
+                    continue
+                set_values = parameter.map["values"][parameter.map["is_set"]]
+                if not np.any(set_values != set_values[:1]):
+                    continue
+                if not parameter._linear or parameter._number_of_elements != 1:
+                    raise ValueError(
+                        f"The fixed nonlinear parameter {parameter} varies with "
+                        "the navigation position."
+                    )
+                varying[parameter] = np.where(
+                    parameter.map["is_set"], parameter.map["values"], parameter.value
+                ).ravel()
+
+        # Build the design matrix: the model is linear, so that each column is
+        # the difference between the model with the parameter set to one and
+        # the model with all the parameters set to zero
+        basis_parameters = parameters + list(varying)
+        stash = [(p, p.value, p.ext_bounded) for p in basis_parameters]
+        try:
+            with self.suspend_update():
+                for p in basis_parameters:
+                    # Avoid clipping to the bounds
+                    p.ext_bounded = False
+                    p.value = 0.0
+                base = self._get_current_data(onlyactive=True)
+                columns = []
+                for p in basis_parameters:
+                    p.value = 1.0
+                    columns.append(self._get_current_data(onlyactive=True) - base)
+                    p.value = 0.0
+        finally:
+            for p, value, ext_bounded in stash:
+                p.value = value
+                p.ext_bounded = ext_bounded
+        columns = np.stack(columns, axis=1)
+        design = columns[:, : len(parameters)]
+        varying_design = columns[:, len(parameters) :]
+        nonnegative = np.array([p.ext_force_positive for p in parameters])
+
+        nav_shape = self.chisq.data.shape
+        data = self.signal.data.reshape((self.chisq.data.size, -1))
+        channels = np.flatnonzero(self._channel_switches)
+        if mask is None:
+            to_fit = np.arange(self.chisq.data.size)
+        else:
+            to_fit = np.flatnonzero(~np.asarray(mask, dtype=bool).ravel())
+        varying_values = np.stack(list(varying.values()), axis=1) if varying else None
+        coefficients = np.empty((to_fit.size, len(parameters)))
+        chisq = np.empty(to_fit.size)
+        for start in progressbar(
+            range(0, to_fit.size, _LINEAR_MULTIFIT_CHUNK_SIZE),
+            disable=not show_progressbar,
+            leave=True,
+        ):
+            chunk = slice(start, start + _LINEAR_MULTIFIT_CHUNK_SIZE)
+            index = to_fit[chunk]
+            # Works for numpy and dask arrays, which are computed by chunk
+            y = np.asarray(data[index][:, channels], dtype=float)
+            offset = base
+            if varying:
+                offset = offset + varying_values[index] @ varying_design.T
+            if poisson:
+                x = batched_poisson_mle(design, y, nonnegative, offset)
+            else:
+                x = batched_lstsq(design, y - offset, nonnegative)
+            coefficients[chunk] = x
+            chunk_variance = variance
+            if np.ndim(variance):
+                chunk_variance = np.asarray(variance[index][:, channels])
+            residual = y - offset - x @ design.T
+            chisq[chunk] = (residual**2 / chunk_variance).sum(axis=1)
+
+        index = np.unravel_index(to_fit, nav_shape)
+        for parameter, values in zip(parameters, coefficients.T):
+            parameter.map["values"][index] = values
+            parameter.map["std"][index] = np.nan
+            parameter.map["is_set"][index] = True
+        for component in components:
+            for parameter in component.parameters:
+                if parameter.free or parameter._number_of_elements != 1:
+                    continue
+                if parameter.twin is not None:
+                    values = parameter.twin.map["values"][index]
+                    if parameter._twin_function is not None:
+                        values = parameter._twin_function(values)
+                elif parameter in varying:
+                    values = varying[parameter][to_fit]
+                else:
+                    values = parameter.value
+                parameter.map["values"][index] = values
+                parameter.map["is_set"][index] = True
+        self.chisq.data[index] = chisq
+        self.dof.data[index] = len(parameters)
+        self.fetch_stored_values()
+
     @property
     def units_factor(self):
         units_name = self.axes_manager.signal_axes[0].units
@@ -300,6 +588,9 @@ class EDSModel(Model1D):
             The order of the polynomial
         """
         background = create_component.Polynomial(order=order)
+        # Required to create the component again from the model dictionary,
+        # e.g. when restoring a stored model
+        background._whitelist["order"] = ("init", order)
         background.name = "background_order_" + str(order)
         background.isbackground = True
         self.append(background)
@@ -344,7 +635,7 @@ class EDSModel(Model1D):
         end_energy=None,
         windows_sigma=(4.0, 3.0),
         kind="single",
-        **kwargs
+        **kwargs,
     ):
         """
         Fit the background in the energy range containing no X-ray line.
@@ -849,7 +1140,7 @@ class EDSModel(Model1D):
         plot_result=False,
         only_one=True,
         only_lines=("a",),
-        **kwargs
+        **kwargs,
     ):
         """
         Return the fitted intensity of the X-ray lines.
@@ -18,22 +18,303 @@
 
 import copy
 import logging
+import multiprocessing
 import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from pathlib import Path
 
+import dask
+import dask.array as da
+import h5py
 import numpy as np
+from dask.diagnostics import ProgressBar
+from scipy import fft
 
 from hyperspy import components1d
 from exspy.signals.eels import EELSSpectrum
 from exspy.components import EELSCLEdge
 from hyperspy.components1d import PowerLaw
+from hyperspy.defaults_parser import preferences
 from hyperspy.docstrings.model import FIT_PARAMETERS_ARG
-from exspy.docstrings.model import EELSMODEL_PARAMETERS
+from hyperspy.external.progressbar import progressbar
+from exspy.docstrings.model import (
+    EELSMODEL_PARAMETERS,
+    MULTIFIT_CHECKPOINT_PARAMETERS,
+    MULTIFIT_ITERPATH_PARAMETERS,
+    MULTIFIT_PYRAMID_PARAMETER,
+)
+from exspy.models._multifit import (
+    bin_signal,
+    create_model_like,
+    dispatch_multifit,
+)
 from hyperspy.misc.utils import dummy_context_manager
 from hyperspy.models.model1d import Model1D
 
 
 _logger = logging.getLogger(__name__)
 
+# Below this low-loss spectrum size, direct convolution is faster than FFT
+# convolution
+_FFT_CONVOLUTION_MIN_SIZE = 32
+
+# The arrays of the model template larger than this size are given to the
+# worker processes of the parallel multifit through shared memory, e.g. the
+# GOS tables
+_SHARED_MEMORY_MIN_NBYTES = 2**16
+
+# The arrays in shared memory of a worker process of the parallel multifit,
+# set by `_init_multifit_worker`
+_worker_arrays = {}
+
+
+def _fill_unset_values(model, fetch_only_fixed, values=None):
+    """Store the given values, by default the current ones, where the values
+    of the parameters are not set.
+
+    Each pixel then starts from its stored values, so that the result does
+    not depend on the order in which the pixels are fitted. If
+    ``fetch_only_fixed`` is True, the values of all the free parameters are
+    replaced.
+    """
+    parameters = [
+        parameter for component in model for parameter in component.parameters
+    ]
+    if values is None:
+        values = [parameter.value for parameter in parameters]
+    for parameter, value in zip(parameters, values):
+        if fetch_only_fixed and parameter.free:
+            to_set = slice(None)
+        else:
+            to_set = ~parameter.map["is_set"]
+        parameter.map["values"][to_set] = value
+        parameter.map["std"][to_set] = np.nan
+        parameter.map["is_set"][to_set] = True
+
+
+def _fit_pixels(model, indices, kwargs):
+    """Fit the pixels at the given flat navigation indices."""
+    nav_shape = model.axes_manager._navigation_shape_in_array
+    with model.suspend_update(update_on_resume=False):
+        for index in zip(*np.unravel_index(indices, nav_shape)):
+            with model.axes_manager.events.indices_changed.suppress():
+                model.axes_manager.indices = index[::-1]
+            model.fetch_stored_values()
+            model.fit(**kwargs)
+
+
+class _SharedArray:
+    """Copy of an array in shared memory, which can be pickled to be used in
+    other processes.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        The array to copy.
+    blocks : list
+        The shared memory block is appended to this list. It must be closed
+        and unlinked by the caller when the array is not used anymore.
+
+    """
+
+    def __init__(self, array, blocks):
+        array = np.asarray(array)
+        shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        blocks.append(shm)
+        np.ndarray(array.shape, array.dtype, buffer=shm.buf)[...] = array
+        self.name = shm.name
+        self.shape = array.shape
+        self.dtype = array.dtype.str
+
+    def attach(self, blocks):
+        """Return a read-only view of the array in the current process.
+
+        The shared memory block is appended to `blocks` and must be kept
+        open as long as the array is used.
+        """
+        shm = shared_memory.SharedMemory(name=self.name)
+        blocks.append(shm)
+        array = np.ndarray(self.shape, self.dtype, buffer=shm.buf)
+        array.flags.writeable = False
+        return array
+
+
+def _share_arrays(obj, blocks):
+    """Replace the large arrays of nested dictionaries and lists by copies in
+    shared memory."""
+    if isinstance(obj, dict):
+        return {key: _share_arrays(value, blocks) for key, value in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return type(obj)(_share_arrays(value, blocks) for value in obj)
+    elif isinstance(obj, np.ndarray) and obj.nbytes >= _SHARED_MEMORY_MIN_NBYTES:
+        return _SharedArray(obj, blocks)
+    return obj
+
+
+def _attach_arrays(obj, blocks):
+    """Replace the arrays shared by `_share_arrays` by views of the shared
+    memory."""
+    if isinstance(obj, dict):
+        return {key: _attach_arrays(value, blocks) for key, value in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return type(obj)(_attach_arrays(value, blocks) for value in obj)
+    elif isinstance(obj, _SharedArray):
+        return obj.attach(blocks)
+    return obj
+
+
+def _init_multifit_worker(shared):
+    """Attach a worker process of the parallel multifit to the arrays in
+    shared memory.
+
+    The shared memory blocks stay open until the worker exits.
+    """
+    blocks = []
+    _worker_arrays.update(_attach_arrays(shared, blocks))
+    _worker_arrays["blocks"] = blocks
+
+
+def _fit_multifit_shard(indices, fit_kwargs):
+    """Fit the pixels at the given flat navigation indices in a worker
+    process of the parallel multifit.
+
+    Returns
+    -------
+    numpy.ndarray
+        The packed parameter maps of the pixels after the fit.
+
+    """
+    low_loss = _worker_arrays["low_loss"]
+    model = _create_block_model(
+        _worker_arrays["data"][indices],
+        _worker_arrays["packed"][indices],
+        None if low_loss is None else low_loss[indices],
+        _worker_arrays["template"],
+    )
+    _fit_pixels(model, np.arange(len(indices)), fit_kwargs)
+    return _pack_maps(model)
+
+
+def _pack_maps(model):
+    """Pack the parameter maps, chisq and dof of a model in a float array
+    with the fields in the last axis."""
+    nav_shape = tuple(model.axes_manager._navigation_shape_in_array)
+    fields = []
+    for component in model:
+        for parameter in component.parameters:
+            n = parameter._number_of_elements
+            fields.append(parameter.map["values"].reshape(nav_shape + (n,)))
+            fields.append(parameter.map["std"].reshape(nav_shape + (n,)))
+            fields.append(parameter.map["is_set"].reshape(nav_shape + (1,)))
+    fields.append(np.asarray(model.chisq.data).reshape(nav_shape + (1,)))
+    fields.append(np.asarray(model.dof.data).reshape(nav_shape + (1,)))
+    return np.concatenate(fields, axis=-1, dtype=float)
+
+
+def _unpack_maps(packed, dtypes):
+    """Unpack the parameter maps, chisq and dof packed by `_pack_maps`.
+
+    Parameters
+    ----------
+    packed : numpy.ndarray
+        The packed maps.
+    dtypes : list of numpy.dtype
+        The dtypes of the maps of the parameters.
+
+    Returns
+    -------
+    maps : list of numpy.ndarray
+    chisq, dof : numpy.ndarray
+
+    """
+    nav_shape = packed.shape[:-1]
+    maps = []
+    i = 0
+    for dtype in dtypes:
+        map_ = np.zeros(nav_shape, dtype=dtype)
+        n = map_["values"][(0,) * len(nav_shape)].size
+        map_["values"] = packed[..., i : i + n].reshape(map_["values"].shape)
+        map_["std"] = packed[..., i + n : i + 2 * n].reshape(map_["std"].shape)
+        map_["is_set"] = packed[..., i + 2 * n]
+        maps.append(map_)
+        i += 2 * n + 1
+    return maps, packed[..., i], packed[..., i + 1]
+
+
+def _create_block_model(data, packed, low_loss, template):
+    """Create the model of a block of the signal.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        The data of the block.
+    packed : numpy.ndarray
+        The parameter maps of the block packed by `_pack_maps`.
+    low_loss : numpy.ndarray or None
+        The low-loss data of the block.
+    template : dict
+        The description of the model returned by
+        :py:meth:`EELSModel._get_block_template`.
+
+    Returns
+    -------
+    EELSModel
+
+    """
+    nav_shape = data.shape[:-1]
+    axes = [{"size": size, "navigate": True} for size in nav_shape]
+    signal = EELSSpectrum(
+        data,
+        axes=axes + [template["signal_axis"]],
+        metadata=copy.deepcopy(template["metadata"]),
+    )
+    dictionary = copy.deepcopy(template["model"])
+    maps, chisq, dof = _unpack_maps(packed, template["dtypes"])
+    maps = iter(maps)
+    for component in dictionary["components"]:
+        for parameter in component["parameters"]:
+            parameter["map"] = next(maps)
+    for key, value in (("chisq.data", chisq), ("dof.data", dof)):
+        if key in dictionary:
+            dictionary[key] = value
+    model = signal.create_model(dictionary=dictionary)
+    if low_loss is not None:
+        model.low_loss = EELSSpectrum(
+            low_loss,
+            axes=axes + [template["low_loss_axis"]],
+            metadata=copy.deepcopy(template["metadata"]),
+        )
+    model.convolved = template["convolved"]
+    return model
+
+
+def _fit_block(data, packed, low_loss, mask, template, fit_kwargs):
+    """Fit a block of a chunked signal.
+
+    Parameters
+    ----------
+    data, packed, low_loss, template
+        See `_create_block_model`.
+    mask : numpy.ndarray or None
+        Pixels where the mask is True are not fitted.
+    fit_kwargs : dict
+        The keyword arguments passed to :py:meth:`EELSModel.fit`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The packed parameter maps after the fit.
+
+    """
+    nav_shape = data.shape[:-1]
+    model = _create_block_model(data, packed, low_loss, template)
+    original = _pack_maps(model)
+    _fill_unset_values(model, template["fetch_only_fixed"], template["values"])
+    to_fit = np.ones(nav_shape, dtype=bool) if mask is None else ~mask
+    _fit_pixels(model, np.flatnonzero(to_fit), fit_kwargs)
+    return np.where(to_fit[..., np.newaxis], _pack_maps(model), original)
+
 
 def generate_uniform_axis(offset, scale, size, offset_index=0):
     """Creates a uniform axis vector given the offset, scale and number of
@@ -90,6 +371,8 @@ class EELSModel(Model1D):
         self._preedge_safe_window_width = 2
         self._suspend_auto_fine_structure_width = False
         self._low_loss = None
+        self._low_loss_cache = None
+        self._buffers = {}
         self._convolved = False
         self.convolution_axis = None
         self.low_loss = low_loss
@@ -140,10 +423,66 @@ class EELSModel(Model1D):
 
         sig = component_values * np.ones(self.convolution_axis.shape)
 
-        ll = self.low_loss._get_current_data(self.axes_manager)
-        convolved = np.convolve(sig, ll, mode="valid")
+        return self._convolve(sig)
+
+    def _clear_low_loss_cache(self):
+        self._low_loss_cache = None
+
+    def _get_low_loss_cache(self):
+        """Return the low-loss spectrum at the current navigation index and,
+        when FFT convolution is used, its Fourier transform.
+
+        The cache is only computed again when the navigation index, the
+        low-loss signal or the convolution axis change.
+        """
+        key = (
+            id(self.low_loss),
+            tuple(self.axes_manager.indices),
+            len(self.convolution_axis),
+        )
+        cache = self._low_loss_cache
+        if cache is None or cache["key"] != key:
+            ll = np.atleast_1d(self.low_loss._get_current_data(self.axes_manager))
+            size = len(self.convolution_axis)
+            cache = {"key": key, "data": ll, "fft": None, "nfft": None}
+            if ll.size >= _FFT_CONVOLUTION_MIN_SIZE:
+                # The wrap-around of the circular convolution only affects
+                # the channels outside of the "valid" region
+                nfft = fft.next_fast_len(size, real=True)
+                cache["nfft"] = nfft
+                cache["fft"] = fft.rfft(ll, nfft)
+            self._low_loss_cache = cache
+        return cache
+
+    def _convolve(self, values):
+        """Convolve with the low-loss spectrum in "valid" mode.
+
+        Parameters
+        ----------
+        values : numpy.ndarray
+            Values on the convolution axis. The convolution is performed
+            along the last axis, so several spectra can be convolved at once.
+
+        Returns
+        -------
+        numpy.ndarray
+            The convolved values on the model axis.
 
-        return convolved
+        """
+        cache = self._get_low_loss_cache()
+        ll = cache["data"]
+        if cache["fft"] is None:
+            if values.ndim == 1:
+                return np.convolve(values, ll, mode="valid")
+            values_ = values.reshape(-1, values.shape[-1])
+            convolved = [np.convolve(v, ll, mode="valid") for v in values_]
+            return np.reshape(convolved, values.shape[:-1] + (-1,))
+        convolved = fft.irfft(
+            fft.rfft(values, cache["nfft"], axis=-1) * cache["fft"],
+            cache["nfft"],
+            axis=-1,
+        )
+        return convolved[..., ll.size - 1 : values.shape[-1]]
 
     def _get_model_data(self, *args, **kwargs):
         if self.convolved is False:
@@ -161,11 +500,7 @@ class EELSModel(Model1D):
                     sum_convolved += component.function(self.convolution_axis)
                 else:
                     sum_ += component.function(self.axis.axis)
-            to_return = sum_ + np.convolve(
-                self.low_loss._get_current_data(self.axes_manager),
-                sum_convolved,
-                mode="valid",
-            )
+            to_return = sum_ + self._convolve(sum_convolved)
             to_return = to_return[slice_]
             return to_return
 
@@ -176,60 +511,77 @@ class EELSModel(Model1D):
         if weights is None:
             weights = 1.0
 
+        components = [component for component in self if component.active]
+        channel_switches = self._channel_switches
+        to_return = np.empty(
+            (
+                sum(component._nfree_param for component in components),
+                np.count_nonzero(channel_switches),
+            )
+        )
+        # The gradients of the convolved components are written into a
+        # scratch array which is reused between calls, the jacobian itself
+        # is returned to the caller so it can't be reused
+        convolved_grad = self._get_buffer(
+            "convolved_gradients",
+            (
+                sum(c._nfree_param for c in components if c.convolved),
+                len(self.convolution_axis),
+            ),
+        )
+        convolved_rows = []
+
         counter = 0
-        grad = np.zeros(len(self.axis.axis))
-        for component in self:  # Cut the parameters list
-            if component.active:
-                component.fetch_values_from_array(
-                    param[counter : counter + component._nfree_param], onlyfree=True
-                )
+        for component in components:  # Cut the parameters list
+            component.fetch_values_from_array(
+                param[counter : counter + component._nfree_param], onlyfree=True
+            )
 
+            for parameter in component.free_parameters:
+                n = parameter._number_of_elements
                 if component.convolved:
-                    for parameter in component.free_parameters:
-                        par_grad = np.convolve(
-                            parameter.grad(self.convolution_axis),
-                            self.low_loss._get_current_data(self.axes_manager),
-                            mode="valid",
-                        )
-
-                        if parameter._twins:
-                            for par in parameter._twins:
-                                np.add(
-                                    par_grad,
-                                    np.convolve(
-                                        par.grad(self.convolution_axis),
-                                        self.low_loss._get_current_data(
-                                            self.axes_manager
-                                        ),
-                                        mode="valid",
-                                    ),
-                                    par_grad,
-                                )
-
-                        grad = np.vstack((grad, par_grad))
-
+                    axis = self.convolution_axis
+                    index = slice(None)
+                    i = len(convolved_rows)
+                    par_grad = convolved_grad[i : i + n]
+                    convolved_rows.extend(range(counter, counter + n))
                 else:
-                    for parameter in component.free_parameters:
-                        par_grad = parameter.grad(self.axis.axis)
+                    axis = self.axis.axis
+                    index = channel_switches
+                    par_grad = to_return[counter : counter + n]
 
-                        if parameter._twins:
-                            for par in parameter._twins:
-                                np.add(par_grad, par.grad(self.axis.axis), par_grad)
+                par_grad[:] = parameter.grad(axis)[..., index]
 
-                        grad = np.vstack((grad, par_grad))
+                if parameter._twins:
+                    for par in parameter._twins:
+                        par_grad += par.grad(axis)[..., index]
 
-                counter += component._nfree_param
+                counter += n
 
-        to_return = grad[1:, self._channel_switches] * weights
+        # The gradients of the convolved components are convolved all at once
+        if convolved_rows:
+            to_return[convolved_rows] = self._convolve(convolved_grad)[
+                :, channel_switches
+            ]
+        to_return *= weights
 
         if self.axis.is_binned:
             if self.axis.is_uniform:
                 to_return *= self.axis.scale
             else:
-                to_return *= np.gradient(self.axis.axis)
+                to_return *= np.gradient(self.axis.axis)[channel_switches]
 
         return to_return
 
+    def _get_buffer(self, name, shape):
+        """Return an uninitialised array of the given shape, which is reused
+        by the next calls with the same name and shape."""
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape)
+            self._buffers[name] = buffer
+        return buffer
+
     @property
     def signal(self):
         return self._signal
@@ -284,10 +636,12 @@ class EELSModel(Model1D):
                     "Convolution is not supported with non-uniform signal axes."
                 )
             self._low_loss = value
+            self._clear_low_loss_cache()
             self.set_convolution_axis()
             self.convolved = True
         else:
             self._low_loss = value
+            self._clear_low_loss_cache()
             self.convolution_axis = None
             self.convolved = False
 
@@ -545,6 +899,8 @@ class EELSModel(Model1D):
         * :py:meth:`~hyperspy.model.EELSModel.smart_fit`
 
         """
+        # The low-loss data may have been modified since the last fit
+        self._clear_low_loss_cache()
         if kind not in ["smart", "std"]:
             raise ValueError(f"kind must be either 'std' or 'smart', not '{kind}'")
         elif kind == "smart":
@@ -554,7 +910,348 @@ class EELSModel(Model1D):
 
     fit.__doc__ %= FIT_PARAMETERS_ARG
 
-    def smart_fit(self, start_energy=None, **kwargs):
+    def multifit(
+        self,
+        mask=None,
+        fetch_only_fixed=False,
+        iterpath=None,
+        seed_from_neighbours=False,
+        pyramid=None,
+        checkpoint=None,
+        checkpoint_interval=60.0,
+        resume=False,
+        workers=None,
+        show_progressbar=None,
+        **kwargs,
+    ):
+        """Fit the data to the model at all positions of the navigation
+        dimensions.
+
+        Parameters
+        ----------
+        mask : numpy.ndarray of bool or None, optional
+            Pixels where the mask is True are not fitted. The mask has
+            the navigation shape of the signal in array order.
+        fetch_only_fixed : bool, default False
+            If True, only the stored values of the fixed parameters are
+            fetched before fitting each pixel.
+        %s
+        %s
+        %s
+        workers : int or None, default None
+            The number of worker processes. If None or 1, the pixels are
+            fitted serially in the current process. Otherwise, the pixels
+            are fitted by processes started with the ``"spawn"`` method,
+            which share the data with the current process, and each pixel
+            starts from its stored parameter values. These must be stored in
+            all the pixels to fit, e.g. using
+            :py:meth:`~hyperspy.model.BaseModel.assign_current_values_to_all`,
+            and the result is then identical to the serial fit.
+            ``fetch_only_fixed``, ``iterpath``, ``seed_from_neighbours``,
+            checkpointing and components with ``active_is_multidimensional``
+            are then not supported. In a script, the call must be protected
+            by ``if __name__ == "__main__":``.
+        show_progressbar : None or bool, optional
+            If True, display a progress bar. If None, the default from
+            the preferences settings is used.
+        **kwargs : dict
+            Any extra keyword argument is passed to
+            :py:meth:`~hyperspy.model.BaseModel.multifit` in the serial
+            case with the default iteration paths and without
+            checkpointing, and to :py:meth:`~.EELSModel.fit` otherwise, e.g.
+            ``kind="smart"``.
+
+        See Also
+        --------
+        * :py:meth:`~hyperspy.model.BaseModel.multifit`
+        * :py:meth:`~.EELSModel.fit`
+
+        """
+        if workers is not None and workers < 1:
+            raise ValueError("`workers` must be a positive integer.")
+        if pyramid is None and workers is not None and workers > 1:
+            if self.signal._lazy:
+                raise ValueError("Parallel fitting is not supported for lazy signals.")
+            unsupported = {"autosave", "interactive_plot"}
+            unsupported = unsupported.intersection(kwargs)
+            if fetch_only_fixed:
+                unsupported.add("fetch_only_fixed")
+            if iterpath is not None:
+                unsupported.add("iterpath")
+            if seed_from_neighbours:
+                unsupported.add("seed_from_neighbours")
+            if checkpoint is not None or resume:
+                unsupported.add("checkpoint")
+            if any(component.active_is_multidimensional for component in self):
+                unsupported.add("active_is_multidimensional")
+            if unsupported:
+                raise ValueError(
+                    f"{', '.join(sorted(unsupported))} is not supported when "
+                    "fitting in parallel."
+                )
+            return self._multifit_parallel(mask, workers, show_progressbar, **kwargs)
+        if pyramid is not None:
+            # The models of all the resolutions are fitted with `workers`
+            kwargs["workers"] = workers
+        return dispatch_multifit(
+            self,
+            super().multifit,
+            mask=mask,
+            fetch_only_fixed=fetch_only_fixed,
+            iterpath=iterpath,
+            seed_from_neighbours=seed_from_neighbours,
+            pyramid=pyramid,
+            checkpoint=checkpoint,
+            checkpoint_interval=checkpoint_interval,
+            resume=resume,
+            show_progressbar=show_progressbar,
+            **kwargs,
+        )
+
+    multifit.__doc__ %= (
+        MULTIFIT_ITERPATH_PARAMETERS,
+        MULTIFIT_PYRAMID_PARAMETER,
+        MULTIFIT_CHECKPOINT_PARAMETERS,
+    )
+
+    def _get_binned_model(self, scale):
+        """Return a model with the same components for the signal averaged
+        by blocks of the navigation pixels, see `multifit_pyramid`."""
+        low_loss = self.low_loss
+        if low_loss is not None:
+            low_loss = bin_signal(low_loss, scale)
+        model = create_model_like(
+            self, bin_signal(self.signal, scale), exclude=("low_loss",)
+        )
+        if low_loss is not None:
+            model.low_loss = low_loss
+            model.convolved = self.convolved
+        return model
+
+    def _multifit_parallel(self, mask, workers, show_progressbar, **kwargs):
+        if show_progressbar is None:
+            show_progressbar = preferences.General.show_progressbar
+        nav_shape = self.axes_manager._navigation_shape_in_array
+        to_fit = np.ones(nav_shape, dtype=bool)
+        if mask is not None:
+            to_fit &= ~np.asarray(mask, dtype=bool).reshape(nav_shape)
+        indices = np.flatnonzero(to_fit)
+        # As in the serial fit, each pixel starts from its stored values,
+        # they must be set to not depend on the previously fitted pixel
+        for component in self:
+            if not component.active:
+                continue
+            for parameter in component.parameters:
+                if not parameter.map["is_set"].ravel()[indices].all():
+                    raise ValueError(
+                        "The values of all parameters must be stored in all "
+                        "pixels to fit in parallel, e.g. using "
+                        "`assign_current_values_to_all`."
+                    )
+        # Several shards per worker to balance the load
+        shards = np.array_split(indices, min(len(indices), 4 * workers))
+        parameters = [
+            parameter for component in self for parameter in component.parameters
+        ]
+        dtypes = [parameter.map.dtype for parameter in parameters]
+        n_fields = sum(len(dtype) for dtype in dtypes)
+        low_loss = self.low_loss
+        blocks = []
+        try:
+            # The data is given to the workers through shared memory to not
+            # copy it to each process
+            shared = {
+                "data": _SharedArray(
+                    self.signal.data.reshape((-1, self.axes_manager.signal_shape[0])),
+                    blocks,
+                ),
+                "packed": _SharedArray(
+                    _pack_maps(self).reshape((len(to_fit.flat), -1)), blocks
+                ),
+                "low_loss": None,
+                "template": _share_arrays(self._get_block_template(False), blocks),
+            }
+            if low_loss is not None:
+                shared["low_loss"] = _SharedArray(
+                    low_loss.data.reshape((len(to_fit.flat), -1)), blocks
+                )
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_multifit_worker,
+                initargs=(shared,),
+            ) as executor, progressbar(
+                total=len(indices), disable=not show_progressbar, leave=True
+            ) as pbar:
+                futures = {
+                    executor.submit(_fit_multifit_shard, shard, kwargs): shard
+                    for shard in shards
+                    if len(shard)
+                }
+                for future in as_completed(futures):
+                    shard = futures[future]
+                    maps, chisq, dof = _unpack_maps(future.result(), dtypes)
+                    index = np.unravel_index(shard, nav_shape)
+                    for parameter, map_ in zip(parameters, maps):
+                        parameter.map[index] = map_
+                    self.chisq.data[index] = chisq
+                    self.dof.data[index] = dof
+                    pbar.update(len(shard))
+        finally:
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+        self.fetch_stored_values()
+
+    def lazy_multifit(
+        self,
+        mask=None,
+        fetch_only_fixed=False,
+        store=None,
+        show_progressbar=None,
+        **kwargs,
+    ):
+        """Fit the model chunk by chunk over the navigation space.
+
+        Each chunk of the signal, with the matching chunk of the low-loss
+        signal, is fitted by a separate dask task. The data does not need
+        to be loaded in memory and the fit runs on the workers of the
+        current dask scheduler, e.g. a distributed cluster.
+
+        Each pixel starts from its stored parameter values or, when they
+        are not set, from the current values. The result does not depend on
+        the chunks and is identical to the serial
+        :py:meth:`~.EELSModel.multifit` when all the parameter values are
+        stored, e.g. after
+        :py:meth:`~hyperspy.model.BaseModel.assign_current_values_to_all`.
+
+        Parameters
+        ----------
+        mask : numpy.ndarray of bool or None, optional
+            Pixels where the mask is True are not fitted. The mask has
+            the navigation shape of the signal in array order.
+        fetch_only_fixed : bool, default False
+            If True, the free parameters start from their current values
+            in all pixels.
+        store : str, pathlib.Path or None, default None
+            If a path ending with ``.zarr``, ``.hdf5`` or ``.h5``, the
+            parameter maps, chisq and dof are written to this store, chunk
+            by chunk, as a single array with the fields in the last axis.
+        show_progressbar : None or bool, optional
+            If True, display a progress bar. If None, the default from
+            the preferences settings is used.
+        **kwargs : dict
+            Any extra keyword argument is passed to
+            :py:meth:`~.EELSModel.fit`, e.g. ``kind="smart"``.
+
+        See Also
+        --------
+        * :py:meth:`~.EELSModel.multifit`
+
+        """
+        if self.axes_manager.navigation_dimension == 0:
+            raise ValueError("The signal does not have a navigation dimension.")
+        if any(component.active_is_multidimensional for component in self):
+            raise ValueError(
+                "Fitting by chunk is not supported with components with "
+                "`active_is_multidimensional` set to True."
+            )
+        if store is not None:
+            store = Path(store)
+            if store.suffix not in (".zarr", ".hdf5", ".h5"):
+                raise ValueError("`store` must be a zarr or HDF5 file.")
+        if show_progressbar is None:
+            show_progressbar = preferences.General.show_progressbar
+
+        nav_dim = self.axes_manager.navigation_dimension
+        # The chunks span the whole signal axis
+        data = da.asarray(self.signal.data).rechunk({nav_dim: -1})
+        nav_chunks = data.chunks[:-1]
+        packed = da.from_array(_pack_maps(self), chunks=nav_chunks + (-1,))
+        nav_ind = tuple(f"nav{i}" for i in range(nav_dim))
+        args = [data, nav_ind + ("signal",), packed, nav_ind + ("fields",)]
+        if self.low_loss is not None:
+            low_loss = da.asarray(self.low_loss.data).rechunk(nav_chunks + (-1,))
+            args += [low_loss, nav_ind + ("low_loss",)]
+        else:
+            args += [None, None]
+        if mask is not None:
+            mask = np.asarray(mask, dtype=bool).reshape(packed.shape[:-1])
+            args += [da.from_array(mask, chunks=nav_chunks), nav_ind]
+        else:
+            args += [None, None]
+        # The template, which contains e.g. the GOS tables, is a single key
+        # of the graph shared by all the tasks instead of being embedded in
+        # each of them
+        template = dask.delayed(self._get_block_template(fetch_only_fixed))
+        args += [template, None]
+        result = da.blockwise(
+            _fit_block,
+            nav_ind + ("fields",),
+            *args,
+            dtype=float,
+            concatenate=True,
+            meta=np.empty((0,) * (nav_dim + 1)),
+            fit_kwargs=kwargs,
+        )
+
+        cm = ProgressBar if show_progressbar else dummy_context_manager
+        with cm():
+            if store is None:
+                result = result.compute()
+            elif store.suffix == ".zarr":
+                result.to_zarr(str(store), overwrite=True)
+                result = da.from_zarr(str(store)).compute()
+            else:
+                result.to_hdf5(store, "/multifit")
+                with h5py.File(store, "r") as f:
+                    result = f["multifit"][()]
+
+        parameters = [
+            parameter for component in self for parameter in component.parameters
+        ]
+        maps, chisq, dof = _unpack_maps(
+            result, [parameter.map.dtype for parameter in parameters]
+        )
+        for parameter, map_ in zip(parameters, maps):
+            parameter.map[:] = map_
+        self.chisq.data[:] = chisq
+        self.dof.data[:] = dof
+        self.fetch_stored_values()
+
+    def _get_block_template(self, fetch_only_fixed):
+        """Return the description of the model used by `_fit_block` to fit a
+        block of the signal."""
+        dictionary = self.as_dictionary()
+        # The navigation dependent data is given by block to `_fit_block`
+        dictionary["low_loss"] = None
+        for component in dictionary["components"]:
+            for parameter in component["parameters"]:
+                parameter["map"] = None
+        for key in ("chisq.data", "dof.data"):
+            if key in dictionary:
+                dictionary[key] = None
+        parameters = [
+            parameter for component in self for parameter in component.parameters
+        ]
+        signal_axis = self.signal.axes_manager.signal_axes[0]
+        template = {
+            "model": dictionary,
+            "dtypes": [parameter.map.dtype for parameter in parameters],
+            "values": [parameter.value for parameter in parameters],
+            "fetch_only_fixed": fetch_only_fixed,
+            "signal_axis": signal_axis.get_axis_dictionary(),
+            "metadata": self.signal.metadata.as_dictionary(),
+            "convolved": self.convolved,
+            "low_loss_axis": None,
+        }
+        if self.low_loss is not None:
+            template["low_loss_axis"] = self.low_loss.axes_manager.signal_axes[
+                0
+            ].get_axis_dictionary()
+        return template
+
+    def smart_fit(self, start_energy=None, only_current=True, **kwargs):
         """Fits EELS edges in a cascade style.
 
         The fitting procedure acts in iterative manner along
@@ -572,6 +1269,13 @@ class EELSModel(Model1D):
         start_energy : {float, None}
             If float, limit the range of energies from the left to the
             given value.
+        only_current : bool, default True
+            If True, only fit the current pixel. Otherwise, each step of
+            the cascade is performed at once for all the pixels with
+            :py:meth:`~.EELSModel.multifit`, to which the extra keyword
+            arguments are passed, e.g. ``mask`` to fit a region only or
+            ``workers``. The energy ranges of the steps are determined
+            from the onset energies of the edges at the current pixel.
         %s
 
         See Also
@@ -584,14 +1288,23 @@ class EELSModel(Model1D):
         cm = self.suspend_update if self._plot_active else dummy_context_manager
         with cm(update_on_resume=True):
             # Fit background
-            self.fit_background(start_energy, **kwargs)
+            self.fit_background(start_energy, only_current, **kwargs)
 
             # Fit the edges
             for i in range(0, len(self._active_edges)):
-                self._fit_edge(i, start_energy, **kwargs)
+                self._fit_edge(i, start_energy, only_current, **kwargs)
 
     smart_fit.__doc__ %= FIT_PARAMETERS_ARG
 
+    def _multifit_from_current_indices(self, **kwargs):
+        """Run multifit and go back to the current indices, where the
+        parameter values determine the energy ranges of the next steps of
+        smart_fit."""
+        indices = self.axes_manager.indices
+        self.multifit(**kwargs)
+        self.axes_manager.indices = indices
+        self.fetch_stored_values()
+
     def _get_first_ionization_edge_energy(self, start_energy=None):
         """Calculate the first ionization edge energy.
 
@@ -653,7 +1366,7 @@ class EELSModel(Model1D):
         if only_current:
             self.fit(**kwargs)
         else:
-            self.multifit(**kwargs)
+            self._multifit_from_current_indices(**kwargs)
         self._channel_switches = copy.copy(self._backup_channel_switches)
         if iee is not None:
             self.enable_edges(to_disable)
@@ -704,7 +1417,8 @@ class EELSModel(Model1D):
             )
             return
 
-    def _fit_edge(self, edgenumber, start_energy=None, **kwargs):
+    def _fit_edge(self, edgenumber, start_energy=None, only_current=True, **kwargs):
+        fit = self.fit if only_current else self._multifit_from_current_indices
         backup_channel_switches = self._channel_switches.copy()
         ea = self.axis.axis[self._channel_switches]
         if start_energy is None:
@@ -764,7 +1478,7 @@ class EELSModel(Model1D):
         self.set_signal_range(start_energy, nextedgeenergy)
         if edge.free_onset_energy is True:
             edge.onset_energy.free = True
-            self.fit(**kwargs)
+            fit(**kwargs)
             edge.onset_energy.free = False
             _logger.info("onset_energy = %s", edge.onset_energy.value)
             self._classify_components()
@@ -772,12 +1486,12 @@ class EELSModel(Model1D):
             self.enable_fine_structure(to_activate_fs)
             self.remove_fine_structure_data(to_activate_fs)
             self.disable_fine_structure(to_activate_fs)
-            self.fit(**kwargs)
+            fit(**kwargs)
 
         if len(to_activate_fs) > 0:
             self.set_signal_range(start_energy, nextedgeenergy)
             self.enable_fine_structure(to_activate_fs)
-            self.fit(**kwargs)
+            fit(**kwargs)
 
         self.enable_edges(edges_to_activate)
         # Recover the _channel_switches. Remove it or make it smarter.
@@ -1000,7 +1714,13 @@ class EELSModel(Model1D):
             edge.intensity.ext_force_positive = False
             edge.intensity.ext_bounded = False
 
-    def enable_free_onset_energy(self, edges_list=None):
+    def enable_free_onset_energy(
+        self,
+        edges_list=None,
+        onset_shift_table=False,
+        onset_shift_width=10.0,
+        onset_shift_step=0.5,
+    ):
         """Enable the automatic freeing of the onset_energy parameter during a
         smart fit for the edges listed in edges_list.
         If edges_list is None (default) the onset_energy of all the edges
@@ -1011,6 +1731,19 @@ class EELSModel(Model1D):
         edges_list : None or list of EELSCLEdge or list of edge names
             If None, the operation is performed on all the edges in the model.
             Otherwise, it will be performed only on the listed components.
+        onset_shift_table : bool, default False
+            If True, the cross-sections of the edges (and of the edges whose
+            onset energy is twinned to them) are precomputed over a grid of
+            onset energies. While fitting, the cross-sections are then
+            interpolated between the grid points instead of being integrated
+            every time the onset energy changes and the analytical gradient of
+            ``onset_energy`` is available.
+        onset_shift_width : float, default 10.0
+            The grid covers the onset energies within +/- this value (eV) of
+            the current onset energy. It is recomputed around the onset energy
+            if the latter moves out of the grid.
+        onset_shift_step : float, default 0.5
+            The spacing of the grid in eV.
 
         See Also
         --------
@@ -1029,6 +1762,20 @@ class EELSModel(Model1D):
         for edge in edges_list:
             if edge.isbackground is False:
                 edge.free_onset_energy = True
+                if onset_shift_table:
+                    for edge_ in self._get_onset_energy_twinned_edges(edge):
+                        edge_._set_onset_shift_table(
+                            onset_shift_width, onset_shift_step
+                        )
+
+    @staticmethod
+    def _get_onset_energy_twinned_edges(edge):
+        """Return the edge and the edges whose onset energy is twinned to it."""
+        edges = [edge]
+        for parameter in edge.onset_energy._twins:
+            if isinstance(parameter.component, EELSCLEdge):
+                edges.append(parameter.component)
+        return edges
 
     def disable_free_onset_energy(self, edges_list=None):
         """Disable the automatic freeing of the onset_energy parameter during a
@@ -1036,7 +1783,8 @@ class EELSModel(Model1D):
         If edges_list is None (default) the onset_energy of all the edges
         with onset in the spectrum energy region will not be freed.
         Note that if their attribute edge.onset_energy.free is True, the
-        parameter will be free during the smart fit.
+        parameter will be free during the smart fit. The onset shift tables
+        of the edges, if any, are removed.
 
         Parameters
         ----------
@@ -1061,7 +1809,9 @@ class EELSModel(Model1D):
             edges_list = [self._get_component(x) for x in edges_list]
         for edge in edges_list:
             if edge.isbackground is False:
-                edge.free_onset_energy = True
+                edge.free_onset_energy = False
+                for edge_ in self._get_onset_energy_twinned_edges(edge):
+                    edge_._remove_onset_shift_table()
 
     def fix_edges(self, edges_list=None):
         """Fixes all the parameters of the edges given in edges_list.
@@ -18,7 +18,9 @@
 
 import itertools
 import logging
+from functools import partial
 
+import dask.array as da
 import numpy as np
 import warnings
 from collections.abc import Iterable
@@ -641,37 +643,40 @@ class EDSSpectrum(Signal1D):
             integration_windows = self.estimate_integration_windows(
                 windows_width=integration_windows, xray_lines=xray_lines
             )
-        intensities = []
         ax = self.axes_manager.signal_axes[0]
-        # test Signal1D (0D problem)
-        # signal_to_index = self.axes_manager.navigation_dimension - 2
-        for i, (Xray_line, window) in enumerate(zip(xray_lines, integration_windows)):
-            element, line = utils_eds._get_element_and_line(Xray_line)
-            line_energy = self._get_line_energy(Xray_line)
-            # Replace with `map` function for lazy large datasets
-            img = self.isig[window[0] : window[1]].integrate1D(
-                -1
-            )  # integrate over window.
-            if np.issubdtype(img.data.dtype, np.integer):
-                # The operations below require a float dtype with the default
-                # numpy casting rule ('same_kind')
-                img.change_dtype("float")
+        # All the windows are gathered to be integrated in a single pass
+        windows = []
+        corr_factors = []
+        for i, window in enumerate(integration_windows):
+            windows.append(self._get_window_indices(window[0], window[1]))
             if background_windows is not None:
                 bw = background_windows[i]
                 # TODO: test to prevent slicing bug. To be reomved when fixed
                 indexes = [float(ax.value2index(de)) for de in list(bw) + window]
-                if indexes[0] == indexes[1]:
-                    bck1 = self.isig[bw[0]]
-                else:
-                    bck1 = self.isig[bw[0] : bw[1]].integrate1D(-1)
-                if indexes[2] == indexes[3]:
-                    bck2 = self.isig[bw[2]]
-                else:
-                    bck2 = self.isig[bw[2] : bw[3]].integrate1D(-1)
-                corr_factor = (indexes[5] - indexes[4]) / (
-                    (indexes[1] - indexes[0]) + (indexes[3] - indexes[2])
+                for j in (0, 2):
+                    if indexes[j] == indexes[j + 1]:
+                        windows.append((int(indexes[j]), int(indexes[j]) + 1))
+                    else:
+                        windows.append(self._get_window_indices(bw[j], bw[j + 1]))
+                corr_factors.append(
+                    (indexes[5] - indexes[4])
+                    / ((indexes[1] - indexes[0]) + (indexes[3] - indexes[2]))
                 )
-                img = img - (bck1 + bck2) * corr_factor
+        sums = self._integrate_windows(windows)
+        intensities = []
+        for i, Xray_line in enumerate(xray_lines):
+            element, line = utils_eds._get_element_and_line(Xray_line)
+            line_energy = self._get_line_energy(Xray_line)
+            if background_windows is not None:
+                data = (
+                    sums[..., 3 * i]
+                    - (sums[..., 3 * i + 1] + sums[..., 3 * i + 2]) * corr_factors[i]
+                )
+            else:
+                data = sums[..., i]
+            img = self._deepcopy_with_new_data(None)
+            img.data = data.reshape(data.shape or (1,))
+            img._remove_axis(ax.index_in_axes_manager)
             img.metadata.General.title = (
                 f"X-ray line intensity of {self.metadata.General.title}: "
                 f"{Xray_line} at {line_energy:.2f} "
@@ -692,6 +697,56 @@ class EDSSpectrum(Signal1D):
             utils.plot.plot_signals(intensities, **kwargs)
         return intensities
 
+    def _get_window_indices(self, left, right):
+        """Return the first and one past the last channel selected by
+        ``self.isig[left:right]``."""
+        ax = self.axes_manager.signal_axes[0]
+        return ax._get_array_slices(slice(left, right)).indices(ax.size)[:2]
+
+    def _integrate_windows(self, windows):
+        """Integrate the spectra over several windows of channels.
+
+        Parameters
+        ----------
+        windows : list of tuple of int
+            The first and one past the last channel of each window.
+
+        Returns
+        -------
+        numpy.ndarray or dask.array.Array
+            The integrals, with the windows along the last axis. Integer
+            data are integrated as float.
+        """
+        ax = self.axes_manager.signal_axes[0]
+        if not ax.is_binned:
+            # Simpson integration cannot be accumulated window by window
+            integrals = [
+                self.isig[start].data
+                if stop - start == 1
+                else self.isig[start:stop].integrate1D(-1).data
+                for start, stop in windows
+            ]
+            return (
+                da.stack(integrals, axis=-1)
+                if self._lazy
+                else np.stack(integrals, axis=-1)
+            )
+        starts, stops = np.array(windows, dtype=int).reshape(-1, 2).T
+        dtype = self.data.dtype
+        if not np.issubdtype(dtype, np.inexact):
+            # The background subtraction requires a float dtype
+            dtype = np.dtype(float)
+        if self._lazy:
+            data = self.data.rechunk({self.data.ndim - 1: -1})
+            return data.map_blocks(
+                partial(
+                    utils_eds._sum_windows, starts=starts, stops=stops, dtype=dtype
+                ),
+                dtype=dtype,
+                chunks=data.chunks[:-1] + ((len(windows),),),
+            )
+        return utils_eds._sum_windows(self.data, starts, stops, dtype)
+
     def get_take_off_angle(self):
         """Calculate the take-off-angle (TOA).
 
@@ -19,8 +19,10 @@
 
 import warnings
 import logging
+from functools import partial
 
 import traits.api as t
+import dask.array as da
 import numpy as np
 from scipy import constants
 import pint
@@ -323,6 +325,8 @@ class EDSTEMSpectrum(EDSSpectrum):
         method, or ionization cross sections. The function iterates through
         quantification function until two successive interations don't change
         the final composition by a defined percentage critera (0.5% by default).
+        The convergence is assessed for each pixel separately, and the pixels
+        which have converged are not updated by the subsequent iterations.
 
         Parameters
         ----------
@@ -388,6 +392,9 @@ class EDSTEMSpectrum(EDSSpectrum):
         If the method is 'cross_section' this function also returns the atom
         counts for each element.
 
+        If the intensities are lazy, the quantification is carried out block
+        by block and the returned signals are lazy.
+
         Examples
         --------
         >>> s = exspy.data.EDS_TEM_FePt_nanoparticles()
@@ -421,14 +428,7 @@ class EDSTEMSpectrum(EDSSpectrum):
         xray_lines = [
             intensity.metadata.Sample.xray_lines[0] for intensity in intensities
         ]
-        it = 0
-        if absorption_correction:
-            if show_progressbar is None:  # pragma: no cover
-                show_progressbar = hs.preferences.General.show_progressbar
-            if show_progressbar:
-                pbar = progressbar(total=None, desc="Absorption correction calculation")
-
-        composition = utils.stack(intensities, lazy=False, show_progressbar=False)
+        composition = utils.stack(intensities, show_progressbar=False)
 
         if take_off_angle == "auto":
             toa = self.get_take_off_angle()
@@ -446,114 +446,91 @@ class EDSTEMSpectrum(EDSSpectrum):
                         navigation_axes=self.axes_manager.navigation_axes
                     )
 
-        int_stack = utils.stack(intensities, lazy=False, show_progressbar=False)
-        comp_old = np.zeros_like(int_stack.data)
-
-        abs_corr_factor = None  # initial
-
+        dose = None
         if method == "CL":
-            quantification_method = utils_eds.quantification_cliff_lorimer
-            kwargs = {
-                "intensities": int_stack.data,
-                "kfactors": factors,
-                "absorption_correction": abs_corr_factor,
-                "mask": navigation_mask,
-            }
-
+            if absorption_correction and thickness is None:
+                raise ValueError(
+                    "Thickness is required for absorption correction "
+                    "with k-factor method. Results will contain no "
+                    "correction for absorption."
+                )
         elif method == "zeta":
-            quantification_method = utils_eds.quantification_zeta_factor
-            kwargs = {
-                "intensities": int_stack.data,
-                "zfactors": factors,
-                "dose": self._get_dose(method),
-                "absorption_correction": abs_corr_factor,
-            }
-
+            dose = self._get_dose(method)
         elif method == "cross_section":
-            quantification_method = utils_eds.quantification_cross_section
-            kwargs = {
-                "intensities": int_stack.data,
-                "cross_sections": factors,
-                "dose": self._get_dose(method, **kwargs),
-                "absorption_correction": abs_corr_factor,
-            }
-
+            dose = self._get_dose(method, **kwargs)
         else:
             raise ValueError(
                 "Please specify method for quantification, "
                 'as "CL", "zeta" or "cross_section".'
             )
 
-        while True:
-            results = quantification_method(**kwargs)
-
-            if method == "CL":
-                composition.data = results * 100.0
-                if absorption_correction:
-                    if thickness is not None:
-                        mass_thickness = intensities[0].deepcopy()
-                        mass_thickness.data = self.CL_get_mass_thickness(
-                            composition.split(), thickness
-                        )
-                        mass_thickness.metadata.General.title = "Mass thickness"
-                    else:
-                        raise ValueError(
-                            "Thickness is required for absorption correction "
-                            "with k-factor method. Results will contain no "
-                            "correction for absorption."
-                        )
-
-            elif method == "zeta":
-                composition.data = results[0] * 100
-                mass_thickness = intensities[0].deepcopy()
-                mass_thickness.data = results[1]
-
-            else:
-                composition.data = results[0] * 100.0
-                number_of_atoms = composition._deepcopy_with_new_data(results[1])
-
-            if method == "cross_section":
-                if absorption_correction:
-                    abs_corr_factor = utils_eds.get_abs_corr_cross_section(
-                        composition.split(), number_of_atoms.split(), toa, probe_area
-                    )
-                    kwargs["absorption_correction"] = abs_corr_factor
-            else:
-                if absorption_correction:
-                    abs_corr_factor = utils_eds.get_abs_corr_zeta(
-                        composition.split(), mass_thickness, toa
-                    )
-                    kwargs["absorption_correction"] = abs_corr_factor
-
-            res_max = np.max(composition.data - comp_old)
-            comp_old = composition.data
-
-            if absorption_correction and show_progressbar:
-                pbar.update(1)
-            it += 1
-            if not absorption_correction or abs(res_max) < convergence_criterion:
-                break
-            elif it >= max_iterations:
-                raise Exception(
-                    "Absorption correction failed as solution "
-                    f"did not converge after {max_iterations} "
-                    "iterations"
+        quantification_kwargs = {
+            "method": method,
+            "factors": list(factors),
+            "xray_lines": xray_lines,
+            "composition_units": composition_units,
+            "absorption_correction": absorption_correction,
+            "take_off_angle": toa,
+            "probe_area": probe_area,
+            "convergence_criterion": convergence_criterion,
+            "max_iterations": max_iterations,
+        }
+        # The values which can be given for each pixel
+        pixel_values = {"thickness": thickness, "dose": dose, "mask": navigation_mask}
+        for name, value in pixel_values.items():
+            if isinstance(value, BaseSignal):
+                pixel_values[name] = value.data
+
+        it = None
+        if composition._lazy:
+            # Each block of pixels is quantified independently, the
+            # composition, number of atoms and mass thickness being
+            # concatenated along the elements axis
+            data = composition.data.rechunk({0: -1})
+            names = [name for name, value in pixel_values.items() if np.ndim(value)]
+            arrays = [
+                da.broadcast_to(
+                    da.asarray(pixel_values.pop(name)), data.shape[1:]
+                ).rechunk(data.chunks[1:])
+                for name in names
+            ]
+            n = len(xray_lines)
+            results = da.map_blocks(
+                partial(
+                    utils_eds._quantification_absorption_block,
+                    names=names,
+                    **quantification_kwargs,
+                    **pixel_values,
+                ),
+                data,
+                *arrays,
+                dtype=float,
+                chunks=((2 * n + 1,),) + data.chunks[1:],
+            )
+            comp, atoms, mass_thickness_map = results[:n], results[n:-1], results[-1]
+        else:
+            if show_progressbar is None:  # pragma: no cover
+                show_progressbar = hs.preferences.General.show_progressbar
+            # Only the iterations of the absorption correction are shown, the
+            # lazy signals are computed with the progress bar of dask
+            with progressbar(
+                total=None,
+                desc="Absorption correction calculation",
+                disable=not (absorption_correction and show_progressbar),
+            ) as pbar:
+                results = utils_eds._quantification_absorption(
+                    composition.data, pbar=pbar, **quantification_kwargs, **pixel_values
                 )
+            comp, mass_thickness_map, atoms, it = results
 
-        if method == "cross_section":
-            number_of_atoms = composition._deepcopy_with_new_data(results[1])
+        composition.data = comp
+        if method == "zeta" or (method == "CL" and absorption_correction):
+            mass_thickness = intensities[0].deepcopy()
+            mass_thickness.data = mass_thickness_map
+        elif method == "cross_section":
+            number_of_atoms = composition._deepcopy_with_new_data(atoms)
             number_of_atoms = number_of_atoms.split()
-            composition = composition.split()
-        else:
-            composition = composition.split()
-
-        # convert ouput units to selection as required.
-        if composition_units == "atomic":
-            if method != "cross_section":
-                composition = material.weight_to_atomic(composition)
-        else:
-            if method == "cross_section":
-                composition = material.atomic_to_weight(composition)
+        composition = composition.split()
 
         # Label each of the elemental maps in the image stacks for composition.
         for i, xray_line in enumerate(xray_lines):
@@ -574,9 +551,15 @@ class EDSTEMSpectrum(EDSSpectrum):
                 number_of_atoms[i].metadata.set_item("Sample.elements", ([element]))
                 number_of_atoms[i].metadata.set_item("Sample.xray_lines", ([xray_line]))
         if plot_result and composition[i].axes_manager.navigation_size != 1:
-            utils.plot.plot_signals(composition, **kwargs)
+            if composition[0]._lazy:
+                plotted = [compo.deepcopy() for compo in composition]
+                for compo in plotted:
+                    compo.compute(show_progressbar=False)
+                utils.plot.plot_signals(plotted, **kwargs)
+            else:
+                utils.plot.plot_signals(composition, **kwargs)
 
-        if absorption_correction:
+        if absorption_correction and it is not None:
             _logger.info(f"Convergence reached after {it} interations.")
 
         if method == "zeta":
@@ -961,28 +944,19 @@ class EDSTEMSpectrum(EDSSpectrum):
         mass_thickness : :py:class:`numpy.ndarray`
             Mass thickness in kg/m².
         """
-        if isinstance(thickness, (float, int)):
-            thickness_map = np.ones_like(weight_percent[0]) * thickness
-        else:
-            thickness_map = thickness
-
         elements = [
             intensity.metadata.Sample.elements[0] for intensity in weight_percent
         ]
-        mass_thickness = np.zeros_like(weight_percent[0])
         densities = np.array(
             [
                 elements_db[element]["Physical_properties"]["density (g/cm^3)"]
                 for element in elements
             ]
         )
-        for density, element_composition in zip(densities, weight_percent):
-            # convert composition from % to fraction: factor of 1E-2
-            # convert thickness from nm to m: factor of 1E-9
-            # convert density from g/cm3 to kg/m2: factor of 1E3
-            elemental_mt = element_composition * thickness_map * density * 1e-8
-            mass_thickness += elemental_mt
-        return mass_thickness
+        weight_percent = np.array([composition.data for composition in weight_percent])
+        return utils_eds._get_mass_thickness(
+            weight_percent, np.asarray(thickness), densities
+        )
 
 
 class LazyEDSTEMSpectrum(EDSTEMSpectrum, LazyEDSSpectrum):
@@ -16,6 +16,135 @@
 # You should have received a copy of the GNU General Public License
 # along with exSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
+import numpy as np
+import pytest
+
+import exspy
+from exspy.components import EELSCLEdge
+
 
 def test_eels_cl_edge():
     pass
+
+
+class TestEELSCLEdgeAxisCache:
+    def setup_method(self, method):
+        edge = EELSCLEdge("B_K", GOS="hydrogenic")
+        edge.set_microscope_parameters(E0=100, alpha=10, beta=10, energy_scale=1.0)
+        edge._set_fine_structure_coeff()
+        self.rng = np.random.default_rng(0)
+        self.edge = edge
+        self.E = np.arange(150, 400, 1.0)
+
+    def set_random_coefficients(self):
+        n = self.edge.fine_structure_coeff._number_of_elements
+        self.edge.fine_structure_coeff.value = tuple(self.rng.random(n))
+
+    def assert_function_uncached(self):
+        # Descending axes are not cached
+        E = self.E
+        np.testing.assert_allclose(
+            self.edge.function(E), self.edge.function(E[::-1])[::-1]
+        )
+
+    @pytest.mark.parametrize("fine_structure_active", [True, False])
+    def test_function(self, fine_structure_active):
+        edge = self.edge
+        edge.fine_structure_active = fine_structure_active
+        self.set_random_coefficients()
+        self.assert_function_uncached()
+        assert len(edge._axis_cache) == 1
+        cache = edge._get_axis_cache(self.E)
+        # The cache is found for a different array with the same values
+        assert edge._get_axis_cache(self.E.copy()) is cache
+        assert edge._get_axis_cache(self.E + 0.5) is not cache
+        # Cache hit
+        self.assert_function_uncached()
+
+    @pytest.mark.parametrize("grad", ["fd", "analytical"])
+    def test_model_fit(self, grad):
+        # The model builds a new channel-switched axis array at each
+        # evaluation
+        s = exspy.data.EELS_MnFe(random_state=0)
+        m = s.create_model(GOS="hydrogenic")
+        assert not m.convolved
+        edges = [component for component in m if isinstance(component, EELSCLEdge)]
+        calls = []
+        for edge in edges:
+            get_axis_cache = edge._get_axis_cache
+
+            def wrapped(E, get_axis_cache=get_axis_cache):
+                cache = get_axis_cache(E)
+                calls.append(cache)
+                return cache
+
+            edge._get_axis_cache = wrapped
+        m.fit(grad=grad)
+        hits = len(calls) - len({id(cache) for cache in calls})
+        assert hits > 0
+        assert hits >= len(calls) // 2
+
+    def test_parameters_change(self):
+        edge = self.edge
+        edge.fine_structure_active = True
+        self.set_random_coefficients()
+        self.assert_function_uncached()
+        self.set_random_coefficients()
+        edge.intensity.value = 2
+        self.assert_function_uncached()
+        edge.onset_energy.value += 2.5
+        self.assert_function_uncached()
+        edge.fine_structure_width = 20
+        self.assert_function_uncached()
+        edge.fine_structure_active = False
+        self.assert_function_uncached()
+
+
+class TestEELSCLEdgeGradients:
+    def setup_method(self, method):
+        edge = EELSCLEdge("B_K", GOS="hydrogenic")
+        edge.set_microscope_parameters(E0=100, alpha=10, beta=10, energy_scale=1.0)
+        edge._set_fine_structure_coeff()
+        edge.fine_structure_active = True
+        n = edge.fine_structure_coeff._number_of_elements
+        edge.fine_structure_coeff.value = tuple(np.random.default_rng(0).random(n))
+        edge.intensity.value = 3
+        self.edge = edge
+        self.E = np.arange(150.0, 600.0)
+
+    def test_grad_fine_structure_coeff(self):
+        edge = self.edge
+        grad = edge.grad_fine_structure_coeff(self.E)
+        coefficients = np.array(edge.fine_structure_coeff.value)
+        assert grad.shape == (coefficients.size, self.E.size)
+        # The function is linear in the coefficients
+        f0 = edge.function(self.E)
+        for i in range(coefficients.size):
+            c = coefficients.copy()
+            c[i] += 1
+            edge.fine_structure_coeff.value = tuple(c)
+            np.testing.assert_allclose(
+                edge.function(self.E) - f0, grad[i], atol=1e-12 * np.abs(f0).max()
+            )
+        # Same result without the axis cache
+        np.testing.assert_allclose(
+            edge.grad_fine_structure_coeff(self.E[::-1])[:, ::-1],
+            edge.grad_fine_structure_coeff(self.E),
+        )
+
+    @pytest.mark.parametrize("fine_structure_active", [True, False])
+    def test_grad_onset_energy(self, fine_structure_active):
+        edge = self.edge
+        edge.fine_structure_active = fine_structure_active
+        # Avoid the onset energy falling on a channel
+        onset = edge.onset_energy.value + 0.3
+        d = 1e-3
+        edge.onset_energy.value = onset + d
+        f1 = edge.function(self.E)
+        edge.onset_energy.value = onset - d
+        f0 = edge.function(self.E)
+        edge.onset_energy.value = onset
+        grad = edge.grad_onset_energy(self.E)
+        np.testing.assert_allclose(
+            grad, (f1 - f0) / (2 * d), rtol=1e-2, atol=1e-4 * np.abs(grad).max()
+        )
@@ -16,9 +16,14 @@
 # You should have received a copy of the GNU General Public License
 # along with exSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
+import numpy as np
 import pytest
 
-from exspy.misc.eds.utils import _get_element_and_line
+from exspy.misc.eds.utils import (
+    _get_element_and_line,
+    _sum_windows,
+    quantification_cliff_lorimer,
+)
 
 
 def test_get_element_and_line():
@@ -26,3 +31,42 @@ def test_get_element_and_line():
 
     with pytest.raises(ValueError):
         _get_element_and_line("MnKa") == -1
+
+
+def test_sum_windows():
+    data = np.arange(60, dtype=np.uint16).reshape(3, 20)
+    # Overlapping, nested, empty and single channel windows
+    windows = [(2, 9), (5, 12), (6, 7), (4, 4), (0, 20), (19, 20)]
+    starts, stops = np.array(windows).T
+    sums = _sum_windows(data, starts, stops, dtype=float)
+    assert sums.dtype == float
+    expected = np.stack([data[:, i:j].sum(axis=-1) for i, j in windows], axis=-1)
+    np.testing.assert_array_equal(sums, expected)
+
+
+def test_quantification_cliff_lorimer():
+    kfactors = [1.0, 1.5, 2.0]
+    intensities = np.array(
+        [
+            [[10.0, 5.0, 0.05], [0.05, 0.0, 4.0]],
+            [[20.0, 0.08, 3.0], [6.0, 0.0, 4.0]],
+            [[5.0, 2.0, 0.0], [0.0, 0.0, 4.0]],
+        ]
+    )
+    absorption_correction = np.full_like(intensities, 0.5)
+    absorption_correction[0, 0, 0] = 1.0
+    mask = np.array([[False, False, False], [False, False, True]])
+    composition = quantification_cliff_lorimer(
+        intensities, kfactors, absorption_correction, mask
+    )
+    weighted = np.array([10.0, 0.5 * 20 * 1.5, 0.5 * 5 * 2])
+    np.testing.assert_allclose(composition[:, 0, 0], weighted / weighted.sum())
+    # The element below the threshold still enters the normalisation
+    weighted = np.array([0.5 * 5, 0.5 * 0.08 * 1.5, 0.5 * 2 * 2])
+    np.testing.assert_allclose(composition[:, 0, 1], weighted / weighted.sum())
+    # A single element above the threshold
+    np.testing.assert_array_equal(composition[:, 0, 2], [0.0, 1.0, 0.0])
+    np.testing.assert_array_equal(composition[:, 1, 0], [0.0, 1.0, 0.0])
+    # No element above the threshold and masked pixel
+    np.testing.assert_array_equal(composition[:, 1, 1], [0.0, 0.0, 0.0])
+    np.testing.assert_array_equal(composition[:, 1, 2], [0.0, 0.0, 0.0])
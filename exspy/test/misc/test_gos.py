@@ -17,12 +17,18 @@
 # along with exSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
 from pathlib import Path
+from unittest import mock
 
 import h5py
+import numpy as np
 import pooch
 import pytest
+from scipy import integrate
 
 from exspy._defaults_parser import preferences
+from exspy.components import EELSCLEdge
+from exspy.misc.eels.base_gos import R, a0
+from exspy.misc.eels.cross_section_cache import CrossSectionCache
 from exspy.misc.eels.gosh_gos import GoshGOS
 from exspy.misc.eels.hartree_slater_gos import HartreeSlaterGOS
 from exspy.misc.eels import HydrogenicGOS
@@ -80,3 +86,131 @@ def test_binding_energy_database():
         # These elements are not in the database
         if element not in ["Bk", "Cf", "Cm", "metadata"]:
             assert "Binding_energies" in elements[element]["Atomic_properties"].keys()
+
+
+@pytest.mark.parametrize("onset_shift", [0, 5.5])
+def test_tabulated_gos_integrateq(onset_shift):
+    gos = GoshGOS("Ti_L3")
+    angle = 0.02
+    E0 = 200
+    onset_energy = gos.onset_energy + onset_shift
+    gos.integrateq(onset_energy, angle, E0)
+
+    # Reference: integrate each tabulated energy separately
+    qint = np.zeros(gos.energy_axis.shape)
+    E = gos.energy_axis + onset_shift
+    qa0sqmin, qa0sqmax = gos._get_qa0sq_limits(E, angle, E0)
+    for i in range(qint.size):
+        qaxis, gos_i = gos.get_qaxis_and_gos(
+            i, np.sqrt(qa0sqmin[i]) / a0, np.sqrt(qa0sqmax[i]) / a0
+        )
+        qint[i] = integrate.simpson(gos_i, x=np.log((a0 * qaxis) ** 2))
+    gamma = 1 + E0 / 511.06
+    T = 511060 * (1 - 1 / gamma**2) / 2
+    qint *= (4.0 * np.pi * a0**2.0 * R**2 / E / T * gos.subshell_factor) * 1e28
+
+    # The tabulated GOS is integrated with Simpson's rule in both cases, but
+    # with different panels
+    np.testing.assert_allclose(gos.qint, qint, rtol=1e-3)
+    assert gos.energy_shift == onset_shift
+
+
+@pytest.mark.parametrize("angle, E0", [(0.005, 60), (0.02, 200), (0.1, 300)])
+def test_tabulated_gos_integrate_logq(angle, E0):
+    def gos_function(qa0, c):
+        return qa0**2 / (1 + qa0**2 / c) ** 4
+
+    # GOS table with the q axis of the GOSH files
+    gos = GoshGOS.__new__(GoshGOS)
+    gos.qaxis = np.logspace(np.log10(0.05e10), np.log10(50e10), 128)
+    gos.onset_energy = 455.0
+    gos.energy_axis = gos.onset_energy + np.linspace(0, 400, 100)
+    c = 1 + (gos.energy_axis - gos.onset_energy) / 100
+    gos.gos_array = gos_function(a0 * gos.qaxis, c[:, np.newaxis])
+    qa0sqmin, qa0sqmax = gos._get_qa0sq_limits(gos.energy_axis, angle, E0)
+    qint = gos._integrate_logq(np.sqrt(qa0sqmin) / a0, np.sqrt(qa0sqmax) / a0)
+
+    expected = [
+        integrate.quad(
+            lambda x: gos_function(np.exp(x / 2), c_i),
+            np.log(qa0sqmin_i),
+            np.log(qa0sqmax_i),
+            epsrel=1e-12,
+        )[0]
+        for qa0sqmin_i, qa0sqmax_i, c_i in zip(qa0sqmin, qa0sqmax, c)
+    ]
+    np.testing.assert_allclose(qint, expected, rtol=1e-4)
+
+
+def test_cross_section_cache(tmp_path):
+    cache = CrossSectionCache(tmp_path, max_size=1e6)
+    gos = HydrogenicGOS("B_K")
+    key = cache.get_key(gos, 100, 0.01, 0)
+    assert key != cache.get_key(gos, 100, 0.01, 1)
+    assert cache.get(key) is None
+    cache.set(key, qint=np.arange(10.0))
+    np.testing.assert_allclose(cache.get(key)["qint"], np.arange(10.0))
+    cache.clear()
+    assert cache.get(key) is None
+
+
+def test_cross_section_cache_eviction(tmp_path):
+    cache = CrossSectionCache(tmp_path, max_size=1e6)
+    cache.set("a", data=np.zeros(50_000))
+    cache.set("b", data=np.zeros(50_000))
+    # Exceeds the maximum size, the least recently used is removed
+    cache.set("c", data=np.zeros(50_000))
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert cache.get("c") is not None
+
+
+def test_eels_cl_edge_cross_section_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(preferences.EELS, "gos_cache_enabled", True)
+    monkeypatch.setattr(preferences.EELS, "gos_cache_path", str(tmp_path))
+    edge = EELSCLEdge("B_K", GOS="hydrogenic")
+    edge.set_microscope_parameters(E0=100, alpha=10, beta=10, energy_scale=0.5)
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+    E = np.linspace(150, 400, 100)
+    expected = edge.function(E)
+
+    edge2 = EELSCLEdge("B_K", GOS="hydrogenic")
+    with mock.patch.object(edge2.GOS, "integrateq") as integrateq:
+        edge2.set_microscope_parameters(E0=100, alpha=10, beta=10, energy_scale=0.5)
+        integrateq.assert_not_called()
+    np.testing.assert_allclose(edge2.function(E), expected)
+
+
+def test_gosh_shared_tables():
+    gos1 = GoshGOS("Ti_L3")
+    with mock.patch("pooch.retrieve") as retrieve:
+        gos2 = GoshGOS("Ti_L3")
+        retrieve.assert_not_called()
+    assert np.shares_memory(gos1.gos_array, gos2.gos_array)
+    assert not gos1.gos_array.flags.writeable
+    # The integration does not modify the shared table
+    gos1.integrateq(gos1.onset_energy, 0.02, 200)
+
+
+@pytest.mark.parametrize("element_subshell", ["B_K", "Ti_L3"])
+def test_hydrogenic_gos_integrateq(element_subshell):
+    gos = HydrogenicGOS(element_subshell)
+    angle = 0.01
+    E0 = 100
+    gos.integrateq(gos.onset_energy, angle, E0)
+
+    # Reference: adaptive quadrature of each energy separately
+    E = gos.energy_axis
+    qa0sqmin, qa0sqmax = gos._get_qa0sq_limits(E, angle, E0)
+    gamma = 1 + E0 / 511.06
+    T = 511060 * (1 - 1 / gamma**2) / 2
+    qint = [
+        3.5166e8
+        * (R / T)
+        * (R / E_)
+        * integrate.quad(
+            lambda x: gos.gosfunc(E_, np.exp(x)), np.log(qmin), np.log(qmax)
+        )[0]
+        for E_, qmin, qmax in zip(E, qa0sqmin, qa0sqmax)
+    ]
+    np.testing.assert_allclose(gos.qint, qint, rtol=1e-3)
@@ -107,6 +107,44 @@ def test_mac():
     )
 
 
+def test_mac_table():
+    index, offsets, energies, macs = ex.material._ffast_mac_table()
+    assert len(index) == len(offsets) - 1
+    assert offsets[0] == 0 and offsets[-1] == len(energies) == len(macs)
+    for element, i in index.items():
+        start, stop = offsets[i], offsets[i + 1]
+        assert stop - start > 2
+        assert np.all(np.diff(energies[start:stop]) >= 0)
+        assert np.all(macs[start:stop] > 0)
+
+
+def test_mac_out_of_range():
+    index, offsets, energies, macs = ex.material._ffast_mac_table()
+    start, stop = offsets[index["Fe"]], offsets[index["Fe"] + 1]
+    np.testing.assert_allclose(
+        ex.material.mass_absorption_coefficient(
+            "Fe", [0.0, energies[start] / 2, energies[start], energies[stop - 1]]
+        ),
+        [0.0, 0.0, macs[start], macs[stop - 1]],
+    )
+    with pytest.raises(ValueError, match="only tabulated up to"):
+        ex.material.mass_absorption_coefficient("Fe", energies[stop - 1] + 1)
+    with pytest.raises(AttributeError, match="Xx"):
+        ex.material.mass_absorption_coefficient("Xx", 1.0)
+
+
+def test_mixture_mac_vectorized():
+    elements = ["Fe", "Pt", "Cu"]
+    lines = ["Fe_Ka", "Pt_La", "Cu_Ka"]
+    wt = np.random.RandomState(0).random((3, 4, 5)) * 30
+    mac = ex.material.mass_absorption_mixture(wt, elements, lines)
+    assert mac.shape == (3, 4, 5)
+    np.testing.assert_allclose(
+        mac[:, 1, 2],
+        ex.material.mass_absorption_mixture(wt[:, 1, 2], elements, lines),
+    )
+
+
 def test_mixture_mac():
     np.testing.assert_allclose(
         ex.material.mass_absorption_mixture([50, 50], ["Al", "Zn"], "Al_Ka"),
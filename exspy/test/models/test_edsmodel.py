@@ -326,3 +326,110 @@ class TestMaps:
             m_single_fit.inav[0, 0].get_lines_intensity(xray_lines),
         ):
             np.testing.assert_allclose(fitted, expected, atol=1e-7)
+
+    def test_lines_intensity_pyramid(self):
+        s = self.s
+        m = s.create_model()
+        m.multifit()
+        m2 = s.create_model()
+        m2.multifit(pyramid=(2,))
+        for fitted, expected in zip(m2.get_lines_intensity(), m.get_lines_intensity()):
+            np.testing.assert_allclose(fitted.data, expected.data, atol=1e-7)
+
+    @pytest.mark.parametrize(
+        "iterpath, seed_from_neighbours",
+        [("hilbert", False), ("coarse-to-fine", True), (None, True)],
+    )
+    def test_lines_intensity_iterpath(self, iterpath, seed_from_neighbours):
+        s = self.s
+        # Linear fitting, so that the solution does not depend on the
+        # starting values
+        m = s.create_model()
+        m.multifit(optimizer="lstsq")
+        m2 = s.create_model()
+        m2.multifit(
+            iterpath=iterpath,
+            seed_from_neighbours=seed_from_neighbours,
+            optimizer="lstsq",
+        )
+        for fitted, expected in zip(m2.get_lines_intensity(), m.get_lines_intensity()):
+            np.testing.assert_allclose(fitted.data, expected.data, atol=1e-7)
+
+    def test_lines_intensity_linear(self):
+        s = self.s
+        m = s.create_model()
+        m.multifit(optimizer="lstsq")
+        m2 = s.create_model()
+        m2.linear_multifit()
+        for fitted, expected in zip(m2.get_lines_intensity(), m.get_lines_intensity()):
+            np.testing.assert_allclose(fitted.data, expected.data, atol=1e-7)
+        # The twinned lines are set too
+        weight = elements_db["Fe"]["Atomic_properties"]["Xray_lines"]["Kb"]["weight"]
+        np.testing.assert_allclose(
+            m2["Fe_Kb"].A.map["values"], m2["Fe_Ka"].A.map["values"] * weight
+        )
+        np.testing.assert_array_equal(m2.dof.data, len(m2._free_parameters))
+
+    def test_lines_intensity_linear_fixed_background(self):
+        s = self.s
+        m = s.create_model()
+        m.fit_background(kind="multi")
+        mask = np.array([[False, True], [False, False]])
+        values = m["Fe_Ka"].A.map["values"].copy()
+        m.linear_multifit(mask=mask)
+        np.testing.assert_allclose(
+            m["Fe_Ka"].A.map["values"][~mask], self.mix[~mask] * 0.3, atol=1e-3
+        )
+        assert m["Fe_Ka"].A.map["values"][mask] == values[mask]
+
+    def test_lines_intensity_linear_poisson(self):
+        s = self.s
+        # Low counts
+        s.data = s.data / s.data.sum(axis=-1, keepdims=True) * 2000
+        m = s.create_model()
+        m.linear_multifit()
+        m2 = s.create_model()
+        m2.linear_multifit(loss_function="ML-poisson")
+        for fitted, expected in zip(m2.get_lines_intensity(), m.get_lines_intensity()):
+            np.testing.assert_allclose(fitted.data, expected.data, rtol=1e-3, atol=1e-2)
+        s.data = np.random.default_rng(0).poisson(s.data).astype(float)
+        m2.linear_multifit(loss_function="ML-poisson")
+        m2.axes_manager.indices = (1, 1)
+        mean = m2._get_current_data(onlyactive=True)
+        assert np.all(mean > 0)
+        # The maximum likelihood estimate preserves the number of counts
+        np.testing.assert_allclose(mean.sum(), s.data[1, 1].sum(), rtol=1e-3)
+
+    def test_linear_multifit_error(self):
+        m = self.s.create_model()
+        m["Fe_Ka"].centre.free = True
+        with pytest.raises(ValueError, match="must be linear"):
+            m.linear_multifit()
+        with pytest.raises(ValueError, match="`loss_function` must be"):
+            m.linear_multifit(loss_function="huber")
+
+    def test_lines_intensity_checkpoint(self, tmp_path):
+        s = self.s
+        checkpoint = tmp_path / "fit.npz"
+        m = s.create_model()
+        m.multifit(optimizer="lstsq")
+        # Interrupted fit
+        m1 = s.create_model()
+        mask = np.array([[False, False], [True, True]])
+        m1.multifit(mask=mask, checkpoint=checkpoint, optimizer="lstsq")
+        np.testing.assert_array_equal(np.load(checkpoint)["done"], ~mask)
+        m2 = s.create_model()
+        m2.multifit(checkpoint=checkpoint, resume=True, optimizer="lstsq")
+        np.testing.assert_array_equal(np.load(checkpoint)["done"], True)
+        for fitted, expected in zip(m2.get_lines_intensity(), m.get_lines_intensity()):
+            np.testing.assert_allclose(fitted.data, expected.data, atol=1e-7)
+
+    def test_checkpoint_error(self, tmp_path):
+        checkpoint = tmp_path / "fit.npz"
+        m = self.s.create_model()
+        with pytest.raises(ValueError, match="`checkpoint` is required"):
+            m.multifit(resume=True)
+        m.multifit(checkpoint=checkpoint)
+        m2 = self.s.inav[0].create_model()
+        with pytest.raises(ValueError, match="navigation shape"):
+            m2.multifit(checkpoint=checkpoint, resume=True)
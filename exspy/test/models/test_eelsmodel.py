@@ -25,6 +25,7 @@ import pooch
 import pytest
 
 import hyperspy.api as hs
+import exspy
 from exspy.misc.elements import elements_db as elements
 from hyperspy.decorators import lazifyTestClass
 from exspy.misc.eels.gosh_gos import _GOSH_URL, _GOSH_KNOWN_HASH
@@ -487,6 +488,32 @@ class TestFitBackground2D:
         assert pytest.approx(residual.data) == 0
 
 
+class TestSmartFitAllPixels:
+    def setup_method(self, method):
+        s = exspy.data.EELS_MnFe(navigation_shape=(), random_state=0)
+        self.s = s
+        self.s3 = hs.stack([s] * 3)
+
+    def test_only_current_false(self):
+        m = self.s.create_model(GOS="hydrogenic")
+        m.smart_fit()
+        m3 = self.s3.create_model(GOS="hydrogenic")
+        m3.smart_fit(only_current=False)
+        assert m3.axes_manager.indices == (0,)
+        for c, c3 in zip(m, m3):
+            for p, p3 in zip(c.parameters, c3.parameters):
+                assert p3.map["is_set"].all()
+                np.testing.assert_allclose(
+                    p3.map["values"], np.stack([p.value] * 3), rtol=1e-3
+                )
+
+    def test_mask(self):
+        m3 = self.s3.create_model(GOS="hydrogenic")
+        m3.smart_fit(only_current=False, mask=np.array([False, True, False]))
+        intensity = m3.components.Mn_L3.intensity
+        np.testing.assert_array_equal(intensity.map["is_set"], [True, False, True])
+
+
 @lazifyTestClass
 class TestEELSFineStructure:
     def setup_method(self, method):
@@ -730,6 +757,240 @@ class TestConvolveModelSlicing:
         assert m.signal.data.shape == m1.low_loss.data.shape
 
 
+class TestConvolution:
+    def setup_method(self, method):
+        rng = np.random.default_rng(0)
+        s = EELSSpectrum(rng.random((2, 300)))
+        s.axes_manager[-1].offset = 100.0
+        ll = EELSSpectrum(rng.random((2, 100)))
+        ll.axes_manager[-1].offset = -20.0
+        m = s.create_model(auto_add_edges=False, auto_background=False)
+        m.low_loss = ll
+        m.extend([hs.model.components1D.Gaussian(), hs.model.components1D.Gaussian()])
+        m[0].A.value = 1000
+        m[0].centre.value = 200
+        m[0].sigma.value = 20
+        m[1].convolved = False
+        self.m = m
+
+    def _convolve(self, values):
+        m = self.m
+        ll = m.low_loss._get_current_data(m.axes_manager)
+        return np.convolve(values, ll, mode="valid")
+
+    @pytest.mark.parametrize("index", [0, 1])
+    def test_convolve(self, index):
+        m = self.m
+        m.axes_manager.indices = (index,)
+        values = np.random.default_rng(1).random((3, len(m.convolution_axis)))
+        convolved = m._convolve(values)
+        assert m._low_loss_cache["fft"] is not None
+        for v, c in zip(values, convolved):
+            np.testing.assert_allclose(c, self._convolve(v))
+
+    def test_get_model_data(self):
+        m = self.m
+        expected = self._convolve(m[0].function(m.convolution_axis))
+        expected += m[1].function(m.axis.axis)
+        np.testing.assert_allclose(
+            m._get_model_data(component_list=m), expected, atol=1e-9
+        )
+
+    def test_jacobian(self):
+        m = self.m
+        m._set_p0()
+        jac = m._jacobian(m.p0, None)
+        assert jac.shape == (6, m.axis.size)
+        np.testing.assert_allclose(
+            jac[0], self._convolve(m[0].A.grad(m.convolution_axis))
+        )
+        np.testing.assert_allclose(jac[3], m[1].A.grad(m.axis.axis))
+
+    def test_jacobian_buffer(self):
+        m = self.m
+        m._set_p0()
+        m._channel_switches[:50] = False
+        jac = m._jacobian(m.p0, None).copy()
+        assert jac.shape == (6, 250)
+        np.testing.assert_allclose(
+            jac[0], self._convolve(m[0].A.grad(m.convolution_axis))[50:]
+        )
+        m[1].active = False
+        m._set_p0()
+        jac2 = m._jacobian(m.p0, None, weights=2.0)
+        np.testing.assert_allclose(jac2, 2 * jac[:3])
+        # The scratch buffer is reused, but not the returned jacobian, which
+        # the caller may still hold
+        jac3 = m._jacobian(m.p0, None)
+        assert jac3 is not jac2
+        np.testing.assert_allclose(jac2, 2 * jac[:3])
+        np.testing.assert_allclose(jac3, jac[:3])
+
+    def test_direct_convolution(self):
+        m = self.m
+        expected = m._convolve(m[0].function(m.convolution_axis))
+        with mock.patch("exspy.models.eelsmodel._FFT_CONVOLUTION_MIN_SIZE", 1000):
+            m._clear_low_loss_cache()
+            np.testing.assert_allclose(
+                m._convolve(m[0].function(m.convolution_axis)), expected, atol=1e-9
+            )
+            assert m._low_loss_cache["fft"] is None
+
+
+class TestParallelMultifit:
+    def setup_method(self, method):
+        s = exspy.data.EELS_MnFe(navigation_shape=(6,), random_state=0)
+        self.models = []
+        for _ in range(2):
+            m = s.create_model(GOS="hydrogenic")
+            m.assign_current_values_to_all()
+            self.models.append(m)
+
+    def _assert_models_equal(self):
+        m_serial, m_parallel = self.models
+        for c_serial, c_parallel in zip(m_serial, m_parallel):
+            for p_serial, p_parallel in zip(c_serial.parameters, c_parallel.parameters):
+                for field in ("values", "std", "is_set"):
+                    np.testing.assert_array_equal(
+                        p_serial.map[field], p_parallel.map[field]
+                    )
+        np.testing.assert_array_equal(m_serial.chisq.data, m_parallel.chisq.data)
+        np.testing.assert_array_equal(m_serial.dof.data, m_parallel.dof.data)
+
+    @pytest.mark.parametrize("kind", ["std", "smart"])
+    def test_identical_to_serial(self, kind):
+        m_serial, m_parallel = self.models
+        m_serial.multifit(kind=kind)
+        m_parallel.multifit(kind=kind, workers=2)
+        self._assert_models_equal()
+
+    def test_identical_to_serial_low_loss(self):
+        low_loss = exspy.data.EELS_low_loss(navigation_shape=(6,), random_state=0)
+        for m in self.models:
+            m.low_loss = low_loss
+            m.assign_current_values_to_all()
+        m_serial, m_parallel = self.models
+        m_serial.multifit()
+        m_parallel.multifit(workers=2)
+        self._assert_models_equal()
+
+    def test_mask(self):
+        m = self.models[0]
+        intensity = m.components.Mn_L3.intensity
+        values = intensity.map["values"].copy()
+        mask = np.zeros(6, dtype=bool)
+        mask[2] = True
+        m.multifit(mask=mask, workers=2)
+        assert intensity.map["values"][2] == values[2]
+        assert np.all(intensity.map["values"][~mask] != values[~mask])
+
+    def test_workers_error(self):
+        with pytest.raises(ValueError, match="positive integer"):
+            self.models[0].multifit(workers=0)
+        with pytest.raises(ValueError, match="autosave is not supported"):
+            self.models[0].multifit(workers=2, autosave=True)
+        with pytest.raises(ValueError, match="fetch_only_fixed is not supported"):
+            self.models[0].multifit(workers=2, fetch_only_fixed=True)
+
+    def test_values_not_stored_error(self):
+        m = self.models[0]
+        m.components.Mn_L3.intensity.map["is_set"][3] = False
+        with pytest.raises(ValueError, match="must be stored in all pixels"):
+            m.multifit(workers=2)
+        mask = np.zeros(6, dtype=bool)
+        mask[3] = True
+        m.multifit(mask=mask, workers=2)
+
+
+class TestPyramidMultifit:
+    def setup_method(self, method):
+        s = exspy.data.EELS_MnFe(navigation_shape=(6,), random_state=0)
+        self.m = s.create_model(GOS="hydrogenic")
+
+    def test_binned_model(self):
+        m = self.m
+        binned = m._get_binned_model([4])
+        assert binned.axes_manager.navigation_shape == (1,)
+        np.testing.assert_allclose(binned.signal.data[0], m.signal.data[:4].mean(0))
+        assert [c.name for c in binned] == [c.name for c in m]
+        assert not binned.components.Mn_L3.intensity.map["is_set"].any()
+
+    def test_pyramid(self):
+        m = self.m
+        m2 = self.m.signal.create_model(GOS="hydrogenic")
+        m.multifit()
+        m2.multifit(pyramid=(4, 2))
+        for edge in ("Mn_L3", "Fe_L3"):
+            np.testing.assert_allclose(
+                m2[edge].intensity.map["values"],
+                m[edge].intensity.map["values"],
+                rtol=1e-2,
+            )
+
+    def test_pyramid_workers(self):
+        m = self.m
+        m2 = self.m.signal.create_model(GOS="hydrogenic")
+        m.assign_current_values_to_all()
+        m2.assign_current_values_to_all()
+        m.multifit(pyramid=(2,))
+        m2.multifit(pyramid=(2,), workers=2)
+        for edge in ("Mn_L3", "Fe_L3"):
+            np.testing.assert_array_equal(
+                m2[edge].intensity.map["values"], m[edge].intensity.map["values"]
+            )
+
+    def test_pyramid_error(self):
+        with pytest.raises(ValueError, match="positive integers"):
+            self.m.multifit(pyramid=(1.5,))
+
+
+class TestLazyMultifit:
+    def setup_method(self, method):
+        s = exspy.data.EELS_MnFe(navigation_shape=(6,), random_state=0)
+        low_loss = exspy.data.EELS_low_loss(navigation_shape=(6,), random_state=0)
+        self.m = s.create_model(GOS="hydrogenic", low_loss=low_loss)
+        self.m.assign_current_values_to_all()
+        s_lazy = s.as_lazy()
+        s_lazy.data = s_lazy.data.rechunk((4, -1))
+        self.m_lazy = s_lazy.create_model(GOS="hydrogenic", low_loss=low_loss.as_lazy())
+        # The background is estimated with dask in the lazy model, which is
+        # not bit-identical, so both models start from the same values
+        for c, c_lazy in zip(self.m, self.m_lazy):
+            for p, p_lazy in zip(c.parameters, c_lazy.parameters):
+                p_lazy.map[:] = p.map
+                p_lazy.value = p.value
+
+    def _assert_models_equal(self, m1, m2):
+        for c1, c2 in zip(m1, m2):
+            for p1, p2 in zip(c1.parameters, c2.parameters):
+                for field in ("values", "std", "is_set"):
+                    np.testing.assert_array_equal(p1.map[field], p2.map[field])
+        np.testing.assert_array_equal(m1.chisq.data, np.asarray(m2.chisq.data))
+        np.testing.assert_array_equal(m1.dof.data, np.asarray(m2.dof.data))
+
+    @pytest.mark.parametrize("kind", ["std", "smart"])
+    def test_lazy_multifit(self, kind):
+        self.m.multifit(kind=kind)
+        self.m_lazy.lazy_multifit(kind=kind)
+        self._assert_models_equal(self.m, self.m_lazy)
+
+    @pytest.mark.parametrize("suffix", [".hdf5", ".zarr"])
+    def test_store(self, tmp_path, suffix):
+        if suffix == ".zarr":
+            pytest.importorskip("zarr")
+        mask = np.zeros(6, dtype=bool)
+        mask[1] = True
+        self.m.multifit(mask=mask)
+        store = tmp_path / f"maps{suffix}"
+        self.m_lazy.lazy_multifit(mask=mask, store=store)
+        assert store.exists()
+        self._assert_models_equal(self.m, self.m_lazy)
+
+    def test_store_error(self):
+        with pytest.raises(ValueError, match="zarr or HDF5"):
+            self.m_lazy.lazy_multifit(store="maps.txt")
+
+
 class TestModelDictionary:
     def setup_method(self, method):
         s = EELSSpectrum(np.array([1.0, 2, 4, 7, 12, 7, 4, 2, 1]))
@@ -765,3 +1026,94 @@ class TestModelDictionary:
                 np.testing.assert_allclose(po.map["is_set"], pn.map["is_set"])
 
         assert mn[0].A.twin is mn[1].A
+
+
+class TestOnsetShiftTable:
+    def setup_method(self, method):
+        s = EELSSpectrum(np.ones(500))
+        s.set_microscope_parameters(100, 10, 10)
+        s.axes_manager[-1].offset = 150
+        s.add_elements(("B",))
+        self.m = s.create_model(auto_background=False)
+
+    def test_function(self):
+        m = self.m
+        edge = m.components.B_K
+        onset = edge.onset_energy.value
+        edge.onset_energy.value = onset + 1.3
+        expected = edge.function(m.axis.axis)
+        edge.onset_energy.value = onset
+        m.enable_free_onset_energy(onset_shift_table=True)
+        assert edge._onset_shift_table is not None
+        edge.onset_energy.value = onset + 1.3
+        np.testing.assert_allclose(edge.function(m.axis.axis), expected, rtol=1e-2)
+
+    def test_out_of_table(self):
+        m = self.m
+        edge = m.components.B_K
+        onset = edge.onset_energy.value
+        m.enable_free_onset_energy(onset_shift_table=True, onset_shift_width=2)
+        edge.onset_energy.value = onset + 5
+        shifts = edge._onset_shift_table["shifts"]
+        assert shifts[0] < edge.GOS.energy_shift < shifts[-1]
+
+    def test_grad_onset_energy(self):
+        m = self.m
+        edge = m.components.B_K
+        m.enable_free_onset_energy(onset_shift_table=True)
+        onset = edge.onset_energy.value + 1.3
+        x = m.axis.axis
+        d = 1e-3
+        edge.onset_energy.value = onset + d
+        f1 = edge.function(x)
+        edge.onset_energy.value = onset - d
+        f0 = edge.function(x)
+        edge.onset_energy.value = onset
+        grad = edge.grad_onset_energy(x)
+        np.testing.assert_allclose(
+            grad, (f1 - f0) / (2 * d), rtol=1e-3, atol=1e-6 * np.abs(grad).max()
+        )
+
+    def test_disable_free_onset_energy(self):
+        m = self.m
+        edge = m.components.B_K
+        m.enable_free_onset_energy(onset_shift_table=True)
+        assert edge.free_onset_energy
+        m.disable_free_onset_energy()
+        assert not edge.free_onset_energy
+        assert edge._onset_shift_table is None
+
+
+class TestEELSCLEdgeFunctionND:
+    def setup_method(self, method):
+        s = EELSSpectrum(np.ones((2, 3, 300)))
+        s.set_microscope_parameters(100, 10, 10)
+        s.axes_manager[-1].offset = 150
+        s.add_elements(("B",))
+        m = s.create_model(auto_background=False)
+        m.enable_fine_structure()
+        edge = m.components.B_K
+        rng = np.random.default_rng(0)
+        n = edge.fine_structure_coeff._number_of_elements
+        edge.intensity.map["values"] = rng.random((2, 3))
+        edge.onset_energy.map["values"] = edge.onset_energy.value + np.array(
+            [[0, 0, 1.5], [0, 1.5, 0]]
+        )
+        edge.fine_structure_coeff.map["values"] = rng.random((2, 3, n))
+        edge.effective_angle.map["values"] = edge.effective_angle.value
+        for parameter in edge.parameters:
+            parameter.map["is_set"] = True
+        self.m = m
+
+    @pytest.mark.parametrize("fine_structure_active", [True, False])
+    def test_function_nd(self, fine_structure_active):
+        m = self.m
+        edge = m.components.B_K
+        edge.fine_structure_active = fine_structure_active
+        x = m.axis.axis
+        values = edge.function_nd(x)
+        assert values.shape == (2, 3, x.size)
+        for index in np.ndindex(2, 3):
+            m.axes_manager.indices = index[::-1]
+            edge.fetch_stored_values()
+            np.testing.assert_allclose(values[index], edge.function(x))
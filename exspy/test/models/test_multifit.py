@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The exSpy developers
+#
+# This file is part of exSpy.
+#
+# exSpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# exSpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with exSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+import numpy as np
+import pytest
+from scipy.optimize import lsq_linear, minimize
+
+from exspy.models._multifit import batched_lstsq, batched_poisson_mle, get_iterpath
+
+
+@pytest.mark.parametrize(
+    "iterpath", ["flyback", "serpentine", "hilbert", "coarse-to-fine"]
+)
+@pytest.mark.parametrize("nav_shape", [(7,), (5, 6), (8, 8)])
+def test_iterpath_visits_all_pixels(iterpath, nav_shape):
+    path = [index for index, _ in get_iterpath(nav_shape, iterpath)]
+    assert len(path) == np.prod(nav_shape)
+    assert set(path) == set(np.ndindex(nav_shape))
+
+
+@pytest.mark.parametrize("iterpath", ["serpentine", "hilbert"])
+def test_iterpath_locality(iterpath):
+    path = np.array([index for index, _ in get_iterpath((8, 8), iterpath)])
+    # Consecutive pixels are adjacent
+    np.testing.assert_array_equal(np.abs(np.diff(path, axis=0)).sum(axis=1), 1)
+
+
+def test_iterpath_coarse_to_fine():
+    path = get_iterpath((5, 6), "coarse-to-fine")
+    assert path[:4] == [((0, 0), 4), ((0, 4), 4), ((4, 0), 4), ((4, 4), 4)]
+    assert [distance for _, distance in path[-15:]] == [1] * 15
+
+
+def test_iterpath_error():
+    with pytest.raises(ValueError, match="Hilbert"):
+        get_iterpath((2, 2, 2), "hilbert")
+    with pytest.raises(ValueError, match="must be one of"):
+        get_iterpath((2, 2), "spiral")
+
+
+@pytest.mark.parametrize("max_iterations", [None, 0])
+def test_batched_lstsq(max_iterations):
+    rng = np.random.default_rng(0)
+    design = rng.random((100, 6))
+    data = rng.normal(size=(50, 6)) @ design.T
+    nonnegative = np.array([False] + [True] * 5)
+    coefficients = batched_lstsq(design, data, nonnegative, max_iterations)
+    lower_bounds = np.where(nonnegative, 0, -np.inf)
+    for x, y in zip(coefficients, data):
+        expected = lsq_linear(design, y, bounds=(lower_bounds, np.inf), method="bvls")
+        np.testing.assert_allclose(x, expected.x, atol=1e-10)
+    np.testing.assert_allclose(
+        batched_lstsq(design, data), np.linalg.lstsq(design, data.T, rcond=None)[0].T
+    )
+
+
+def test_batched_poisson_mle():
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 1, 200)
+    lines = [np.exp(-0.5 * ((x - centre) / 0.02) ** 2) for centre in (0.3, 0.33, 0.7)]
+    design = np.stack(lines + [np.ones_like(x), x, x**2], axis=1)
+    nonnegative = np.array([True, True, True, False, False, False])
+    # Low counts, with a line of zero intensity
+    data = rng.poisson(design @ [3.0, 0.0, 2.0, 0.2, 0.1, -0.1], size=(20, 200))
+    offset = 0.05
+    coefficients = batched_poisson_mle(design, data, nonnegative, offset)
+    assert np.all(coefficients[:, nonnegative] >= 0)
+
+    def nll(p, y):
+        mean = design @ p + offset
+        if np.any(mean <= 0):
+            return np.inf, np.zeros_like(p)
+        return np.sum(mean - y * np.log(mean)), (1 - y / mean) @ design
+
+    bounds = [(0, None) if positive else (None, None) for positive in nonnegative]
+    for p, y in zip(coefficients, data):
+        expected = minimize(nll, p, args=(y,), jac=True, bounds=bounds)
+        assert nll(p, y)[0] <= expected.fun + 1e-6
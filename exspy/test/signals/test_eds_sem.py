@@ -343,6 +343,28 @@ class Test_get_lines_intensity:
             s.estimate_integration_windows(3.0, ["Al_Ka"]), [[1.371, 1.601]], atol=1e-2
         )
 
+    def test_windows_integration(self):
+        s = self.signal + 1.0
+        xray_lines = ["Al_Ka", "Si_Ka"]
+        bw = s.estimate_background_windows(xray_lines=xray_lines)
+        iw = s.estimate_integration_windows(xray_lines=xray_lines)
+        intensities = s.get_lines_intensity(
+            xray_lines, integration_windows=iw, background_windows=bw
+        )
+        for intensity, window, background in zip(intensities, iw, bw):
+            assert intensity._lazy == s._lazy
+            expected = s.isig[window[0] : window[1]].sum(-1).data
+            backgrounds = [
+                s.isig[background[0] : background[1]].sum(-1).data,
+                s.isig[background[2] : background[3]].sum(-1).data,
+            ]
+            ax = s.axes_manager.signal_axes[0]
+            indexes = [ax.value2index(v) for v in list(background) + list(window)]
+            expected = expected - sum(backgrounds) * (indexes[5] - indexes[4]) / (
+                (indexes[1] - indexes[0]) + (indexes[3] - indexes[2])
+            )
+            np.testing.assert_allclose(intensity.data, expected)
+
     def test_with_signals_examples(self):
         s = exspy.data.EDS_SEM_TM002()
         np.testing.assert_allclose(
@@ -17,6 +17,7 @@
 # along with exSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
 
 import warnings
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -324,6 +325,79 @@ class Test_quantification:
         )
         np.testing.assert_allclose(res[0].data, res4[0][0].data, atol=1e-5)
 
+    def test_quant_lorimer_ac_per_pixel_convergence(self):
+        s = self.signal
+        kfactors = [1, 2.0009344042484134]
+        thickness = np.array([[1.0, 100.0], [300.0, 3000.0]])
+        intensities = s.get_lines_intensity()
+        res = s.quantification(
+            intensities,
+            "CL",
+            kfactors,
+            absorption_correction=True,
+            thickness=thickness,
+        )
+        # The thicker pixels need more iterations, which do not change the
+        # pixels that have already converged
+        for index in np.ndindex(thickness.shape):
+            res_pixel = s.quantification(
+                intensities,
+                "CL",
+                kfactors,
+                absorption_correction=True,
+                thickness=thickness[index],
+            )
+            for composition, composition_pixel in zip(res[0], res_pixel[0]):
+                np.testing.assert_allclose(
+                    composition.data[index], composition_pixel.data[index]
+                )
+            np.testing.assert_allclose(res[1].data[index], res_pixel[1].data[index])
+
+    @pytest.mark.parametrize(
+        "method, factors",
+        [("CL", [1, 2.0]), ("zeta", [20, 50]), ("cross_section", [3, 5])],
+    )
+    def test_quant_lazy_chunks(self, method, factors):
+        s = self.signal
+        thickness = np.array([[1.0, 100.0], [300.0, 3000.0]])
+        mask = np.array([[False, False], [False, True]])
+        intensities = s.get_lines_intensity()
+        kwargs = dict(
+            absorption_correction=True, thickness=thickness, navigation_mask=mask
+        )
+        res = s.quantification(intensities, method, factors, **kwargs)
+        lazy_intensities = []
+        for intensity in intensities:
+            intensity = intensity.as_lazy()
+            intensity.data = intensity.data.rechunk(1)
+            lazy_intensities.append(intensity)
+        res_lazy = s.quantification(lazy_intensities, method, factors, **kwargs)
+        for signals, signals_lazy in zip(res, res_lazy):
+            if not isinstance(signals, list):
+                signals, signals_lazy = [signals], [signals_lazy]
+            for signal, signal_lazy in zip(signals, signals_lazy):
+                assert signal_lazy._lazy
+                assert signal_lazy.data.chunks == ((1, 1), (1, 1))
+                np.testing.assert_allclose(signal_lazy.data.compute(), signal.data)
+
+    def test_quant_absorption_progressbar(self):
+        s = self.signal
+        intensities = s.get_lines_intensity()
+        with mock.patch("exspy.signals.eds_tem.progressbar") as progressbar:
+            s.quantification(
+                intensities,
+                "CL",
+                [1, 2.0],
+                absorption_correction=True,
+                thickness=100.0,
+                show_progressbar=True,
+            )
+        if intensities[0]._lazy:
+            progressbar.assert_not_called()
+        else:
+            progressbar.assert_called_once()
+            progressbar.return_value.__exit__.assert_called_once()
+
     def test_quant_zeta(self):
         s = self.signal
         method = "zeta"
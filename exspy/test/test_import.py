@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# Copyright 2007-2023 The exSpy developers
+#
+# This file is part of exSpy.
+#
+# exSpy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# exSpy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with exSpy. If not, see <https://www.gnu.org/licenses/#GPL>.
+
+import subprocess
+import sys
+
+import pytest
+
+# packages which should only be imported when signals, models or components
+# are used
+HEAVY_PACKAGES = ["dask", "h5py", "hyperspy", "matplotlib", "pooch"]
+
+
+def import_time(statement):
+    """
+    Run `statement` in a new interpreter with ``-X importtime``.
+
+    Returns
+    -------
+    dict
+        The self and cumulative import times in microseconds of each
+        imported module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, cumulative, module = line[len("import time:") :].split("|")
+        if self_time.strip().isdigit():
+            times[module.strip()] = (int(self_time), int(cumulative))
+    return times
+
+
+def run(statement):
+    """Run `statement` in a new interpreter and return its output."""
+    return subprocess.run(
+        [sys.executable, "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+def imported_packages(statement):
+    """Return the top-level packages imported by `statement`."""
+    statement += "; import sys; print(' '.join(sys.modules))"
+    modules = run(statement).splitlines()[-1].split()
+    return {module.split(".")[0] for module in modules}
+
+
+def test_import_exspy():
+    # the submodules are imported on first access
+    times = import_time("import exspy")
+    assert "exspy" in times
+    assert "exspy.signals" not in times
+
+
+@pytest.mark.benchmark
+def test_import_time_exspy():
+    # importing all the submodules took more than 3 s
+    times = import_time("import exspy")
+    _, cumulative = times["exspy"]
+    assert cumulative < 100000
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import exspy",
+        "import exspy; exspy.__version__",
+        "import exspy; exspy.material.weight_to_atomic([50, 50], ['Fe', 'Pt'])",
+        "import exspy; exspy.material.mass_absorption_mixture("
+        "[50, 50], ['Fe', 'Pt'], ['Fe_Ka', 'Pt_La'])",
+        "from exspy.misc.elements import elements; elements['Fe']",
+    ],
+)
+def test_imported_packages(statement):
+    assert not set(HEAVY_PACKAGES) & imported_packages(statement)
+
+
+def test_public_api():
+    import exspy
+
+    assert dir(exspy) == sorted(exspy.__all__)
+    for name in exspy.__all__:
+        assert getattr(exspy, name) is not None
+    assert exspy.material.weight_to_atomic is not None
+    assert exspy.signals.EDSTEMSpectrum is not None
+    with pytest.raises(AttributeError):
+        exspy.not_a_submodule
+
+
+def test_hyperspy_extension():
+    # hyperspy imports the signal classes from the modules given in
+    # hyperspy_extension.yaml
+    statement = (
+        "import hyperspy.api as hs; "
+        "s = hs.signals.Signal1D([0, 1]); "
+        "s.set_signal_type('EDS_TEM'); "
+        "print(type(s).__name__)"
+    )
+    assert run(statement).splitlines()[-1] == "EDSTEMSpectrum"
+
+
+def test_import_elements():
+    times = import_time("import exspy.misc.elements")
+    assert "exspy.misc.elements" in times
+    assert "hyperspy.misc.utils" not in times
+
+
+@pytest.mark.benchmark
+def test_import_time_elements():
+    # the database is not parsed when importing the module, which took
+    # ~50 ms without cached bytecode when it was a dictionary literal
+    times = import_time("import exspy.misc.elements")
+    self_time, _ = times["exspy.misc.elements"]
+    assert self_time < 20000
+
+
+def test_elements_loaded_on_first_access():
+    statement = (
+        "from exspy.misc import elements; "
+        "print(elements.elements._data is None); "
+        "print(elements.elements['Fe']['General_properties']['Z']); "
+        "print(elements.elements._data is None)"
+    )
+    assert run(statement).splitlines()[-3:] == ["True", "26", "False"]
+
+
+def test_elements_api():
+    from exspy.misc.elements import atomic_number2name, elements, elements_db
+
+    assert "Fe" in elements
+    assert "Xx" not in elements
+    assert len(elements) == len(list(elements.keys()))
+    assert elements_db.Fe.General_properties.Z == 26
+    assert atomic_number2name[26] == "Fe"
+    assert atomic_number2name[119] == "Uue"
@@ -101,6 +101,8 @@ setup(
         "": ["LICENSE", "README.md"],
         "exspy": [
             "data/*hspy",
+            "misc/*.json",
+            "misc/eds/*.npz",
             "test/drawing/data/*hspy",
             "test/signals/data/*hspy",
             "hyperspy_extension.yaml",